@@ -0,0 +1,416 @@
+"""
+채널 분석 (상관계수 행렬, FFT 교차상관, XY 산점도 2D 히스토그램, Welch PSD / STFT 스펙트로그램)
+
+선택한 채널들을 공통 등간격 시간 격자에 선형 보간으로 맞춘 뒤, 격자를 청크 단위로 나누어
+통계를 누적하므로 수백만 샘플 채널도 전체를 한 번에 보간하지 않고 처리합니다.
+결과는 원본 샘플 대신 작은 행렬/히스토그램/요청한 픽셀 크기의 격자로 반환합니다.
+"""
+
+import math
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from mdf_processor import ChannelArrays, estimate_sample_rate
+from metrics import span
+
+# 공통 격자의 최대 샘플 수 (넘으면 격자 샘플레이트를 낮춤)
+MAX_GRID_POINTS = 10_000_000
+# 한 번에 보간/누적하는 격자 샘플 수
+CHUNK_POINTS = 262_144
+# 교차상관 응답의 최대 지연 점 수 (넘으면 간격을 두고 반환, 피크는 전체에서 계산)
+MAX_LAG_POINTS = 2001
+MAX_HISTOGRAM_BINS = 512
+
+# 스펙트럼 분석 구간의 최대 샘플 수 (격자 샘플레이트를 낮추면 앨리어싱이 생기므로 대신 구간을 제한)
+MAX_SPECTRUM_POINTS = 200_000_000
+SPECTRUM_MODES = ('welch', 'stft')
+
+
+class AlignedGrid:
+    """공통 등간격 시간 격자 (t[i] = t0 + i * dt)"""
+
+    def __init__(self, t0: float, dt: float, count: int):
+        self.t0 = t0
+        self.dt = dt
+        self.count = count
+
+    @property
+    def sample_rate(self) -> float:
+        return 1.0 / self.dt
+
+    def times(self, start: int, stop: int) -> np.ndarray:
+        return self.t0 + np.arange(start, stop, dtype=np.float64) * self.dt
+
+    def chunks(self, chunk_points: int = CHUNK_POINTS) -> Iterator[Tuple[int, int]]:
+        for start in range(0, self.count, chunk_points):
+            yield start, min(start + chunk_points, self.count)
+
+
+class AlignedChannel:
+    """공통 격자에 맞출 채널 (타임스탬프 순으로 정렬된 float 변환 가능 배열)"""
+
+    def __init__(self, arrays: ChannelArrays):
+        self.name = arrays.name
+        self.unit = arrays.unit
+        self.timestamps = np.asarray(arrays.timestamps, dtype=np.float64)
+        self.samples = arrays.samples
+
+    def resample(self, times: np.ndarray) -> np.ndarray:
+        """격자 구간에 해당하는 원본 구간만 float64로 변환하여 선형 보간"""
+        first, last = np.searchsorted(self.timestamps, [times[0], times[-1]])
+        first = max(first - 1, 0)
+        last = min(last + 1, len(self.timestamps))
+        return np.interp(
+            times,
+            self.timestamps[first:last],
+            self.samples[first:last].astype(np.float64, copy=False)
+        )
+
+
+def usable_channels(channel_arrays: List[ChannelArrays]) -> Tuple[List[AlignedChannel], List[str]]:
+    """분석 가능한 1차원 숫자 채널과 제외된 채널명 목록"""
+    channels, skipped = [], []
+    for arrays in channel_arrays:
+        samples = arrays.samples
+        if (len(arrays.timestamps) < 2 or samples.ndim != 1 or len(samples) != len(arrays.timestamps)
+                or samples.dtype.kind not in 'biuf'):
+            skipped.append(arrays.name)
+            continue
+        channels.append(AlignedChannel(arrays))
+    return channels, skipped
+
+
+def common_grid(channels: List[AlignedChannel], sample_rate: Optional[float] = None,
+                t_start: Optional[float] = None, t_end: Optional[float] = None,
+                max_points: int = MAX_GRID_POINTS) -> AlignedGrid:
+    """모든 채널이 겹치는 시간 구간의 공통 격자
+
+    sample_rate를 지정하지 않으면 채널 중 가장 높은 샘플레이트를 사용합니다.
+    """
+    start = max(float(ch.timestamps[0]) for ch in channels)
+    end = min(float(ch.timestamps[-1]) for ch in channels)
+    if t_start is not None:
+        start = max(start, t_start)
+    if t_end is not None:
+        end = min(end, t_end)
+    if not end > start:
+        raise ValueError("선택한 채널들의 시간 구간이 겹치지 않습니다.")
+
+    if sample_rate is None:
+        rates = [estimate_sample_rate(ch.timestamps) for ch in channels]
+        sample_rate = max((rate for rate in rates if rate), default=1.0)
+    if sample_rate <= 0:
+        raise ValueError("sample_rate는 0보다 커야 합니다.")
+
+    # 격자 크기 제한 (초과하면 샘플레이트를 낮춤)
+    duration = end - start
+    intervals = duration * sample_rate
+    # 텍스트 타임스탬프의 반올림 오차로 마지막 샘플이 빠지지 않도록 정수 근처는 반올림
+    count = (round(intervals) if abs(intervals - round(intervals)) < 1e-3 else int(intervals)) + 1
+    if count > max_points:
+        count = max_points
+    dt = duration / (count - 1) if count > 1 else duration
+    return AlignedGrid(start, dt, count)
+
+
+class _Moments:
+    """청크별로 누적하는 평균/공분산/최솟값/최댓값"""
+
+    def __init__(self, size: int):
+        self.count = 0
+        self.shift: Optional[np.ndarray] = None
+        self.sums = np.zeros(size)
+        self.products = np.zeros((size, size))
+        self.minimum = np.full(size, np.inf)
+        self.maximum = np.full(size, -np.inf)
+
+    def add(self, block: np.ndarray):
+        # 큰 오프셋이 있는 신호의 정밀도 손실을 막기 위해 첫 청크 평균을 빼고 누적
+        if self.shift is None:
+            self.shift = block.mean(axis=0)
+        centered = block - self.shift
+        self.count += len(block)
+        self.sums += centered.sum(axis=0)
+        self.products += centered.T @ centered
+        np.minimum(self.minimum, block.min(axis=0), out=self.minimum)
+        np.maximum(self.maximum, block.max(axis=0), out=self.maximum)
+
+    @property
+    def mean(self) -> np.ndarray:
+        return self.shift + self.sums / self.count
+
+    @property
+    def covariance(self) -> np.ndarray:
+        mean = self.sums / self.count
+        return self.products / self.count - np.outer(mean, mean)
+
+    def correlation(self) -> np.ndarray:
+        covariance = self.covariance
+        std = np.sqrt(np.clip(np.diag(covariance), 0.0, None))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlation = covariance / np.outer(std, std)
+        # 상수 채널은 상관계수가 정의되지 않음 (NaN)
+        return np.clip(correlation, -1.0, 1.0)
+
+
+def _aligned_block(channels: List[AlignedChannel], grid: AlignedGrid, start: int, stop: int) -> np.ndarray:
+    times = grid.times(start, stop)
+    return np.column_stack([ch.resample(times) for ch in channels])
+
+
+def cross_correlation(channels: List[AlignedChannel], grid: AlignedGrid, moments: _Moments,
+                      reference: int, max_lag: int) -> np.ndarray:
+    """기준 채널과 각 채널의 정규화된 교차상관 (지연 -max_lag..max_lag 샘플)
+
+    격자를 구간으로 나누어 구간별 FFT 교차 스펙트럼을 누적한 뒤 한 번만 역변환합니다.
+    구간 경계를 넘는 샘플 쌍은 제외되며, 지연마다 실제 쌍 개수로 나누어 정규화합니다.
+    결과[i, k]는 채널 i가 기준 채널보다 (k - max_lag) 샘플 늦을 때의 상관계수입니다.
+    """
+    segment = max(CHUNK_POINTS, 4 * max_lag)
+    nfft = 1 << int(math.ceil(math.log2(segment + max_lag)))
+
+    mean = moments.mean
+    std = np.sqrt(np.clip(np.diag(moments.covariance), 0.0, None))
+    spectrum = np.zeros((len(channels), nfft // 2 + 1), dtype=np.complex128)
+    pairs = np.zeros(2 * max_lag + 1)
+    lags = np.arange(-max_lag, max_lag + 1)
+
+    for start, stop in grid.chunks(segment):
+        block = _aligned_block(channels, grid, start, stop) - mean
+        transformed = np.fft.rfft(block, n=nfft, axis=0)
+        spectrum += (np.conj(transformed[:, reference])[:, None] * transformed).T
+        pairs += np.clip((stop - start) - np.abs(lags), 0, None)
+
+    # 순환 상관의 음수 지연은 배열 끝에 위치
+    circular = np.fft.irfft(spectrum, n=nfft, axis=1)
+    values = np.concatenate([circular[:, nfft - max_lag:], circular[:, :max_lag + 1]], axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = values / np.where(pairs > 0, pairs, np.nan) / (std[:, None] * std[reference])
+    # 전체 구간 평균/표준편차로 정규화하므로 1을 약간 넘을 수 있음
+    return np.clip(values, -1.0, 1.0)
+
+
+def scatter_histogram(x: AlignedChannel, y: AlignedChannel, grid: AlignedGrid, bins: int,
+                      x_range: Tuple[float, float], y_range: Tuple[float, float]) -> np.ndarray:
+    """공통 격자에서 XY 산점도를 2D 히스토그램(샘플 수)으로 누적"""
+    counts = np.zeros((bins, bins), dtype=np.int64)
+    for start, stop in grid.chunks():
+        times = grid.times(start, stop)
+        chunk_counts, _, _ = np.histogram2d(x.resample(times), y.resample(times), bins=bins, range=[x_range, y_range])
+        counts += chunk_counts.astype(np.int64)
+    return counts
+
+
+def _nullable(values: np.ndarray) -> list:
+    """NaN/inf를 None으로 바꾼 JSON용 리스트"""
+    return np.where(np.isfinite(values), values, None).tolist()
+
+
+def _edges_range(minimum: float, maximum: float) -> Tuple[float, float]:
+    if maximum > minimum:
+        return minimum, maximum
+    # 상수 채널은 값 주변으로 폭을 잡음
+    return minimum - 0.5, maximum + 0.5
+
+
+def analyze_correlation(channel_arrays: List[ChannelArrays], sample_rate: Optional[float] = None,
+                        t_start: Optional[float] = None, t_end: Optional[float] = None,
+                        max_lag: float = 0.0, reference: Optional[str] = None,
+                        scatter_x: Optional[str] = None, scatter_y: Optional[str] = None,
+                        bins: int = 100) -> Dict:
+    """공통 격자 정렬 후 상관계수 행렬, 교차상관, XY 2D 히스토그램 계산
+
+    max_lag(초)가 0이면 교차상관을, scatter_x/scatter_y가 없으면 히스토그램을 생략합니다.
+    """
+    channels, skipped = usable_channels(channel_arrays)
+    if not channels:
+        raise ValueError("분석할 수 있는 숫자 채널이 없습니다.")
+    names = [ch.name for ch in channels]
+
+    for name in (reference, scatter_x, scatter_y):
+        if name is not None and name not in names:
+            raise ValueError(f"분석할 수 없는 채널입니다: {name}")
+
+    grid = common_grid(channels, sample_rate, t_start, t_end)
+
+    with span('analysis', 'correlation'):
+        moments = _Moments(len(channels))
+        for start, stop in grid.chunks():
+            moments.add(_aligned_block(channels, grid, start, stop))
+        correlation = moments.correlation()
+
+    result = {
+        "channels": [{"name": ch.name, "unit": ch.unit} for ch in channels],
+        "skipped_channels": skipped,
+        "grid": {"t0": grid.t0, "dt": grid.dt, "count": grid.count, "sample_rate": grid.sample_rate},
+        "mean": _nullable(moments.mean),
+        "std": _nullable(np.sqrt(np.clip(np.diag(moments.covariance), 0.0, None))),
+        "min": _nullable(moments.minimum),
+        "max": _nullable(moments.maximum),
+        "correlation": _nullable(correlation),
+        "cross_correlation": None,
+        "scatter": None,
+    }
+
+    lag_samples = min(int(round(max_lag / grid.dt)), grid.count - 1) if max_lag > 0 else 0
+    if lag_samples > 0:
+        reference_index = names.index(reference) if reference is not None else 0
+        with span('analysis', 'cross_correlation'):
+            values = cross_correlation(channels, grid, moments, reference_index, lag_samples)
+
+        lags = np.arange(-lag_samples, lag_samples + 1) * grid.dt
+        step = max(1, math.ceil(len(lags) / MAX_LAG_POINTS))
+        peaks = np.argmax(np.where(np.isfinite(values), np.abs(values), -1.0), axis=1)
+        peak_values = _nullable(values[np.arange(len(channels)), peaks])
+        result["cross_correlation"] = {
+            "reference": names[reference_index],
+            "lags": lags[::step].tolist(),
+            "channels": [
+                {
+                    "name": names[i],
+                    "values": _nullable(values[i, ::step]),
+                    "peak_lag": float(lags[peaks[i]]) if peak_values[i] is not None else None,
+                    "peak_value": peak_values[i],
+                }
+                for i in range(len(channels))
+            ],
+        }
+
+    if scatter_x is not None and scatter_y is not None:
+        bins = max(1, min(bins, MAX_HISTOGRAM_BINS))
+        xi, yi = names.index(scatter_x), names.index(scatter_y)
+        x_range = _edges_range(moments.minimum[xi], moments.maximum[xi])
+        y_range = _edges_range(moments.minimum[yi], moments.maximum[yi])
+        with span('analysis', 'scatter'):
+            counts = scatter_histogram(channels[xi], channels[yi], grid, bins, x_range, y_range)
+        result["scatter"] = {
+            "x": scatter_x,
+            "y": scatter_y,
+            "x_edges": np.linspace(*x_range, bins + 1).tolist(),
+            "y_edges": np.linspace(*y_range, bins + 1).tolist(),
+            # counts[i][j]: x가 i번째, y가 j번째 구간에 속한 격자 샘플 수
+            "counts": counts.tolist(),
+        }
+
+    return result
+
+
+def _frame_chunks(grid: AlignedGrid, nperseg: int, hop: int) -> Iterator[Tuple[int, int, int]]:
+    """프레임을 청크로 묶어 (첫 프레임 번호, 프레임 수, 첫 샘플 위치) 반환"""
+    frame_count = (grid.count - nperseg) // hop + 1
+    frames_per_chunk = max(1, (4 * CHUNK_POINTS) // nperseg)
+    for first in range(0, frame_count, frames_per_chunk):
+        yield first, min(frames_per_chunk, frame_count - first), first * hop
+
+
+def _frame_power(channel: AlignedChannel, grid: AlignedGrid, window: np.ndarray,
+                 hop: int, frames: int, offset: int) -> np.ndarray:
+    """연속된 프레임들의 한쪽 파워 스펙트럼 |X|^2 (프레임별 평균 제거 후 창 함수 적용)"""
+    nperseg = len(window)
+    samples = channel.resample(grid.times(offset, offset + (frames - 1) * hop + nperseg))
+    segments = np.lib.stride_tricks.sliding_window_view(samples, nperseg)[::hop]
+    segments = (segments - segments.mean(axis=1, keepdims=True)) * window
+    spectrum = np.fft.rfft(segments, axis=1)
+    return spectrum.real ** 2 + spectrum.imag ** 2
+
+
+def _density_scale(window: np.ndarray, sample_rate: float) -> np.ndarray:
+    """|X|^2를 한쪽 파워 스펙트럼 밀도(단위^2/Hz)로 바꾸는 주파수별 배율"""
+    nperseg = len(window)
+    scale = np.full(nperseg // 2 + 1, 2.0 / (sample_rate * float(np.sum(window ** 2))))
+    # DC와 (짝수 길이일 때) 나이퀴스트 성분은 한쪽으로 접지 않음
+    scale[0] /= 2.0
+    if nperseg % 2 == 0:
+        scale[-1] /= 2.0
+    return scale
+
+
+def _bin_groups(count: int, target: int) -> np.ndarray:
+    """count개 구간을 최대 target개 그룹으로 나눈 시작 인덱스"""
+    target = max(1, min(target, count))
+    return np.unique(np.linspace(0, count, target + 1).astype(np.int64)[:-1])
+
+
+def _group_centers(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """그룹으로 묶인 값들의 중심 (첫 값과 마지막 값의 중간)"""
+    ends = np.append(groups[1:], len(values)) - 1
+    return (values[groups] + values[ends]) / 2.0
+
+
+def _to_decibel(power: np.ndarray) -> np.ndarray:
+    with np.errstate(divide='ignore'):
+        return 10.0 * np.log10(power)
+
+
+def analyze_spectrum(arrays: ChannelArrays, mode: str = 'welch', t_start: Optional[float] = None,
+                     t_end: Optional[float] = None, nperseg: int = 4096, overlap: float = 0.5,
+                     width: int = 1024, height: int = 256, decibel: bool = True) -> Dict:
+    """Welch PSD 또는 STFT 스펙트로그램 계산 (Hann 창)
+
+    프레임을 청크 단위로 FFT하면서 누적하므로 구간 길이와 무관하게 메모리 사용량이 일정합니다.
+    welch: 주파수 축을 width개 점으로 줄인 평균 PSD (각 점은 묶인 주파수 구간의 최댓값이라 피크 유지)
+    stft: height(주파수) x width(시간) 격자 (시간은 프레임 평균, 주파수는 구간 최댓값)
+    """
+    if mode not in SPECTRUM_MODES:
+        raise ValueError(f"지원되지 않는 스펙트럼 모드입니다: {mode} ({', '.join(SPECTRUM_MODES)})")
+
+    channels, _ = usable_channels([arrays])
+    if not channels:
+        raise ValueError(f"스펙트럼을 계산할 수 없는 채널입니다: {arrays.name}")
+    channel = channels[0]
+
+    grid = common_grid(channels, None, t_start, t_end, max_points=MAX_SPECTRUM_POINTS + 1)
+    if grid.count > MAX_SPECTRUM_POINTS:
+        raise ValueError("분석 구간이 너무 깁니다. t_start/t_end로 구간을 줄여 주세요.")
+    if grid.count < nperseg:
+        raise ValueError(f"분석 구간의 샘플 수({grid.count})가 nperseg({nperseg})보다 적습니다.")
+
+    window = np.hanning(nperseg + 1)[:-1]  # 주기적 Hann 창
+    hop = max(1, int(round(nperseg * (1.0 - overlap))))
+    scale = _density_scale(window, grid.sample_rate)
+    freqs = np.fft.rfftfreq(nperseg, grid.dt)
+    freq_groups = _bin_groups(len(freqs), height if mode == 'stft' else width)
+    frame_count = (grid.count - nperseg) // hop + 1
+
+    result = {
+        "name": channel.name,
+        "unit": channel.unit,
+        "mode": mode,
+        "sample_rate": grid.sample_rate,
+        "t0": grid.t0,
+        "t1": grid.t0 + (grid.count - 1) * grid.dt,
+        "nperseg": nperseg,
+        "hop": hop,
+        "window": "hann",
+        "segments": frame_count,
+        "frequency_resolution": float(freqs[1]),
+        "freqs": _group_centers(freqs, freq_groups).tolist(),
+        "scale": "dB" if decibel else "linear",
+    }
+
+    if mode == 'welch':
+        with span('analysis', 'welch'):
+            total = np.zeros(len(freqs))
+            for _, frames, offset in _frame_chunks(grid, nperseg, hop):
+                total += _frame_power(channel, grid, window, hop, frames, offset).sum(axis=0)
+            psd = np.maximum.reduceat(total / frame_count * scale, freq_groups)
+        result["psd"] = _nullable(_to_decibel(psd) if decibel else psd)
+        return result
+
+    # STFT: 프레임을 시간 픽셀 열에 배정하여 평균
+    time_groups = _bin_groups(frame_count, width)
+    column_of_frame = np.searchsorted(time_groups, np.arange(frame_count), side='right') - 1
+    with span('analysis', 'stft'):
+        sums = np.zeros((len(time_groups), len(freq_groups)))
+        for first, frames, offset in _frame_chunks(grid, nperseg, hop):
+            power = _frame_power(channel, grid, window, hop, frames, offset) * scale
+            np.add.at(sums, column_of_frame[first:first + frames], np.maximum.reduceat(power, freq_groups, axis=1))
+        image = sums / np.bincount(column_of_frame, minlength=len(time_groups))[:, None]
+
+    # 각 열의 중심 시각 (프레임 중심 기준)
+    frame_centers = grid.t0 + (np.arange(frame_count) * hop + nperseg / 2.0) * grid.dt
+    result["times"] = _group_centers(frame_centers, time_groups).tolist()
+    # values[i][j]: i번째 주파수 행, j번째 시간 열
+    result["values"] = _nullable((_to_decibel(image) if decibel else image).T)
+    return result
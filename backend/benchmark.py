@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+MDF/CSV File Viewer 성능 벤치마크
+
+합성 MF4/CSV 파일을 생성한 뒤 FileProcessor와 FastAPI 엔드포인트(업로드, 채널 목록,
+데이터 조회, CSV 내보내기)를 프로세스 내 TestClient로 측정하여 JSON 리포트로 저장합니다.
+
+사용 예:
+    python benchmark.py --channels 50 --duration 600 --rates 1000,100,10 --output bench.json
+    python benchmark.py --compare baseline.json --output bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+def peak_rss_mb() -> float:
+    """프로세스 시작 이후의 최대 RSS (MB, 앞 단계의 최대값이 이어지므로 단계별 값이 아님)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def channel_layout(channel_count: int, rates: List[float]) -> List[Dict[str, Any]]:
+    """채널을 샘플레이트별 그룹에 고르게 배분"""
+    layout = []
+    for index in range(channel_count):
+        rate = rates[index % len(rates)]
+        layout.append({'name': f"SIG_{int(rate)}HZ_{index:04d}", 'rate': rate, 'seed': index})
+    return layout
+
+
+def synthetic_samples(seed: int, timestamps: np.ndarray) -> np.ndarray:
+    """사인파 + 노이즈 형태의 합성 신호"""
+    rng = np.random.default_rng(seed)
+    frequency = rng.uniform(0.1, 5.0)
+    amplitude = rng.uniform(1.0, 100.0)
+    noise = rng.normal(0.0, amplitude * 0.05, len(timestamps))
+    return amplitude * np.sin(2 * np.pi * frequency * timestamps) + noise
+
+
+def generate_mf4(path: str, channel_count: int, rates: List[float], duration: float) -> Dict[str, Any]:
+    """샘플레이트별 채널 그룹을 가진 합성 MF4 파일 생성 (asammdf 필요)"""
+    from asammdf import MDF, Signal  # type: ignore
+
+    layout = channel_layout(channel_count, rates)
+    mdf = MDF(version='4.10')
+    total_samples = 0
+
+    for rate in rates:
+        timestamps = np.arange(0, duration, 1.0 / rate)
+        signals = [
+            Signal(synthetic_samples(ch['seed'], timestamps).astype(np.float32), timestamps, name=ch['name'], unit='V')
+            for ch in layout if ch['rate'] == rate
+        ]
+        if signals:
+            mdf.append(signals, comment=f"{rate} Hz raster")
+            total_samples += len(timestamps) * len(signals)
+
+    mdf.save(path, overwrite=True)
+    mdf.close()
+
+    return {'format': 'mf4', 'channels': layout, 'samples': total_samples}
+
+
+def generate_csv(path: str, channel_count: int, rate: float, duration: float) -> Dict[str, Any]:
+    """단일 샘플레이트 합성 CSV 파일 생성 (첫 컬럼이 시간축)"""
+    layout = channel_layout(channel_count, [rate])
+    timestamps = np.arange(0, duration, 1.0 / rate)
+
+    columns = [timestamps] + [synthetic_samples(ch['seed'], timestamps) for ch in layout]
+    header = ','.join(['time'] + [f"{ch['name']} (V)" for ch in layout])
+    np.savetxt(path, np.column_stack(columns), delimiter=',', header=header, comments='', fmt='%.6f')
+
+    return {'format': 'csv', 'channels': layout, 'samples': len(timestamps) * channel_count}
+
+
+def traced_peak_mb(func: Callable[[], Any]) -> Tuple[float, Any]:
+    """func 한 번 실행 중 새로 할당된 메모리의 최대값 (MB, tracemalloc 기준이라 numpy 배열 포함)"""
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / (1024 * 1024), result
+
+
+def measure(name: str, func: Callable[[], Any], repeat: int, size_of: Optional[Callable[[Any], int]] = None,
+            cleanup: Optional[Callable[[Any], None]] = None,
+            before: Optional[Callable[[], None]] = None) -> Tuple[Dict[str, Any], Any]:
+    """func를 repeat번 실행하여 지연 시간, 처리량, 메모리 측정 (결과 항목과 마지막 반환값)
+
+    before가 있으면 매 실행 전에 측정 구간 밖에서 호출합니다 (캐시 비우기 등).
+    cleanup이 있으면 마지막 반환값을 제외한 결과(업로드 세션 등)를 측정 구간 밖에서 정리합니다.
+    단계별 메모리는 tracemalloc 오버헤드가 지연 시간에 섞이지 않도록 측정 후 한 번 더 실행하여 구합니다.
+    """
+    latencies = []
+    size = 0
+    result = None
+
+    for iteration in range(repeat):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        result = func()
+        latencies.append(time.perf_counter() - start)
+        if size_of is not None:
+            size = size_of(result)
+        if cleanup is not None and iteration < repeat - 1:
+            cleanup(result)
+
+    if before is not None:
+        before()
+    traced_peak, traced_result = traced_peak_mb(func)
+    if cleanup is not None:
+        cleanup(traced_result)
+
+    median = statistics.median(latencies)
+    entry = {
+        'phase': name,
+        'repeat': repeat,
+        'latency_ms': {
+            'min': round(min(latencies) * 1000, 3),
+            'median': round(median * 1000, 3),
+            'mean': round(statistics.mean(latencies) * 1000, 3),
+            'max': round(max(latencies) * 1000, 3),
+        },
+        'traced_peak_mb': round(traced_peak, 1),
+        'process_peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+    if size:
+        entry['bytes'] = size
+        entry['throughput_mb_s'] = round(size / (1024 * 1024) / median, 3) if median > 0 else None
+
+    print(
+        f"  {name:<32} median {entry['latency_ms']['median']:>10.1f} ms   "
+        f"peak alloc {entry['traced_peak_mb']:>8.1f} MB   process peak RSS {entry['process_peak_rss_mb']:>8.1f} MB"
+    )
+    return entry, result
+
+
+def _response_size(response) -> int:
+    """응답 본문 크기 (압축 해제 후)"""
+    response.raise_for_status()
+    return len(response.content)
+
+
+def bench_file(client, processor, path: str, info: Dict[str, Any], repeat: int, max_channels: int,
+               storage_dir: str) -> List[Dict[str, Any]]:
+    """파일 하나에 대해 FileProcessor와 API 단계별 측정
+
+    채널 목록은 세션당 한 번 만든 카탈로그를 재사용하므로, 매번 카탈로그를 새로 만드는 cold와
+    캐시된 카탈로그를 쓰는 warm을 따로 측정합니다.
+    """
+    from channel_catalog import forget_catalog
+
+    results = []
+    filename = os.path.basename(path)
+    selected = [ch['name'] for ch in info['channels'][:max_channels]]
+    file_size = os.path.getsize(path)
+
+    # FileProcessor 직접 호출 (업로드와 같이 CSV 사이드카를 먼저 만들어 mmap 경로를 측정)
+    entry, _ = measure('processor.prepare_file', lambda: processor.prepare_file(path), repeat)
+    results.append(entry)
+    entry, _ = measure('processor.process_file', lambda: processor.process_file(path), repeat)
+    results.append(entry)
+    entry, _ = measure(
+        'processor.get_channels.cold', lambda: processor.get_channels(path), repeat,
+        before=lambda: forget_catalog(path)
+    )
+    results.append(entry)
+    entry, _ = measure('processor.get_channels.warm', lambda: processor.get_channels(path), repeat)
+    results.append(entry)
+    entry, _ = measure('processor.get_channel_data', lambda: processor.get_channel_data(path, selected), repeat)
+    results.append(entry)
+
+    # API (프로세스 내 TestClient)
+    def upload():
+        with open(path, 'rb') as f:
+            response = client.post('/api/upload', files={'file': (filename, f)})
+        response.raise_for_status()
+        return response
+
+    def delete_session(response):
+        client.delete(f"/api/session/{response.json()['session_id']}")
+
+    # 마지막 업로드 세션만 남겨 이후 단계에서 사용 (나머지는 디스크 한도에 쌓이지 않도록 바로 삭제)
+    entry, response = measure('api.upload', upload, repeat, cleanup=delete_session)
+    entry['bytes'] = file_size
+    entry['throughput_mb_s'] = round(file_size / (1024 * 1024) / (entry['latency_ms']['median'] / 1000), 3)
+    results.append(entry)
+    session_id = response.json()['session_id']
+
+    session_path = os.path.join(storage_dir, session_id)
+    entry, _ = measure(
+        'api.channels.cold', lambda: client.get(f'/api/channels/{session_id}'), repeat, _response_size,
+        before=lambda: forget_catalog(session_path)
+    )
+    results.append(entry)
+    entry, _ = measure('api.channels.warm', lambda: client.get(f'/api/channels/{session_id}'), repeat, _response_size)
+    results.append(entry)
+    entry, _ = measure('api.data.json', lambda: client.post(f'/api/data/{session_id}', json=selected), repeat, _response_size)
+    results.append(entry)
+    entry, _ = measure(
+        'api.data.typed',
+        lambda: client.post(f'/api/data/{session_id}', params={'transport': 'typed'}, json=selected),
+        repeat, _response_size
+    )
+    results.append(entry)
+    entry, _ = measure('api.export.csv', lambda: client.post(f'/api/export/csv/{session_id}', json=selected), repeat, _response_size)
+    results.append(entry)
+
+    client.delete(f'/api/session/{session_id}')
+
+    for entry in results:
+        entry['file'] = info['format']
+    return results
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any]):
+    """두 리포트의 단계별 중앙 지연 시간 비교 출력"""
+    base = {(r['file'], r['phase']): r for r in baseline.get('results', [])}
+
+    print("\n📊 기준 리포트 대비 중앙 지연 시간 변화")
+    for result in current.get('results', []):
+        key = (result['file'], result['phase'])
+        if key not in base:
+            continue
+        before = base[key]['latency_ms']['median']
+        after = result['latency_ms']['median']
+        change = (after - before) / before * 100 if before > 0 else 0.0
+        marker = '🔺' if change > 10 else ('🔻' if change < -10 else '  ')
+        print(f"  {marker} {key[0]:<4} {key[1]:<32} {before:>10.1f} → {after:>10.1f} ms ({change:+.1f}%)")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="MDF/CSV File Viewer 벤치마크")
+    parser.add_argument('--channels', type=int, default=20, help="생성할 채널 수")
+    parser.add_argument('--duration', type=float, default=60.0, help="측정 시간 길이 (초)")
+    parser.add_argument('--rates', default='100,10', help="MF4 채널 그룹 샘플레이트 목록 (Hz, 쉼표 구분)")
+    parser.add_argument('--csv-rate', type=float, default=100.0, help="CSV 샘플레이트 (Hz)")
+    parser.add_argument('--formats', default='mf4,csv', help="측정할 파일 형식 (mf4, csv)")
+    parser.add_argument('--repeat', type=int, default=3, help="단계별 반복 횟수")
+    parser.add_argument('--max-channels', type=int, default=20, help="데이터 조회/내보내기에 사용할 채널 수 (최대 20)")
+    parser.add_argument('--output', default=None, help="JSON 리포트 저장 경로")
+    parser.add_argument('--compare', default=None, help="비교할 기준 JSON 리포트")
+    parser.add_argument('--workdir', default=None, help="합성 파일 생성 디렉터리 (기본: 임시 디렉터리)")
+    args = parser.parse_args()
+
+    # 실행 중인 서버의 세션 저장소(디스크 한도, LRU 상태)에 영향을 주지 않도록 임시 저장소 사용
+    storage_dir = tempfile.mkdtemp(prefix='mdf_bench_sessions_')
+    os.environ['MDF_VIEWER_STORAGE_DIR'] = storage_dir
+
+    # backend 디렉터리 기준으로 앱 모듈 로드
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from fastapi.testclient import TestClient
+    import main as app_module
+
+    rates = [float(rate) for rate in args.rates.split(',') if rate.strip()]
+    formats = [fmt.strip().lower() for fmt in args.formats.split(',') if fmt.strip()]
+    max_channels = min(args.max_channels, 20)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix='mdf_bench_')
+    os.makedirs(workdir, exist_ok=True)
+
+    try:
+        client = TestClient(app_module.app)
+        processor = app_module.file_processor
+
+        report = {
+            'meta': {
+                'created_at': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'numpy': np.__version__,
+                'config': vars(args),
+            },
+            'files': [],
+            'results': [],
+        }
+
+        for fmt in formats:
+            print(f"\n🔧 합성 {fmt.upper()} 파일 생성 중...")
+            path = os.path.join(workdir, f"bench_{args.channels}ch_{int(args.duration)}s.{fmt}")
+            start = time.perf_counter()
+
+            if fmt == 'mf4':
+                try:
+                    info = generate_mf4(path, args.channels, rates, args.duration)
+                except ImportError:
+                    print("⚠️  asammdf가 없어 MF4 벤치마크를 건너뜁니다.")
+                    continue
+            elif fmt == 'csv':
+                info = generate_csv(path, args.channels, args.csv_rate, args.duration)
+            else:
+                print(f"⚠️  지원되지 않는 형식: {fmt}")
+                continue
+
+            report['files'].append({
+                'format': fmt,
+                'path': path,
+                'size_bytes': os.path.getsize(path),
+                'channels': args.channels,
+                'samples': info['samples'],
+                'generate_s': round(time.perf_counter() - start, 3),
+            })
+            print(f"  {path} ({os.path.getsize(path) / (1024 * 1024):.1f} MB, {info['samples']:,} samples)")
+
+            print(f"⏱️  {fmt.upper()} 측정 중...")
+            report['results'].extend(bench_file(client, processor, path, info, args.repeat, max_channels, app_module.sessions.storage_dir))
+
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+            print(f"\n✅ 리포트 저장: {args.output}")
+
+        if args.compare:
+            with open(args.compare, 'r', encoding='utf-8') as f:
+                compare_reports(json.load(f), report)
+    finally:
+        if args.workdir is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+        shutil.rmtree(storage_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
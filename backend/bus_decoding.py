@@ -0,0 +1,94 @@
+"""
+버스 로깅(CAN/LIN) 원시 프레임 디코딩
+
+MF4에 CAN_DataFrame/LIN_Frame 형태로 기록된 원시 프레임을 DBC/ARXML/LDF 데이터베이스로
+디코딩하여 업로드 파일 옆의 "<파일 경로>.bus.mf4"에 저장합니다. 디코딩은 asammdf의
+extract_bus_logging을 사용하며, 메시지 ID별로 프레임을 묶어 페이로드 배열에서 신호 비트를
+벡터 연산으로 잘라냅니다. 디코딩 결과는 세션 파생 파일이므로 디스크 한도에 포함되고
+세션과 함께 삭제됩니다.
+"""
+
+import os
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+from lazy_import import LazyModule, has_module
+from metrics import span
+
+asammdf = LazyModule('asammdf')
+
+HAS_ASAMMDF = has_module('asammdf')
+# extract_bus_logging이 데이터베이스를 읽을 때 사용
+HAS_CANMATRIX = has_module('canmatrix')
+
+BUS_TYPES = ('CAN', 'LIN')
+DATABASE_EXTENSIONS = ('.dbc', '.arxml', '.ldf')
+DECODED_SUFFIX = '.bus.mf4'
+
+
+def decoded_path(file_path: str) -> str:
+    """디코딩된 신호를 저장하는 파일 경로"""
+    return file_path + DECODED_SUFFIX
+
+
+def database_path(file_path: str, index: int, extension: str) -> str:
+    """업로드된 데이터베이스 파일 저장 경로 (세션 파생 파일)"""
+    return f"{file_path}.bus-db{index}{extension}"
+
+
+def has_decoded(file_path: str) -> bool:
+    return os.path.exists(decoded_path(file_path))
+
+
+def decoded_version(file_path: str) -> Optional[int]:
+    """디코딩 결과의 수정 시각 (ETag 구분용, 없으면 None)"""
+    try:
+        return os.stat(decoded_path(file_path)).st_mtime_ns
+    except OSError:
+        return None
+
+
+def missing_dependency() -> Optional[str]:
+    """디코딩에 필요한 패키지가 없으면 패키지 이름 반환"""
+    if not HAS_ASAMMDF:
+        return 'asammdf'
+    if not HAS_CANMATRIX:
+        return 'canmatrix'
+    return None
+
+
+def decode_bus_logging(file_path: str, databases: List[Tuple[str, int]], bus_type: str = 'CAN') -> Dict:
+    """데이터베이스로 원시 버스 프레임을 디코딩하여 "<파일 경로>.bus.mf4"에 저장
+
+    databases는 (데이터베이스 파일 경로, 버스 채널) 목록이며 버스 채널 0은 모든 채널에 적용됩니다.
+    다시 호출하면 이전 디코딩 결과를 새 결과로 바꿉니다.
+    """
+    if bus_type not in BUS_TYPES:
+        raise ValueError(f"지원되지 않는 버스 종류입니다: {bus_type} ({', '.join(BUS_TYPES)})")
+
+    with span('file_open', 'mdf'):
+        mdf = asammdf.MDF(file_path)
+
+    with mdf:
+        with span('bus_decode', bus_type.lower()):
+            decoded = mdf.extract_bus_logging(database_files={bus_type: databases})
+
+    try:
+        # 첫 번째 채널은 마스터(시간) 채널
+        messages = [group for group in decoded.groups if len(group.channels) > 1]
+        signal_count = sum(len(group.channels) - 1 for group in messages)
+        if signal_count == 0:
+            raise ValueError("데이터베이스와 일치하는 버스 프레임이 없습니다.")
+
+        # 다른 워커가 쓰는 중인 파일을 읽지 않도록 임시 파일에 저장 후 교체
+        target = decoded_path(file_path)
+        staging = decoded.save(f"{file_path}.bus-{uuid.uuid4().hex}.mf4", overwrite=True)
+        os.replace(staging, target)
+    finally:
+        decoded.close()
+
+    return {
+        "bus_type": bus_type,
+        "messages": len(messages),
+        "signals": signal_count,
+    }
@@ -0,0 +1,222 @@
+import json
+import math
+import os
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from models import ChannelInfo
+
+# 채널 데이터 위치: 원본 파일 / 버스 로깅 디코딩 결과 파일
+SOURCE_FILE = 0
+SOURCE_BUS = 1
+
+
+class StringTable:
+    """중복 문자열을 한 번만 저장하는 문자열 테이블 (채널명/단위/설명/dtype 공용)"""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def intern(self, value: Optional[str]) -> int:
+        value = value or ""
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            self._ids[value] = string_id
+            self.strings.append(value)
+        return string_id
+
+
+class CatalogBuilder:
+    """채널을 하나씩 추가하여 ChannelCatalog를 만드는 빌더"""
+
+    def __init__(self):
+        self.table = StringTable()
+        self._names: List[int] = []
+        self._units: List[int] = []
+        self._descriptions: List[int] = []
+        self._data_types: List[int] = []
+        self._sources: List[int] = []
+        self._groups: List[int] = []
+        self._indices: List[int] = []
+        self._sample_counts: List[int] = []
+        self._minimums: List[float] = []
+        self._maximums: List[float] = []
+
+    def add(self, name: str, unit: str = "", description: str = "", sample_count: int = 0,
+            data_type: str = "float64", min_value: Optional[float] = None, max_value: Optional[float] = None,
+            group: int = -1, index: int = -1, source: int = SOURCE_FILE):
+        self._names.append(self.table.intern(name))
+        self._units.append(self.table.intern(unit))
+        self._descriptions.append(self.table.intern(description))
+        self._data_types.append(self.table.intern(data_type))
+        self._sources.append(source)
+        self._groups.append(group)
+        self._indices.append(index)
+        self._sample_counts.append(sample_count)
+        self._minimums.append(np.nan if min_value is None else min_value)
+        self._maximums.append(np.nan if max_value is None else max_value)
+
+    def build(self, sort: bool = True) -> 'ChannelCatalog':
+        """카탈로그 생성 (sort가 True면 채널명 순, False면 추가한 순서 유지)"""
+        strings = self.table.strings
+        if sort:
+            order = np.array(sorted(range(len(self._names)), key=lambda i: strings[self._names[i]]), dtype=np.int64)
+        else:
+            order = np.arange(len(self._names), dtype=np.int64)
+        return ChannelCatalog(
+            strings=strings,
+            names=np.array(self._names, dtype=np.int32)[order],
+            units=np.array(self._units, dtype=np.int32)[order],
+            descriptions=np.array(self._descriptions, dtype=np.int32)[order],
+            data_types=np.array(self._data_types, dtype=np.int32)[order],
+            sources=np.array(self._sources, dtype=np.int8)[order],
+            groups=np.array(self._groups, dtype=np.int32)[order],
+            indices=np.array(self._indices, dtype=np.int32)[order],
+            sample_counts=np.array(self._sample_counts, dtype=np.int64)[order],
+            minimums=np.array(self._minimums, dtype=np.float64)[order],
+            maximums=np.array(self._maximums, dtype=np.float64)[order],
+        )
+
+
+def _json_number(value: float) -> str:
+    """JSON 숫자 표현 (NaN/inf는 null)"""
+    return repr(value) if math.isfinite(value) else 'null'
+
+
+class ChannelCatalog:
+    """채널 목록의 컬럼형 표현
+
+    채널마다 ChannelInfo 객체를 만드는 대신 필드별 numpy 배열과 문자열 테이블 ID로 저장하므로,
+    수만 개 채널의 버스 로깅 파일도 적은 메모리로 보관하고 응답 JSON을 바로 만들 수 있습니다.
+    source/group/index는 MDF 채널 위치이며 (group이 -1이면 위치 정보 없음), min/max가 없으면 NaN입니다.
+    """
+
+    def __init__(self, strings: List[str], names: np.ndarray, units: np.ndarray, descriptions: np.ndarray,
+                 data_types: np.ndarray, sources: np.ndarray, groups: np.ndarray, indices: np.ndarray,
+                 sample_counts: np.ndarray, minimums: np.ndarray, maximums: np.ndarray):
+        self.strings = strings
+        self.names = names
+        self.units = units
+        self.descriptions = descriptions
+        self.data_types = data_types
+        self.sources = sources
+        self.groups = groups
+        self.indices = indices
+        self.sample_counts = sample_counts
+        self.minimums = minimums
+        self.maximums = maximums
+        self._positions: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_channel_infos(cls, channels: Iterable[ChannelInfo]) -> 'ChannelCatalog':
+        """ChannelInfo 목록으로 생성 (순서 유지)"""
+        builder = CatalogBuilder()
+        for channel in channels:
+            builder.add(
+                channel.name, channel.unit, channel.description or "", channel.sample_count,
+                channel.data_type, channel.min_value, channel.max_value
+            )
+        return builder.build(sort=False)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def locate(self, name: str) -> Optional[Tuple[int, int, int]]:
+        """표시용 채널명의 (source, 그룹, 인덱스) 위치 (없으면 None)"""
+        if self._positions is None:
+            self._positions = {self.strings[string_id]: position for position, string_id in enumerate(self.names.tolist())}
+        position = self._positions.get(name)
+        if position is None or self.groups[position] < 0:
+            return None
+        return int(self.sources[position]), int(self.groups[position]), int(self.indices[position])
+
+    def to_channel_infos(self) -> List[ChannelInfo]:
+        """기존 API 호환용 ChannelInfo 목록"""
+        strings = self.strings
+        return [
+            ChannelInfo(
+                name=strings[name], unit=strings[unit], description=strings[description],
+                sample_count=sample_count, data_type=strings[data_type],
+                min_value=minimum if math.isfinite(minimum) else None,
+                max_value=maximum if math.isfinite(maximum) else None
+            )
+            for name, unit, description, data_type, sample_count, minimum, maximum in zip(
+                self.names.tolist(), self.units.tolist(), self.descriptions.tolist(), self.data_types.tolist(),
+                self.sample_counts.tolist(), self.minimums.tolist(), self.maximums.tolist()
+            )
+        ]
+
+    def channels_json(self) -> str:
+        """ChannelInfo.dict() 목록과 같은 모양의 JSON 배열 (모델 객체를 만들지 않음)"""
+        # 문자열은 테이블 항목마다 한 번만 인코딩
+        encoded = [json.dumps(value, ensure_ascii=False) for value in self.strings]
+        rows = [
+            '{"name":%s,"unit":%s,"description":%s,"sample_count":%d,"data_type":%s,'
+            '"min_value":%s,"max_value":%s,"conversion_rule":null}' % (
+                encoded[name], encoded[unit], encoded[description], sample_count, encoded[data_type],
+                _json_number(minimum), _json_number(maximum)
+            )
+            for name, unit, description, data_type, sample_count, minimum, maximum in zip(
+                self.names.tolist(), self.units.tolist(), self.descriptions.tolist(), self.data_types.tolist(),
+                self.sample_counts.tolist(), self.minimums.tolist(), self.maximums.tolist()
+            )
+        ]
+        return '[' + ','.join(rows) + ']'
+
+
+# 프로세스 내 캐시: 파일 경로 -> (파일 상태, 관련 파일 목록, ChannelCatalog)
+_catalogs: Dict[str, Tuple[tuple, Tuple[str, ...], ChannelCatalog]] = {}
+_lock = threading.Lock()
+
+
+def _file_key(file_path: str, related: Tuple[str, ...] = ()) -> tuple:
+    """원본과 관련 파일(디코딩 결과 등)의 (크기, 수정 시각), 관련 파일이 없으면 None"""
+    stat = os.stat(file_path)
+    key = [(stat.st_size, stat.st_mtime_ns)]
+    for path in related:
+        try:
+            related_stat = os.stat(path)
+            key.append((related_stat.st_size, related_stat.st_mtime_ns))
+        except OSError:
+            key.append(None)
+    return tuple(key)
+
+
+def cached_catalog(file_path: str, build: Callable[[], ChannelCatalog], related: Iterable[str] = ()) -> ChannelCatalog:
+    """파일이 바뀌지 않았으면 캐시된 카탈로그를, 아니면 새로 만들어 반환 (세션당 한 번 생성)
+
+    related의 파일이 생기거나 바뀌어도 다시 만듭니다.
+    """
+    related = tuple(related)
+    key = _file_key(file_path, related)
+    with _lock:
+        cached = _catalogs.get(file_path)
+    if cached and cached[0] == key and cached[1] == related:
+        return cached[2]
+
+    catalog = build()
+    with _lock:
+        _catalogs[file_path] = (key, related, catalog)
+    return catalog
+
+
+def peek_catalog(file_path: str) -> Optional[ChannelCatalog]:
+    """이미 만들어진 카탈로그만 반환 (없거나 파일이 바뀌었으면 None)"""
+    with _lock:
+        cached = _catalogs.get(file_path)
+    if cached is None:
+        return None
+    try:
+        return cached[2] if cached[0] == _file_key(file_path, cached[1]) else None
+    except OSError:
+        return None
+
+
+def forget_catalog(file_path: str):
+    """세션 정리 시 카탈로그 캐시 제거"""
+    with _lock:
+        _catalogs.pop(file_path, None)
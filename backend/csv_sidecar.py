@@ -0,0 +1,172 @@
+import json
+import os
+import shutil
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from lazy_import import LazyModule
+from metrics import span
+
+pd = LazyModule('pandas')
+
+# 업로드 CSV 옆에 만드는 컬럼 파일 디렉터리 ("<파일 경로>.cols", 세션 삭제 시 함께 정리됨)
+SIDECAR_SUFFIX = '.cols'
+SIDECAR_VERSION = 1
+HEADER_FILE = 'header.json'
+
+# 프로세스 내 캐시: CSV 경로 -> CSVSidecar
+_open_sidecars: Dict[str, 'CSVSidecar'] = {}
+_lock = threading.Lock()
+
+
+def sidecar_path(file_path: str) -> str:
+    return file_path + SIDECAR_SUFFIX
+
+
+def _source_key(file_path: str) -> Tuple[int, int]:
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def build_sidecar(file_path: str) -> 'CSVSidecar':
+    """CSV를 한 번 파싱하여 컬럼별 .npy 파일과 헤더 인덱스(header.json) 생성
+
+    값은 기존 CSV 경로와 같게 정리합니다 (결측값 0, 문자열 컬럼은 숫자로 변환).
+    """
+    target = sidecar_path(file_path)
+    staging = f"{target}.tmp-{os.getpid()}-{threading.get_ident()}"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+
+    try:
+        with span('file_open', 'csv'):
+            df = pd.read_csv(file_path)
+
+        columns = []
+        for index, column in enumerate(df.columns):
+            data = df[column]
+            numeric = bool(pd.api.types.is_numeric_dtype(data))
+            if numeric:
+                values = data.fillna(0).to_numpy()
+            else:
+                values = pd.to_numeric(data, errors='coerce').fillna(0.0).to_numpy(dtype=np.float64)
+
+            # 통계는 결측값을 제외한 원본 숫자 값 기준
+            valid = data.dropna() if numeric else pd.to_numeric(data, errors='coerce').dropna()
+            file_name = f"c{index:05d}.npy"
+            np.save(os.path.join(staging, file_name), np.ascontiguousarray(values))
+
+            columns.append({
+                'column': str(column),
+                'file': file_name,
+                'dtype': values.dtype.name,
+                'data_type': ('int64' if pd.api.types.is_integer_dtype(data) else 'float64') if numeric else 'object',
+                'numeric': numeric,
+                'min': float(valid.min()) if len(valid) > 0 else None,
+                'max': float(valid.max()) if len(valid) > 0 else None,
+            })
+
+        # 측정 시간 (첫 번째 컬럼이 숫자면 시간축으로 가정)
+        duration = None
+        if columns and columns[0]['numeric']:
+            time_values = df.iloc[:, 0].dropna()
+            if len(time_values) > 1:
+                duration = float(time_values.iloc[-1] - time_values.iloc[0])
+
+        size, mtime_ns = _source_key(file_path)
+        header = {
+            'version': SIDECAR_VERSION,
+            'source_size': size,
+            'source_mtime_ns': mtime_ns,
+            'rows': len(df),
+            'duration': duration,
+            'columns': columns,
+        }
+        with open(os.path.join(staging, HEADER_FILE), 'w', encoding='utf-8') as f:
+            json.dump(header, f, ensure_ascii=False)
+
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(staging, target)
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    forget_sidecar(file_path)
+    return open_sidecar(file_path)
+
+
+def open_sidecar(file_path: str) -> Optional['CSVSidecar']:
+    """원본 CSV와 일치하는 사이드카가 있으면 반환 (없거나 원본이 바뀌었으면 None)"""
+    try:
+        key = _source_key(file_path)
+    except OSError:
+        return None
+
+    with _lock:
+        sidecar = _open_sidecars.get(file_path)
+        if sidecar is not None and sidecar.source_key == key:
+            return sidecar
+
+    header_path = os.path.join(sidecar_path(file_path), HEADER_FILE)
+    try:
+        with open(header_path, 'r', encoding='utf-8') as f:
+            header = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if header.get('version') != SIDECAR_VERSION or (header['source_size'], header['source_mtime_ns']) != key:
+        return None
+
+    sidecar = CSVSidecar(file_path, header)
+    with _lock:
+        _open_sidecars[file_path] = sidecar
+    return sidecar
+
+
+def forget_sidecar(file_path: str):
+    """세션 정리 시 프로세스 내 사이드카 캐시 제거 (mmap 해제)"""
+    with _lock:
+        _open_sidecars.pop(file_path, None)
+
+
+class CSVSidecar:
+    """CSV 컬럼별 memory-mapped 배열과 헤더 인덱스"""
+
+    def __init__(self, file_path: str, header: dict):
+        self.file_path = file_path
+        self.directory = sidecar_path(file_path)
+        self.source_key = (header['source_size'], header['source_mtime_ns'])
+        self.rows: int = header['rows']
+        self.duration: Optional[float] = header.get('duration')
+        self.columns: List[dict] = header['columns']
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    def array(self, column: dict) -> np.ndarray:
+        """컬럼 배열 (파싱 없이 mmap으로 열고 프로세스 내에서 재사용)"""
+        array = self._arrays.get(column['file'])
+        if array is None:
+            array = np.load(os.path.join(self.directory, column['file']), mmap_mode='r')
+            self._arrays[column['file']] = array
+        return np.asarray(array)
+
+    @property
+    def has_time_axis(self) -> bool:
+        """첫 번째 컬럼이 숫자면 시간축으로 사용"""
+        return bool(self.columns) and self.columns[0]['numeric'] and self.rows > 0
+
+    def timestamps(self) -> np.ndarray:
+        if self.has_time_axis:
+            return self.array(self.columns[0])
+        return np.arange(self.rows, dtype=np.float64)
+
+    def find_column(self, ch_name: str) -> Optional[dict]:
+        """채널명과 일치하는 컬럼 (단위가 포함된 "이름 (단위)" 컬럼명도 매칭)"""
+        for column in self.columns:
+            name = column['column']
+            if name == ch_name:
+                return column
+            if "(" in name and ")" in name and name.split("(")[0].strip() == ch_name:
+                return column
+        return None
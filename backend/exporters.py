@@ -0,0 +1,214 @@
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from mdf_processor import ChannelArrays, FileProcessor, HAS_ASAMMDF
+from metrics import span
+from lazy_import import LazyModule, has_module
+
+# 내보내기를 요청할 때만 로드
+pa = LazyModule('pyarrow')
+pq = LazyModule('pyarrow.parquet')
+h5py = LazyModule('h5py')
+
+HAS_PYARROW = has_module('pyarrow')
+HAS_H5PY = has_module('h5py')
+
+# 내보내기 형식: 형식 -> (확장자, media type)
+EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    'parquet': ('.parquet', 'application/vnd.apache.parquet'),
+    'hdf5': ('.h5', 'application/x-hdf5'),
+    'mf4': ('.mf4', 'application/octet-stream'),
+}
+
+# 한 번에 기록하는 행 수 (Parquet row group / HDF5 슬라이스)
+CHUNK_ROWS = 1_000_000
+
+NO_NUMERIC_CHANNELS = "내보낼 수 있는 숫자 채널이 없습니다."
+
+
+def missing_dependency(export_format: str) -> Optional[str]:
+    """형식에 필요한 패키지가 없으면 패키지 이름 반환"""
+    if export_format == 'parquet' and not HAS_PYARROW:
+        return 'pyarrow'
+    if export_format == 'hdf5' and not HAS_H5PY:
+        return 'h5py'
+    if export_format == 'mf4' and not HAS_ASAMMDF:
+        return 'asammdf'
+    return None
+
+
+def _numeric_samples(arrays: ChannelArrays) -> Optional[np.ndarray]:
+    """1차원 숫자 배열로 정리 (비어 있거나 변환할 수 없는 채널은 None)"""
+    samples = arrays.samples
+    if samples.size == 0 or len(arrays.timestamps) == 0:
+        # 조회에 실패한 채널은 ChannelArrays.empty로 들어옴
+        return None
+    if samples.dtype.kind == 'b':
+        return samples.astype(np.uint8)
+    if samples.dtype.kind in 'biuf' and samples.ndim == 1:
+        return samples
+    try:
+        return samples.astype(np.float64).ravel()
+    except (TypeError, ValueError):
+        print(f"Skipping non-numeric channel {arrays.name} in export")
+        return None
+
+
+def _unique_name(name: str, used: set) -> str:
+    """이미 사용한 이름이면 _2, _3 ... 을 붙인 고유한 이름 (used에 추가)"""
+    unique = name
+    counter = 2
+    while unique in used:
+        unique = f"{name}_{counter}"
+        counter += 1
+    used.add(unique)
+    return unique
+
+
+def _shares_time_axis(channel_arrays: List[ChannelArrays]) -> bool:
+    first = channel_arrays[0].timestamps
+    return all(
+        len(arrays.timestamps) == len(first) and np.array_equal(arrays.timestamps, first)
+        for arrays in channel_arrays[1:]
+    )
+
+
+def write_parquet(output_path: str, channel_arrays: Iterable[ChannelArrays]):
+    """Parquet 내보내기
+
+    모든 채널의 시간축이 같으면 time + 채널별 컬럼(원본 dtype)의 넓은 테이블로,
+    샘플레이트가 섞여 있으면 channel/time/value 세로형 테이블로 기록합니다.
+    넓은 테이블에서 "time"과 겹치거나 중복된 채널명은 "time_2"처럼 번호를 붙인 컬럼명으로 기록합니다.
+    """
+    channel_arrays = [arrays for arrays in channel_arrays if _numeric_samples(arrays) is not None]
+    if not channel_arrays:
+        raise ValueError(NO_NUMERIC_CHANNELS)
+
+    if _shares_time_axis(channel_arrays):
+        used = {'time'}
+        names = [_unique_name(arrays.name, used) for arrays in channel_arrays]
+        metadata = {
+            b'source': b'MDF/CSV File Viewer',
+            b'units': json.dumps(
+                {name: arrays.unit for name, arrays in zip(names, channel_arrays)}, ensure_ascii=False
+            ).encode('utf-8'),
+        }
+        columns = [('time', channel_arrays[0].timestamps.astype(np.float64, copy=False))]
+        columns += [(name, _numeric_samples(arrays)) for name, arrays in zip(names, channel_arrays)]
+        schema = pa.schema([(name, pa.from_numpy_dtype(values.dtype)) for name, values in columns], metadata=metadata)
+        length = len(columns[0][1])
+
+        with pq.ParquetWriter(output_path, schema, compression='zstd') as writer:
+            for start in range(0, max(length, 1), CHUNK_ROWS):
+                stop = min(start + CHUNK_ROWS, length)
+                writer.write_table(pa.Table.from_arrays([values[start:stop] for _, values in columns], schema=schema))
+        return
+
+    metadata = {
+        b'source': b'MDF/CSV File Viewer',
+        b'units': json.dumps({arrays.name: arrays.unit for arrays in channel_arrays}, ensure_ascii=False).encode('utf-8'),
+    }
+    schema = pa.schema([
+        ('channel', pa.dictionary(pa.int32(), pa.string())),
+        ('time', pa.float64()),
+        ('value', pa.float64()),
+    ], metadata=metadata)
+
+    with pq.ParquetWriter(output_path, schema, compression='zstd') as writer:
+        for arrays in channel_arrays:
+            samples = _numeric_samples(arrays).astype(np.float64, copy=False)
+            length = min(len(samples), len(arrays.timestamps))
+            dictionary = pa.array([arrays.name])
+            for start in range(0, length, CHUNK_ROWS):
+                stop = min(start + CHUNK_ROWS, length)
+                channel = pa.DictionaryArray.from_arrays(np.zeros(stop - start, dtype=np.int32), dictionary)
+                writer.write_table(pa.Table.from_arrays(
+                    [channel, arrays.timestamps[start:stop].astype(np.float64, copy=False), samples[start:stop]],
+                    schema=schema
+                ))
+
+
+def write_hdf5(output_path: str, channel_arrays: Iterable[ChannelArrays], source_name: str = ''):
+    """HDF5 내보내기 (채널별 그룹에 time/values 데이터셋, 단위와 샘플레이트는 속성으로 기록)
+
+    그룹명이 겹치면 "이름_2"처럼 번호를 붙이며, 원래 채널명은 그룹의 name 속성에 남깁니다.
+    채널은 하나씩 기록하여 한 번에 한 채널만 메모리에 두고, 숫자 채널이 하나도 없으면 ValueError를 냅니다.
+    """
+    used = set()
+    with h5py.File(output_path, 'w') as h5:
+        h5.attrs['source'] = source_name
+        h5.attrs['created'] = datetime.now().isoformat(timespec='seconds')
+
+        for arrays in channel_arrays:
+            samples = _numeric_samples(arrays)
+            if samples is None:
+                continue
+            length = min(len(samples), len(arrays.timestamps))
+
+            # HDF5 경로 구분자와 겹치지 않도록 그룹명 정리
+            group = h5.create_group(_unique_name(arrays.name.replace('/', '_') or 'channel', used))
+            group.attrs['name'] = arrays.name
+            group.attrs['unit'] = arrays.unit
+            if arrays.sample_rate is not None:
+                group.attrs['sample_rate'] = arrays.sample_rate
+
+            for dataset_name, values in (('time', arrays.timestamps.astype(np.float64, copy=False)), ('values', samples)):
+                dataset = group.create_dataset(
+                    dataset_name, shape=(length,), dtype=values.dtype,
+                    chunks=(min(max(length, 1), 65536),), compression='gzip', compression_opts=4, shuffle=True
+                )
+                for start in range(0, length, CHUNK_ROWS):
+                    stop = min(start + CHUNK_ROWS, length)
+                    dataset[start:stop] = values[start:stop]
+
+        if not used:
+            raise ValueError(NO_NUMERIC_CHANNELS)
+
+
+def write_mf4(output_path: str, channel_arrays: Iterable[ChannelArrays]):
+    """채널 배열로 MF4 작성 (원본이 MDF가 아닌 경우, 숫자 채널이 없으면 ValueError)"""
+    from asammdf import MDF, Signal  # type: ignore
+
+    mdf = MDF(version='4.10')
+    try:
+        written = 0
+        for arrays in channel_arrays:
+            samples = _numeric_samples(arrays)
+            if samples is None:
+                continue
+            length = min(len(samples), len(arrays.timestamps))
+            mdf.append(
+                [Signal(samples[:length], arrays.timestamps[:length].astype(np.float64, copy=False), name=arrays.name, unit=arrays.unit)],
+                comment=arrays.name
+            )
+            written += 1
+        if written == 0:
+            raise ValueError(NO_NUMERIC_CHANNELS)
+        mdf.save(output_path, overwrite=True)
+    finally:
+        mdf.close()
+
+
+def export_channels(file_processor: FileProcessor, file_path: str, channel_names: List[str],
+                    export_format: str, output_path: str):
+    """선택된 채널을 지정한 형식의 파일로 내보내기
+
+    MF4는 원본이 MDF 파일이면 MDF.filter로 원본 그룹/변환 정보를 유지한 부분 파일을 만듭니다.
+    """
+    file_type = file_processor.detect_file_type(file_path)
+
+    with span('export', export_format):
+        if export_format == 'mf4':
+            if file_type == 'mdf' and file_processor.mdf_processor.export_mf4(file_path, channel_names, output_path):
+                return
+            write_mf4(output_path, file_processor.iter_channel_arrays(file_path, channel_names))
+        elif export_format == 'parquet':
+            write_parquet(output_path, file_processor.iter_channel_arrays(file_path, channel_names))
+        elif export_format == 'hdf5':
+            write_hdf5(output_path, file_processor.iter_channel_arrays(file_path, channel_names), os.path.basename(file_path))
+        else:
+            raise ValueError(f"지원되지 않는 내보내기 형식입니다: {export_format}")
@@ -0,0 +1,40 @@
+"""
+MDF File Viewer 프로덕션 gunicorn 설정
+
+    gunicorn -c gunicorn.conf.py main:app
+
+세션 메타데이터(SQLite)와 업로드 파일은 MDF_VIEWER_STORAGE_DIR에 저장되어
+모든 워커가 공유하므로, 어느 워커로 요청이 가더라도 같은 세션을 처리할 수 있습니다.
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get('MDF_VIEWER_BIND', '0.0.0.0:8000')
+
+# 기본값: CPU 코어 수 (MDF 디코딩은 CPU 위주라 2n+1보다 적게 잡음)
+workers = int(os.environ.get('MDF_VIEWER_WORKERS', multiprocessing.cpu_count()))
+worker_class = 'uvicorn.workers.UvicornWorker'
+
+# 큰 파일 업로드/디코딩이 기본 30초를 넘을 수 있음
+timeout = int(os.environ.get('MDF_VIEWER_WORKER_TIMEOUT', 300))
+graceful_timeout = 30
+keepalive = 5
+
+# 워커마다 앱을 따로 import (프로세서/캐시 상태를 fork 이전에 만들지 않음)
+preload_app = False
+
+# 메모리 누수/단편화 완화를 위해 일정 요청 수마다 워커 재시작
+max_requests = int(os.environ.get('MDF_VIEWER_MAX_REQUESTS', 1000))
+max_requests_jitter = 100
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('MDF_VIEWER_LOG_LEVEL', 'info')
+
+
+def on_starting(server):
+    """워커 간 세션 공유가 가능한 설정인지 확인"""
+    if os.environ.get('MDF_VIEWER_SESSION_BACKEND', 'sqlite').lower() == 'memory' and workers > 1:
+        server.log.warning("MDF_VIEWER_SESSION_BACKEND=memory는 워커 간 세션을 공유하지 않습니다. sqlite로 변경합니다.")
+        os.environ['MDF_VIEWER_SESSION_BACKEND'] = 'sqlite'
@@ -0,0 +1,175 @@
+import gzip
+import hashlib
+import json
+import math
+import os
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+
+from metrics import span
+
+try:
+    import brotli  # type: ignore
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+    brotli = None  # type: ignore
+
+try:
+    import zstandard  # type: ignore
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+    zstandard = None  # type: ignore
+
+# 이보다 작은 응답은 압축하지 않음 (바이트)
+MIN_COMPRESS_SIZE = 1024
+
+# 서버 선호 순서 (같은 q 값이면 앞쪽 인코딩 사용)
+_PREFERRED_ENCODINGS = ['zstd', 'br', 'gzip']
+
+# 파일 해시 캐시: 경로 -> ((크기, 수정 시각), sha256)
+_fingerprints: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def supported_encodings() -> list:
+    """현재 환경에서 사용할 수 있는 압축 방식"""
+    available = {'gzip': True, 'br': HAS_BROTLI, 'zstd': HAS_ZSTD}
+    return [name for name in _PREFERRED_ENCODINGS if available[name]]
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding 헤더를 해석하여 응답 압축 방식 선택"""
+    if not accept_encoding:
+        return None
+
+    weights = {}
+    for part in accept_encoding.split(','):
+        token, _, params = part.strip().partition(';')
+        token = token.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if token:
+            weights[token] = quality
+
+    best = None
+    best_quality = 0.0
+    for name in supported_encodings():
+        quality = weights.get(name, weights.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """선택된 방식으로 응답 본문 압축"""
+    if encoding == 'zstd':
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    if encoding == 'br':
+        return brotli.compress(body, quality=4)
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=5)
+    return body
+
+
+def file_fingerprint(file_path: str) -> str:
+    """파일 내용 해시 (크기/수정 시각이 바뀌지 않으면 캐시된 값 사용)"""
+    stat = os.stat(file_path)
+    key = (stat.st_size, stat.st_mtime_ns)
+
+    cached = _fingerprints.get(file_path)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+
+    fingerprint = digest.hexdigest()
+    _fingerprints[file_path] = (key, fingerprint)
+    return fingerprint
+
+
+def forget_file(file_path: str):
+    """세션 정리 시 파일 해시 캐시 제거"""
+    _fingerprints.pop(file_path, None)
+
+
+def make_etag(file_path: str, *params: Any) -> str:
+    """파일 해시와 요청 파라미터로 ETag 생성"""
+    digest = hashlib.sha256(file_fingerprint(file_path).encode())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode('utf-8'))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 확인"""
+    if_none_match = request.headers.get('if-none-match')
+    if not if_none_match:
+        return False
+
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in candidates or any(tag.removeprefix('W/') == etag for tag in candidates)
+
+
+def _finite(value: Any) -> Any:
+    """NaN/Infinity를 null로 바꾼 값 (리스트/딕셔너리는 재귀 처리)"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, list):
+        return [_finite(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    return value
+
+
+def json_text(payload: Any) -> str:
+    """브라우저 JSON.parse로 읽을 수 있는 JSON 문자열
+
+    NaN/Infinity 토큰은 JSON 표준이 아니므로 null로 바꿉니다 (값이 모두 유한하면 한 번만 직렬화).
+    """
+    encoded = jsonable_encoder(payload)
+    try:
+        return json.dumps(encoded, ensure_ascii=False, allow_nan=False, separators=(',', ':'))
+    except ValueError:
+        return json.dumps(_finite(encoded), ensure_ascii=False, allow_nan=False, separators=(',', ':'))
+
+
+def cached_json_response(request: Request, etag: str, build_payload: Callable[[], Any]) -> Response:
+    """ETag 재검증과 압축을 적용한 JSON 응답
+
+    If-None-Match가 일치하면 build_payload를 호출하지 않고 304를 반환합니다.
+    build_payload가 bytes를 반환하면 이미 직렬화된 JSON으로 보고 그대로 사용합니다.
+    """
+    headers = {
+        'ETag': etag,
+        'Cache-Control': 'no-cache',
+        'Vary': 'Accept-Encoding',
+    }
+
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    payload = build_payload()
+    if isinstance(payload, bytes):
+        body = payload
+    else:
+        with span('serialization'):
+            body = json_text(payload).encode('utf-8')
+
+    encoding = negotiate_encoding(request.headers.get('accept-encoding', ''))
+    if encoding and len(body) >= MIN_COMPRESS_SIZE:
+        with span('compression', encoding):
+            body = compress(body, encoding)
+        headers['Content-Encoding'] = encoding
+
+    return Response(content=body, media_type='application/json', headers=headers)
@@ -0,0 +1,48 @@
+import importlib
+import importlib.util
+import threading
+from typing import Any, Optional
+
+
+def has_module(name: str) -> bool:
+    """모듈을 import하지 않고 설치 여부만 확인"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule:
+    """첫 속성 접근 시점에 모듈을 import하는 대리 객체
+
+    pandas, asammdf처럼 import에 수백 ms가 걸리는 패키지를 실제로 쓰는 경로(CSV/MDF)에서만
+    로드하여 워커 시작 시간을 줄입니다.
+
+    사용 예:
+        pd = LazyModule('pandas')
+        df = pd.read_csv(path)  # 여기서 처음 import
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """모듈을 즉시 import (워밍업용)"""
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        return self._module
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def __getattr__(self, attr: str):
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<LazyModule {self._name} ({state})>"
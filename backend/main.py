@@ -1,16 +1,79 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException
+import time
+
+# 워커 시작 시간 측정 기준 (다른 import보다 먼저 기록)
+_startup_begin = time.perf_counter()
+
+from fastapi import FastAPI, File, Form, UploadFile, HTTPException, WebSocket, WebSocketDisconnect, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, PlainTextResponse, FileResponse
+from starlette.background import BackgroundTask
 import uvicorn
 import tempfile
+from contextlib import asynccontextmanager
+import asyncio
+import uuid
 import os
 from typing import List, Dict, Any
 import csv
 import io
-from mdf_processor import FileProcessor
-from models import ChannelInfo, ChannelData, MDFInfo
+import json
+from mdf_processor import FileProcessor, TailCursor, downsample_minmax, warm_up
+from models import ChannelInfo, ChannelData, MDFInfo, WatchRequest, CorrelationRequest, SpectrumRequest
+from http_cache import cached_json_response, json_text, make_etag, file_fingerprint, forget_file
+from transport import encode_typed_channel, DEFAULT_TIME_TICK
+from metrics import MetricsMiddleware, registry, run_in_threadpool, span
+from session_store import SessionManager, DEFAULT_CLEANUP_INTERVAL
+from exporters import EXPORT_FORMATS, export_channels, missing_dependency
+from csv_sidecar import forget_sidecar
+from channel_catalog import forget_catalog
+from analysis import analyze_correlation, analyze_spectrum, SPECTRUM_MODES
+from bus_decoding import BUS_TYPES, DATABASE_EXTENSIONS, database_path, decode_bus_logging, decoded_version
+from bus_decoding import missing_dependency as missing_bus_dependency
+
+# 세션 저장소 (TTL/유휴 만료, 디스크 한도, 워커 간 공유 SQLite 백엔드)
+sessions = SessionManager.from_env()
 
-app = FastAPI(title="MDF/CSV File Viewer API", version="1.0.0")
+async def _cleanup_sessions_periodically():
+    """만료 세션과 디스크 한도 초과분을 주기적으로 정리"""
+    interval = float(os.environ.get('MDF_VIEWER_CLEANUP_INTERVAL', DEFAULT_CLEANUP_INTERVAL))
+    while True:
+        try:
+            removed = await run_in_threadpool(sessions.cleanup)
+            if removed:
+                print(f"Expired sessions removed: {len(removed)}")
+        except Exception as e:
+            print(f"Error cleaning up sessions: {e}")
+        await asyncio.sleep(interval)
+
+# 워커 시작 시간 (import 시작부터 요청을 받을 수 있을 때까지, 초)
+startup_stats: Dict[str, float] = {}
+
+async def _warm_up_dependencies():
+    """요청을 받기 시작한 뒤 pandas/asammdf를 백그라운드에서 미리 로드"""
+    start = time.perf_counter()
+    try:
+        await run_in_threadpool(warm_up)
+        startup_stats['warmup_seconds'] = time.perf_counter() - start
+        print(f"🔥 의존성 워밍업 완료: {startup_stats['warmup_seconds']:.2f}s")
+    except Exception as e:
+        print(f"Error warming up dependencies: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    startup_stats['startup_seconds'] = time.perf_counter() - _startup_begin
+    print(f"🚀 서버 준비 완료: {startup_stats['startup_seconds']:.2f}s (pid {os.getpid()})")
+
+    cleanup_task = asyncio.create_task(_cleanup_sessions_periodically())
+    # MDF_VIEWER_WARMUP=0이면 첫 CSV/MDF 요청에서 로드
+    warmup_task = None
+    if os.environ.get('MDF_VIEWER_WARMUP', '1') != '0':
+        warmup_task = asyncio.create_task(_warm_up_dependencies())
+    yield
+    cleanup_task.cancel()
+    if warmup_task is not None:
+        warmup_task.cancel()
+
+app = FastAPI(title="MDF/CSV File Viewer API", version="1.0.0", lifespan=lifespan)
 
 # CORS 미들웨어 설정
 app.add_middleware(
@@ -19,13 +82,31 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Profile-File"],
 )
 
+# 요청 지연 시간 측정 및 요청별 프로파일링 (MDF_VIEWER_PROFILING=1)
+app.add_middleware(MetricsMiddleware)
+
 # 통합 파일 프로세서 인스턴스
 file_processor = FileProcessor()
 
-# 임시 파일 저장소 (실제 환경에서는 Redis나 DB 사용 권장)
-uploaded_files: Dict[str, str] = {}
+# 세션 삭제 시 프로세스 내 파일 해시 캐시도 정리
+sessions.add_remove_hook(forget_file)
+sessions.add_remove_hook(forget_sidecar)
+sessions.add_remove_hook(forget_catalog)
+
+registry.gauge('mdf_viewer_active_sessions', '활성 세션 수', sessions.count)
+registry.gauge('mdf_viewer_session_disk_bytes', '업로드 파일과 캐시의 디스크 사용량', sessions.disk_usage)
+registry.gauge('mdf_viewer_startup_seconds', '워커 시작부터 요청 수신 가능까지 걸린 시간', lambda: startup_stats['startup_seconds'])
+registry.gauge('mdf_viewer_warmup_seconds', 'pandas/asammdf 백그라운드 로드 시간', lambda: startup_stats['warmup_seconds'])
+
+# 라이브 테일 폴링 간격 범위 (초)
+TAIL_MIN_INTERVAL = 0.2
+TAIL_MAX_INTERVAL = 10.0
+
+# 프로그레시브 스트리밍에서 먼저 보내는 미리보기 해상도 (포인트 수)
+STREAM_COARSE_POINTS = 2000
 
 @app.get("/")
 async def root():
@@ -43,18 +124,36 @@ async def upload_file(file: UploadFile = File(...)):
                 detail="지원되지 않는 파일 형식입니다. .mdf, .mf4 또는 .csv 파일만 지원합니다."
             )
         
-        # 임시 파일로 저장
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename or '')[1]) as tmp_file:
-            content = await file.read()
+        content = await file.read()
+        if len(content) > sessions.quota_bytes:
+            raise HTTPException(status_code=413, detail="파일이 서버 디스크 한도보다 큽니다.")
+
+        # 디스크 한도를 넘지 않도록 만료/오래된 세션 정리
+        await run_in_threadpool(sessions.cleanup, len(content))
+
+        # 워커 간 공유되는 세션 저장소 디렉터리에 저장
+        with tempfile.NamedTemporaryFile(delete=False, dir=sessions.storage_dir,
+                                         suffix=os.path.splitext(file.filename or '')[1]) as tmp_file:
             tmp_file.write(content)
             tmp_file_path = tmp_file.name
-        
-        # 파일 처리 (MDF 또는 CSV)
-        file_info = file_processor.process_file(tmp_file_path)
-        
-        # 파일 정보를 메모리에 저장 (세션 ID 생성)
-        session_id = os.path.basename(tmp_file_path)
-        uploaded_files[session_id] = tmp_file_path
+
+        try:
+            # CSV는 컬럼별 바이너리 사이드카로 한 번 변환 (이후 조회는 mmap 사용)
+            await run_in_threadpool(file_processor.prepare_file, tmp_file_path)
+
+            # 파일 처리 (MDF 또는 CSV)
+            file_info = await run_in_threadpool(file_processor.process_file, tmp_file_path)
+
+            # ETag 계산용 파일 해시를 미리 구해 둠 (파일 전체를 읽으므로 워커 스레드에서 실행)
+            await run_in_threadpool(file_fingerprint, tmp_file_path)
+
+            # 세션 등록 (세션 ID 생성)
+            session_id = os.path.basename(tmp_file_path)
+            sessions.create(session_id, tmp_file_path, file.filename)
+        except Exception:
+            # 세션으로 등록되지 않은 파일은 만료/디스크 한도 정리 대상이 아니므로 바로 삭제
+            await run_in_threadpool(sessions.discard, tmp_file_path)
+            raise
         
         return {
             "session_id": session_id,
@@ -62,34 +161,141 @@ async def upload_file(file: UploadFile = File(...)):
             "file_info": file_info.dict(),
             "message": f"파일 '{file.filename}'을 성공적으로 처리했습니다."
         }
-        
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 처리 중 오류가 발생했습니다: {str(e)}")
 
-@app.get("/api/channels/{session_id}")
-async def get_channels(session_id: str):
-    """세션 ID로 채널 목록 조회"""
+def _watch_root():
+    """실시간 감시를 허용하는 서버 디렉터리 (MDF_VIEWER_WATCH_DIR, 없으면 None)"""
+    root = os.environ.get('MDF_VIEWER_WATCH_DIR')
+    return os.path.realpath(root) if root else None
+
+@app.post("/api/watch")
+async def watch_file(request: WatchRequest):
+    """로거가 기록 중인 서버 로컬 MDF/CSV 파일을 라이브 테일 세션으로 등록
+
+    MDF_VIEWER_WATCH_DIR 아래의 파일만 허용합니다 (설정되지 않으면 감시 기능 비활성화).
+    """
     try:
-        if session_id not in uploaded_files:
-            raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
-        
-        file_path = uploaded_files[session_id]
-        channels = file_processor.get_channels(file_path)
-        
+        watch_root = _watch_root()
+        if watch_root is None:
+            raise HTTPException(
+                status_code=403,
+                detail="실시간 감시가 비활성화되어 있습니다. 서버에 MDF_VIEWER_WATCH_DIR을 설정하세요."
+            )
+
+        # 심볼릭 링크와 ".."을 풀어낸 실제 경로가 감시 디렉터리 안에 있어야 함
+        file_path = os.path.realpath(os.path.join(watch_root, request.file_path))
+        if os.path.commonpath([watch_root, file_path]) != watch_root:
+            raise HTTPException(status_code=403, detail="감시 디렉터리 밖의 파일은 감시할 수 없습니다.")
+
+        if not file_path.lower().endswith(('.mdf', '.mf4', '.csv')):
+            raise HTTPException(
+                status_code=400,
+                detail="지원되지 않는 파일 형식입니다. .mdf, .mf4 또는 .csv 파일만 지원합니다."
+            )
+        if not os.path.isfile(file_path):
+            raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+
+        file_info = await run_in_threadpool(file_processor.process_file, file_path)
+
+        session_id = f"watch_{uuid.uuid4().hex}{os.path.splitext(file_path)[1]}"
+        # 감시 중인 원본 파일은 세션이 만료되어도 삭제하지 않음
+        sessions.create(session_id, file_path, os.path.basename(file_path), watched=True)
+
         return {
             "session_id": session_id,
-            "channels": [channel.dict() for channel in channels],
-            "total_channels": len(channels)
+            "filename": os.path.basename(file_path),
+            "file_info": file_info.dict(),
+            "live": True,
+            "message": f"파일 '{file_path}'을 실시간으로 감시합니다."
         }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"파일 처리 중 오류가 발생했습니다: {str(e)}")
+
+@app.websocket("/api/tail/{session_id}")
+async def tail_channel_data(websocket: WebSocket, session_id: str, interval: float = 1.0):
+    """라이브 테일: 파일에 추가된 샘플만 WebSocket으로 전송
+
+    클라이언트는 연결 직후 채널명 목록(JSON 배열)을 한 번 보냅니다.
+    첫 메시지에는 기존 데이터 전체가, 이후에는 새로 추가된 샘플만 담깁니다.
+    """
+    await websocket.accept()
+
+    file_path = sessions.get_path(session_id)
+    if file_path is None:
+        await websocket.close(code=4404, reason="세션을 찾을 수 없습니다.")
+        return
+
+    try:
+        channel_names = await websocket.receive_json()
+        if not isinstance(channel_names, list) or len(channel_names) > 20:
+            await websocket.close(code=4400, reason="최대 20개의 채널만 선택할 수 있습니다.")
+            return
+
+        interval = min(max(interval, TAIL_MIN_INTERVAL), TAIL_MAX_INTERVAL)
+        cursor = TailCursor()
+
+        while sessions.exists(session_id):
+            channel_data = await run_in_threadpool(
+                file_processor.read_appended, file_path, channel_names, cursor
+            )
+            if any(data.timestamps or data.raster for data in channel_data):
+                # NaN/Infinity는 null로 보냄 (브라우저 JSON.parse 호환), 직렬화는 워커 스레드에서 실행
+                payload = {"type": "append", "data": channel_data}
+                await websocket.send_text(await run_in_threadpool(json_text, payload))
+            await asyncio.sleep(interval)
+
+        await websocket.close(code=4410, reason="세션이 종료되었습니다.")
+
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        print(f"Error tailing session {session_id}: {e}")
+        await websocket.close(code=1011, reason="라이브 테일 중 오류가 발생했습니다.")
+
+@app.get("/api/channels/{session_id}")
+async def get_channels(session_id: str, request: Request):
+    """세션 ID로 채널 목록 조회 (ETag 재검증, 압축 지원)"""
+    try:
+        file_path = sessions.get_path(session_id)
+        if file_path is None:
+            raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+
+        def build_payload():
+            # 채널별 모델 객체 없이 카탈로그에서 바로 JSON 생성
+            catalog = file_processor.get_catalog(file_path)
+            with span('serialization'):
+                body = '{"session_id":%s,"channels":%s,"total_channels":%d}' % (
+                    json.dumps(session_id), catalog.channels_json(), len(catalog)
+                )
+            return body.encode('utf-8')
+
+        # 파일 해시는 파일이 바뀌면 (감시 중인 파일 등) 다시 계산하므로 워커 스레드에서 실행
+        etag = await run_in_threadpool(make_etag, file_path, "channels", session_id, decoded_version(file_path))
+        return await run_in_threadpool(cached_json_response, request, etag, build_payload)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"채널 정보 조회 중 오류가 발생했습니다: {str(e)}")
 
 @app.post("/api/data/{session_id}")
-async def get_channel_data(session_id: str, channel_names: List[str]):
-    """선택된 채널들의 데이터 조회"""
+async def get_channel_data(session_id: str, channel_names: List[str], request: Request,
+                           transport: str = "json", delta_timestamps: bool = True,
+                           time_tick: float = DEFAULT_TIME_TICK, compress_timestamps: bool = True):
+    """선택된 채널들의 데이터 조회 (ETag 재검증, 압축 지원)
+
+    transport="json"에서 compress_timestamps가 켜져 있으면 등간격 채널은 raster(t0, dt, count)로 보냅니다.
+    transport="typed"이면 샘플을 원본 dtype 그대로 base64로 보내고,
+    delta_timestamps가 켜져 있으면 타임스탬프를 등간격(t0 + dt) 또는 정수 차분으로 압축합니다.
+    """
     try:
-        if session_id not in uploaded_files:
+        file_path = sessions.get_path(session_id)
+        if file_path is None:
             raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
         
         if len(channel_names) > 20:
@@ -97,24 +303,120 @@ async def get_channel_data(session_id: str, channel_names: List[str]):
                 status_code=400, 
                 detail="성능상의 이유로 최대 20개의 채널만 선택할 수 있습니다."
             )
-        
-        file_path = uploaded_files[session_id]
-        channel_data = file_processor.get_channel_data(file_path, channel_names)
 
-        return {
-            "session_id": session_id,
-            "data": [data.dict() for data in channel_data],
-            "channels_count": len(channel_data)
-        }
+        if transport not in ("json", "typed"):
+            raise HTTPException(status_code=400, detail="transport는 'json' 또는 'typed'만 지원합니다.")
+
+        if time_tick <= 0:
+            raise HTTPException(status_code=400, detail="time_tick은 0보다 커야 합니다.")
         
+
+        def build_payload():
+            if transport == "typed":
+                channel_arrays = file_processor.get_channel_arrays(file_path, channel_names)
+                data = [
+                    encode_typed_channel(arrays, delta_timestamps, time_tick).dict()
+                    for arrays in channel_arrays
+                ]
+            else:
+                data = [
+                    arrays.to_channel_data(compress_timestamps).dict()
+                    for arrays in file_processor.iter_channel_arrays(file_path, channel_names)
+                ]
+
+            return {
+                "session_id": session_id,
+                "transport": transport,
+                "data": data,
+                "channels_count": len(data)
+            }
+
+        etag = await run_in_threadpool(
+            make_etag, file_path, "data", session_id, channel_names,
+            transport, delta_timestamps, time_tick, compress_timestamps, decoded_version(file_path)
+        )
+        # 디코딩, 직렬화, 압축은 다른 요청/WebSocket을 막지 않도록 워커 스레드에서 실행
+        return await run_in_threadpool(cached_json_response, request, etag, build_payload)
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"채널 데이터 조회 중 오류가 발생했습니다: {str(e)}")
 
+@app.websocket("/api/stream/{session_id}")
+async def stream_channel_data(websocket: WebSocket, session_id: str, coarse_points: int = STREAM_COARSE_POINTS):
+    """선택된 채널 데이터를 준비되는 대로 WebSocket으로 전송 (저해상도 → 원본 순)
+
+    클라이언트는 연결 직후 채널명 목록(JSON 배열)을 한 번 보냅니다.
+    채널이 디코딩될 때마다 미리보기("coarse")를 먼저 보내고,
+    모든 채널의 미리보기가 끝나면 원본 해상도("full")를 채널별로 보낸 뒤 "done"으로 끝납니다.
+    원본 해상도는 채널마다 다시 읽어 바로 보내므로, 메모리에는 한 번에 한 채널의 원본 배열만 남습니다
+    (미리보기를 보낸 채널은 두 번 디코딩). NaN/Infinity 값은 null로 보냅니다.
+    """
+    await websocket.accept()
+
+    file_path = sessions.get_path(session_id)
+    if file_path is None:
+        await websocket.close(code=4404, reason="세션을 찾을 수 없습니다.")
+        return
+
+    try:
+        channel_names = await websocket.receive_json()
+        if not isinstance(channel_names, list) or len(channel_names) > 20:
+            await websocket.close(code=4400, reason="최대 20개의 채널만 선택할 수 있습니다.")
+            return
+
+        coarse_points = max(coarse_points, 100)
+        channel_iter = file_processor.iter_channel_arrays(file_path, channel_names)
+
+        def preview_frame(index: int, arrays):
+            """미리보기 프레임 (다운샘플링, 변환, 직렬화를 워커 스레드에서 한 번에 실행)"""
+            preview = downsample_minmax(arrays, coarse_points)
+            level = "full" if preview is arrays else "coarse"
+            data = preview.to_channel_data()
+            if level == "coarse":
+                # 미리보기에도 원본 신호의 샘플레이트 표시
+                data.sample_rate = arrays.sample_rate
+            return level, json_text({"type": level, "index": index, "data": data})
+
+        def full_frame(index: int, arrays) -> str:
+            return json_text({"type": "full", "index": index, "data": arrays.to_channel_data()})
+
+        # 1단계: 채널이 디코딩되는 대로 미리보기 전송 (작은 채널은 바로 원본 전송)
+        pending = []
+        for index in range(len(channel_names)):
+            arrays = await run_in_threadpool(next, channel_iter, None)
+            if arrays is None:
+                break
+
+            level, frame = await run_in_threadpool(preview_frame, index, arrays)
+            if level == "coarse":
+                pending.append(index)
+            await websocket.send_text(frame)
+
+        # 2단계: 원본 해상도를 채널별로 다시 읽어 바로 전송
+        full_iter = file_processor.iter_channel_arrays(file_path, [channel_names[index] for index in pending])
+        for index in pending:
+            arrays = await run_in_threadpool(next, full_iter, None)
+            if arrays is None:
+                break
+            await websocket.send_text(await run_in_threadpool(full_frame, index, arrays))
+
+        await websocket.send_text(json_text({"type": "done", "channels_count": len(channel_names)}))
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        print(f"Error streaming session {session_id}: {e}")
+        await websocket.close(code=1011, reason="채널 데이터 스트리밍 중 오류가 발생했습니다.")
+
 @app.post("/api/export/csv/{session_id}")
 async def export_csv(session_id: str, channel_names: List[str]):
     """선택된 채널들의 데이터를 CSV 형식으로 내보내기"""
     try:
-        if session_id not in uploaded_files:
+        file_path = sessions.get_path(session_id)
+        if file_path is None:
             raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
         
         if len(channel_names) > 20:
@@ -123,8 +425,11 @@ async def export_csv(session_id: str, channel_names: List[str]):
                 detail="성능상의 이유로 최대 20개의 채널만 내보낼 수 있습니다."
             )
         
-        file_path = uploaded_files[session_id]
-        channel_data = file_processor.get_channel_data(file_path, channel_names)
+        # 행 단위로 기록하므로 등간격 채널도 타임스탬프를 모두 펼침
+        channel_data = [
+            arrays.to_channel_data(compress_timestamps=False)
+            for arrays in file_processor.iter_channel_arrays(file_path, channel_names)
+        ]
         
         # CSV 데이터 생성
         output = io.StringIO()
@@ -176,15 +481,235 @@ async def export_csv(session_id: str, channel_names: List[str]):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"CSV 내보내기 중 오류가 발생했습니다: {str(e)}")
 
+def _remove_export_file(path: str):
+    """전송이 끝난 내보내기 파일 삭제"""
+    if os.path.exists(path):
+        os.unlink(path)
+
+@app.post("/api/export/{export_format}/{session_id}")
+async def export_file(export_format: str, session_id: str, channel_names: List[str]):
+    """선택된 채널들을 Parquet, HDF5 또는 MF4(원본 MDF에서 채널만 추출)로 내보내기"""
+    try:
+        file_path = sessions.get_path(session_id)
+        if file_path is None:
+            raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+
+        if export_format not in EXPORT_FORMATS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"지원되지 않는 내보내기 형식입니다. ({', '.join(['csv'] + list(EXPORT_FORMATS))})"
+            )
+
+        dependency = missing_dependency(export_format)
+        if dependency:
+            raise HTTPException(
+                status_code=501,
+                detail=f"{export_format} 내보내기에는 {dependency} 패키지가 필요합니다. (pip install {dependency})"
+            )
+
+        if len(channel_names) > 20:
+            raise HTTPException(
+                status_code=400,
+                detail="성능상의 이유로 최대 20개의 채널만 내보낼 수 있습니다."
+            )
+
+        # 세션 저장소에 기록 후 파일로 전송 (전송이 끝나면 삭제)
+        extension, media_type = EXPORT_FORMATS[export_format]
+        output_path = os.path.join(sessions.storage_dir, f"{session_id}.export-{uuid.uuid4().hex}{extension}")
+        try:
+            await run_in_threadpool(export_channels, file_processor, file_path, channel_names, export_format, output_path)
+        except Exception:
+            _remove_export_file(output_path)
+            raise
+
+        filename = f"mdf_export_{session_id}_{len(channel_names)}channels{extension}"
+        return FileResponse(
+            output_path,
+            media_type=media_type,
+            filename=filename,
+            background=BackgroundTask(_remove_export_file, output_path)
+        )
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        # 선택한 채널로 내보낼 수 없는 경우 (숫자 채널 없음 등)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"{export_format} 내보내기 중 오류가 발생했습니다: {str(e)}")
+
+# 분석은 결과만 반환하므로 데이터 조회보다 많은 채널을 허용
+MAX_ANALYSIS_CHANNELS = 64
+
+@app.post("/api/analysis/correlation/{session_id}")
+async def correlation_analysis(session_id: str, analysis: CorrelationRequest, request: Request):
+    """선택된 채널들을 공통 격자에 맞춰 상관계수 행렬, 교차상관, XY 2D 히스토그램 계산
+
+    원본 샘플 대신 행렬/히스토그램만 반환하므로 수백만 샘플 채널도 브라우저에서 다룰 수 있습니다.
+    """
+    try:
+        file_path = sessions.get_path(session_id)
+        if file_path is None:
+            raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+
+        if not 1 <= len(analysis.channel_names) <= MAX_ANALYSIS_CHANNELS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"분석할 채널을 1~{MAX_ANALYSIS_CHANNELS}개 선택해야 합니다."
+            )
+
+        if (analysis.scatter_x is None) != (analysis.scatter_y is None):
+            raise HTTPException(status_code=400, detail="scatter_x와 scatter_y는 함께 지정해야 합니다.")
+
+        def build_payload():
+            channel_arrays = file_processor.get_channel_arrays(file_path, analysis.channel_names)
+            result = analyze_correlation(
+                channel_arrays,
+                sample_rate=analysis.sample_rate,
+                t_start=analysis.t_start,
+                t_end=analysis.t_end,
+                max_lag=analysis.max_lag,
+                reference=analysis.reference,
+                scatter_x=analysis.scatter_x,
+                scatter_y=analysis.scatter_y,
+                bins=analysis.bins
+            )
+            return {"session_id": session_id, **result}
+
+        etag = await run_in_threadpool(
+            make_etag, file_path, "correlation", session_id, analysis.dict(), decoded_version(file_path)
+        )
+        return await run_in_threadpool(cached_json_response, request, etag, build_payload)
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"상관 분석 중 오류가 발생했습니다: {str(e)}")
+
+# 스펙트럼 요청 파라미터 범위
+MAX_SPECTRUM_NPERSEG = 65536
+MAX_SPECTRUM_WIDTH = 4096
+MAX_SPECTRUM_HEIGHT = 2048
+
+@app.post("/api/analysis/spectrum/{session_id}")
+async def spectrum_analysis(session_id: str, analysis: SpectrumRequest, request: Request):
+    """채널의 Welch PSD 또는 STFT 스펙트로그램을 요청한 픽셀 크기의 격자로 계산"""
+    try:
+        file_path = sessions.get_path(session_id)
+        if file_path is None:
+            raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+
+        if analysis.mode not in SPECTRUM_MODES:
+            raise HTTPException(status_code=400, detail=f"mode는 {' 또는 '.join(SPECTRUM_MODES)}만 지원합니다.")
+        if not 16 <= analysis.nperseg <= MAX_SPECTRUM_NPERSEG:
+            raise HTTPException(status_code=400, detail=f"nperseg는 16~{MAX_SPECTRUM_NPERSEG} 사이여야 합니다.")
+        if not 0.0 <= analysis.overlap <= 0.95:
+            raise HTTPException(status_code=400, detail="overlap은 0~0.95 사이여야 합니다.")
+        if not (1 <= analysis.width <= MAX_SPECTRUM_WIDTH and 1 <= analysis.height <= MAX_SPECTRUM_HEIGHT):
+            raise HTTPException(
+                status_code=400,
+                detail=f"width는 1~{MAX_SPECTRUM_WIDTH}, height는 1~{MAX_SPECTRUM_HEIGHT} 사이여야 합니다."
+            )
+
+        def build_payload():
+            arrays = file_processor.get_channel_arrays(file_path, [analysis.channel_name])[0]
+            result = analyze_spectrum(
+                arrays,
+                mode=analysis.mode,
+                t_start=analysis.t_start,
+                t_end=analysis.t_end,
+                nperseg=analysis.nperseg,
+                overlap=analysis.overlap,
+                width=analysis.width,
+                height=analysis.height,
+                decibel=analysis.decibel
+            )
+            return {"session_id": session_id, **result}
+
+        etag = await run_in_threadpool(
+            make_etag, file_path, "spectrum", session_id, analysis.dict(), decoded_version(file_path)
+        )
+        return await run_in_threadpool(cached_json_response, request, etag, build_payload)
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"스펙트럼 분석 중 오류가 발생했습니다: {str(e)}")
+
+@app.post("/api/bus/decode/{session_id}")
+async def decode_bus(session_id: str, databases: List[UploadFile] = File(...),
+                     bus_type: str = Form("CAN"), bus_channel: int = Form(0)):
+    """MDF에 기록된 CAN/LIN 원시 프레임을 DBC/ARXML/LDF 데이터베이스로 디코딩
+
+    디코딩된 신호는 세션에 저장되어 채널 목록과 데이터 조회/분석 API에 일반 채널처럼 나타납니다.
+    bus_channel이 0이면 모든 버스 채널에 데이터베이스를 적용합니다.
+    """
+    try:
+        file_path = sessions.get_path(session_id)
+        if file_path is None:
+            raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+
+        if file_processor.detect_file_type(file_path) != 'mdf':
+            raise HTTPException(status_code=400, detail="버스 로깅 디코딩은 MDF 파일만 지원합니다.")
+
+        if sessions.is_watched(session_id):
+            raise HTTPException(status_code=400, detail="감시 중인 파일은 버스 로깅 디코딩을 지원하지 않습니다.")
+
+        if bus_type not in BUS_TYPES:
+            raise HTTPException(status_code=400, detail=f"bus_type은 {' 또는 '.join(BUS_TYPES)}만 지원합니다.")
+
+        extensions = [os.path.splitext(database.filename or '')[1].lower() for database in databases]
+        if not extensions or any(extension not in DATABASE_EXTENSIONS for extension in extensions):
+            raise HTTPException(
+                status_code=400,
+                detail=f"지원되지 않는 데이터베이스 형식입니다. ({', '.join(DATABASE_EXTENSIONS)})"
+            )
+
+        # LDF는 LIN 전용 데이터베이스 (CAN으로 디코딩하면 신호가 하나도 나오지 않음)
+        if bus_type == 'CAN' and '.ldf' in extensions:
+            raise HTTPException(status_code=400, detail="LDF 데이터베이스는 bus_type=LIN으로 디코딩해야 합니다.")
+
+        dependency = missing_bus_dependency()
+        if dependency:
+            raise HTTPException(
+                status_code=501,
+                detail=f"버스 로깅 디코딩에는 {dependency} 패키지가 필요합니다. (pip install {dependency})"
+            )
+
+        # 데이터베이스는 세션 파생 파일로 저장 (세션 삭제 시 함께 정리)
+        database_files = []
+        for index, (database, extension) in enumerate(zip(databases, extensions)):
+            path = database_path(file_path, index, extension)
+            with open(path, 'wb') as f:
+                f.write(await database.read())
+            database_files.append((path, bus_channel))
+
+        summary = await run_in_threadpool(decode_bus_logging, file_path, database_files, bus_type)
+        forget_catalog(file_path)
+
+        return {
+            "session_id": session_id,
+            **summary,
+            "message": f"{bus_type} 메시지 {summary['messages']}개에서 신호 {summary['signals']}개를 디코딩했습니다."
+        }
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"버스 로깅 디코딩 중 오류가 발생했습니다: {str(e)}")
+
 @app.delete("/api/session/{session_id}")
 async def cleanup_session(session_id: str):
     """세션 정리 (임시 파일 삭제)"""
     try:
-        if session_id in uploaded_files:
-            file_path = uploaded_files[session_id]
-            if os.path.exists(file_path):
-                os.unlink(file_path)
-            del uploaded_files[session_id]
+        # 업로드 파일과 파생 캐시 삭제 (감시 중인 원본 파일은 삭제하지 않음)
+        if sessions.remove(session_id):
             return {"message": "세션이 성공적으로 정리되었습니다."}
         else:
             raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
@@ -195,11 +720,20 @@ async def cleanup_session(session_id: str):
 @app.get("/api/sessions")
 async def list_sessions():
     """현재 활성 세션 목록"""
+    records = sessions.list()
     return {
-        "active_sessions": list(uploaded_files.keys()),
-        "total_sessions": len(uploaded_files)
+        "active_sessions": [record.session_id for record in records],
+        "total_sessions": len(records),
+        "sessions": [record.to_dict() for record in records],
+        "disk_usage_bytes": sessions.disk_usage(),
+        "disk_quota_bytes": sessions.quota_bytes
     }
 
+@app.get("/metrics")
+async def metrics():
+    """Prometheus 형식 지표 (요청 지연 시간, 단계별 처리 시간, 활성 세션 수)"""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",
@@ -1,24 +1,227 @@
 import os
-import pandas as pd
+import io
 import csv
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from datetime import datetime
 import numpy as np
-from models import MDFInfo, ChannelInfo, ChannelData
-
-try:
-    from asammdf import MDF  # type: ignore
-    HAS_ASAMMDF = True
-except ImportError:
-    HAS_ASAMMDF = False
-    MDF = None  # type: ignore
+from models import MDFInfo, ChannelInfo, ChannelData, TimeRaster
+from metrics import span
+from simulation import SyntheticMeasurement
+from lazy_import import LazyModule, has_module
+from csv_sidecar import CSVSidecar, build_sidecar, open_sidecar
+from channel_catalog import CatalogBuilder, ChannelCatalog, cached_catalog, peek_catalog, SOURCE_FILE, SOURCE_BUS
+from bus_decoding import decoded_path, has_decoded
+
+# pandas/asammdf는 import가 무거워 CSV/MDF 경로에서 처음 사용할 때 로드
+pd = LazyModule('pandas')
+asammdf = LazyModule('asammdf')
+
+HAS_ASAMMDF = has_module('asammdf')
+
+# 채널 카탈로그 생성 시 한 번에 디코딩하는 최대 샘플 수 (그룹 채널 수 x 레코드 수)
+CATALOG_SELECT_SAMPLES = 20_000_000
+if not HAS_ASAMMDF:
     print("Warning: asammdf not installed. Using simulation mode.")
 
+
+def warm_up():
+    """무거운 의존성을 미리 로드 (서버 준비 후 백그라운드에서 호출)"""
+    pd.load()
+    if HAS_ASAMMDF:
+        asammdf.load()
+
+def detect_raster(timestamps: np.ndarray, rtol: float = 1e-6) -> Optional[tuple]:
+    """등간격 신호이면 (t0, dt)를, 아니면 None 반환
+
+    모든 샘플 간격이 평균 간격 dt와 rtol * dt 이내로 같고,
+    t0 + i * dt로 복원한 값의 누적 오차도 rtol * dt 이내여야 합니다.
+    """
+    count = len(timestamps)
+    if count < 2:
+        return None
+
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    t0 = float(timestamps[0])
+    dt = float(timestamps[-1] - timestamps[0]) / (count - 1)
+    if not np.isfinite(dt) or dt <= 0:
+        return None
+
+    tolerance = rtol * dt
+    if float(np.abs(np.diff(timestamps) - dt).max()) > tolerance:
+        return None
+
+    error = np.abs(timestamps - (t0 + np.arange(count) * dt))
+    if float(error.max()) > tolerance:
+        return None
+    return t0, dt
+
+
+def estimate_sample_rate(timestamps: np.ndarray) -> Optional[float]:
+    """샘플레이트 추정 (양수 샘플 간격의 중앙값 기준이라 지터와 결측 구간에 강함)"""
+    if len(timestamps) < 2:
+        return None
+
+    diffs = np.diff(np.asarray(timestamps, dtype=np.float64))
+    diffs = diffs[diffs > 0]
+    if len(diffs) == 0:
+        return None
+    return 1.0 / float(np.median(diffs))
+
+
+class ChannelArrays:
+    """numpy 배열 형태의 채널 데이터 (원본 dtype 유지)"""
+
+    def __init__(self, name: str, unit: str, timestamps: np.ndarray, samples: np.ndarray, has_time_axis: bool = True):
+        self.name = name
+        self.unit = unit
+        self.timestamps = timestamps
+        self.samples = samples
+        self.has_time_axis = has_time_axis  # False면 timestamps는 행 인덱스
+
+    @classmethod
+    def empty(cls, name: str, unit: str = "") -> 'ChannelArrays':
+        """조회 실패 시 사용하는 빈 채널"""
+        return cls(name, unit, np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64))
+
+    def numeric_samples(self) -> Optional[np.ndarray]:
+        """숫자로 전송할 수 있는 1차원 샘플 (구조체/바이트/다차원 채널처럼 변환할 수 없으면 None)"""
+        samples = np.asarray(self.samples)
+        if samples.ndim != 1:
+            return None
+        if samples.dtype.kind in 'biuf':
+            return samples
+        try:
+            return samples.astype(np.float64)
+        except (TypeError, ValueError):
+            return None
+
+    @property
+    def sample_rate(self) -> Optional[float]:
+        """샘플레이트 (시간축이 없으면 None)"""
+        if not self.has_time_axis:
+            return None
+        return estimate_sample_rate(self.timestamps)
+
+    def to_channel_data(self, compress_timestamps: bool = True) -> ChannelData:
+        """JSON 응답용 ChannelData로 변환
+
+        compress_timestamps가 True이고 등간격 신호면 타임스탬프 목록 대신 raster(t0, dt, count)를 채웁니다.
+        """
+        with span('conversion'):
+            samples = self.numeric_samples()
+            if samples is None:
+                # 구조체 채널(CAN_DataFrame 등)은 빈 채널로 보내고 나머지 채널은 그대로 응답
+                return ChannelData(name=self.name, unit=self.unit, timestamps=[], values=[])
+
+            # numpy array를 파이썬 list로 변환
+            values = samples.tolist()
+
+            raster = detect_raster(self.timestamps) if compress_timestamps else None
+            if raster is not None:
+                t0, dt = raster
+                return ChannelData(
+                    name=self.name,
+                    unit=self.unit,
+                    timestamps=[],
+                    raster=TimeRaster(t0=t0, dt=dt, count=len(self.timestamps)),
+                    values=values,
+                    sample_rate=1.0 / dt if self.has_time_axis else None
+                )
+
+            return ChannelData(
+                name=self.name,
+                unit=self.unit,
+                timestamps=self.timestamps.tolist(),
+                values=values,
+                sample_rate=self.sample_rate
+            )
+
+
+def downsample_minmax(arrays: ChannelArrays, max_points: int) -> ChannelArrays:
+    """구간별 최솟값/최댓값만 남기는 미리보기용 다운샘플링
+
+    피크가 사라지지 않도록 각 구간에서 최솟값과 최댓값 샘플을 모두 유지합니다.
+    """
+    sample_count = min(len(arrays.timestamps), len(arrays.samples))
+    if sample_count <= max_points or arrays.samples.ndim != 1:
+        return arrays
+
+    try:
+        values = np.asarray(arrays.samples[:sample_count], dtype=float)
+    except (TypeError, ValueError):
+        return arrays
+
+    bin_size = int(np.ceil(sample_count / max(max_points // 2, 1)))
+    bin_count = int(np.ceil(sample_count / bin_size))
+
+    # 마지막 구간을 NaN으로 채워 (bin_count, bin_size) 모양으로 맞춤
+    padded = np.full(bin_count * bin_size, np.nan)
+    padded[:sample_count] = values
+    bins = padded.reshape(bin_count, bin_size)
+    offsets = np.arange(bin_count) * bin_size
+
+    # 모든 값이 NaN인 구간은 첫 샘플을 사용
+    with np.errstate(invalid='ignore'):
+        all_nan = np.isnan(bins).all(axis=1)
+        bins[all_nan, 0] = 0.0
+        min_idx = np.nanargmin(bins, axis=1) + offsets
+        max_idx = np.nanargmax(bins, axis=1) + offsets
+
+    indices = np.unique(np.concatenate([min_idx, max_idx]))
+
+    return ChannelArrays(
+        arrays.name,
+        arrays.unit,
+        arrays.timestamps[indices],
+        arrays.samples[indices],
+        has_time_axis=arrays.has_time_axis
+    )
+
+
+class TailCursor:
+    """라이브 테일 모드의 읽기 위치 (테일 스트림마다 하나씩 유지)"""
+
+    def __init__(self):
+        self.file_size = -1  # 마지막으로 확인한 파일 크기
+        self.offset = 0  # CSV: 마지막으로 파싱한 줄의 끝 바이트 위치
+        self.rows = 0  # CSV: 지금까지 파싱한 데이터 행 수
+        self.last_timestamps: Dict[str, float] = {}  # MDF: 채널별 마지막 전송 타임스탬프
+
+    def reset(self):
+        """파일이 잘리거나 교체된 경우 처음부터 다시 읽도록 초기화"""
+        self.file_size = -1
+        self.offset = 0
+        self.rows = 0
+        self.last_timestamps = {}
+
+
+def _signal_summary(signal) -> dict:
+    """카탈로그용 신호 요약 (단위, 설명, 샘플 수, dtype, 최솟값/최댓값)"""
+    samples = getattr(signal, 'samples', None)
+    summary = {
+        'unit': getattr(signal, 'unit', "") or "",
+        'description': getattr(signal, 'comment', "") or "",
+        'sample_count': 0,
+        'data_type': "float64",
+    }
+    if samples is None:
+        return summary
+
+    summary['sample_count'] = len(samples)
+    summary['data_type'] = str(samples.dtype)
+    if len(samples) > 0 and samples.dtype.kind in 'biuf':
+        summary['min_value'] = float(np.min(samples))
+        summary['max_value'] = float(np.max(samples))
+    return summary
+
+
 class MDFProcessor:
     """MDF 파일 처리 클래스"""
     
     def __init__(self):
-        self.use_simulation = not HAS_ASAMMDF
+        # MDF_VIEWER_SIMULATION=1이면 asammdf가 있어도 합성 데이터 사용 (부하 테스트용)
+        self.use_simulation = not HAS_ASAMMDF or os.environ.get('MDF_VIEWER_SIMULATION') == '1'
+        self.simulation = SyntheticMeasurement.from_env()
         
     def process_file(self, file_path: str) -> MDFInfo:
         """MDF 파일 처리 및 기본 정보 추출"""
@@ -26,10 +229,10 @@ class MDFProcessor:
             return self._simulate_file_info(file_path)
         
         try:
-            if not HAS_ASAMMDF or MDF is None:
+            if not HAS_ASAMMDF:
                 return self._simulate_file_info(file_path)
 
-            with MDF(file_path) as mdf:
+            with asammdf.MDF(file_path) as mdf:
                 # 기본 파일 정보
                 file_size = os.path.getsize(file_path)
                 channel_count = len(mdf.channels_db)
@@ -82,301 +285,345 @@ class MDFProcessor:
     
     def get_channels(self, file_path: str) -> List[ChannelInfo]:
         """채널 목록 추출 - 중복 채널명 처리 개선"""
-        if self.use_simulation:
-            return self._simulate_channels()
-        
+        return self.build_catalog(file_path).to_channel_infos()
+
+    def build_catalog(self, file_path: str) -> ChannelCatalog:
+        """모든 그룹의 채널로 채널 카탈로그 생성
+
+        그룹마다 여러 채널을 MDF.select로 한 번에 디코딩하여 샘플 수, dtype, 최솟값/최댓값을 구하고,
+        중복 채널명에는 그룹 정보를 붙입니다 ("이름", "이름_G1", "이름_G1_C2").
+        버스 로깅 디코딩 결과("<파일 경로>.bus.mf4")가 있으면 디코딩된 신호도 함께 포함합니다.
+        """
+        if self.use_simulation or not HAS_ASAMMDF:
+            return ChannelCatalog.from_channel_infos(self._simulate_channels())
+
         try:
-            if not HAS_ASAMMDF or MDF is None:
-                return self._simulate_channels()
+            with span('file_open', 'mdf'):
+                mdf = asammdf.MDF(file_path)
 
-            with MDF(file_path) as mdf:
-                channels = []
-                processed_channels = set()
+            builder = CatalogBuilder()
+            processed_channels = set()
+            with mdf:
+                self._add_catalog_channels(builder, mdf, processed_channels, SOURCE_FILE)
+
+            if has_decoded(file_path):
+                try:
+                    with span('file_open', 'mdf'):
+                        bus_mdf = asammdf.MDF(decoded_path(file_path))
+                    with bus_mdf:
+                        self._add_catalog_channels(builder, bus_mdf, processed_channels, SOURCE_BUS)
+                except Exception as e:
+                    print(f"Error reading decoded bus signals: {e}")
+
+            return builder.build()
 
-                # 모든 그룹을 순회하여 채널 정보 수집
-                for group_idx, group in enumerate(mdf.groups):
-                    if not hasattr(group, 'channel_group') or not group.channel_group:
-                        continue
-                    
-                    # 그룹 내 모든 채널 처리
-                    ch_nr = getattr(group.channel_group, 'ch_nr', 0)
-                    for ch_idx in range(ch_nr):
-                        try:
-                            # 채널명 먼저 확인
-                            channel = group.channels[ch_idx]
-                            if isinstance(channel.name, bytes):
-                                ch_name = channel.name.decode('utf-8')
-                            else:
-                                ch_name = str(channel.name)
-                            
-                            # 채널명이 중복되는 경우 그룹 인덱스 추가
-                            original_name = ch_name
-                            if ch_name in processed_channels:
-                                ch_name = f"{original_name}_G{group_idx}"
-                            
-                            # 여전히 중복이면 채널 인덱스도 추가
-                            counter = 1
-                            while ch_name in processed_channels:
-                                ch_name = f"{original_name}_G{group_idx}_C{counter}"
-                                counter += 1
-                            
-                            processed_channels.add(ch_name)
-                            
-                            # 신호 데이터 가져오기 (그룹과 인덱스 명시)
-                            try:
-                                signal = mdf.get(group=group_idx, index=ch_idx)
-                            except:
-                                # 이름으로 시도 (첫 번째 발생만 가져옴)
-                                try:
-                                    signal = mdf.get(original_name, group=group_idx, index=ch_idx)
-                                except:
-                                    signal = mdf.get(original_name)
-                            
-                            # 채널 기본 정보
-                            unit = signal.unit if hasattr(signal, 'unit') else ""
-                            description = signal.comment if hasattr(signal, 'comment') else ""
-                            sample_count = len(signal.samples) if hasattr(signal, 'samples') and signal.samples is not None else 0
-                            
-                            # 데이터 타입 결정
-                            data_type = "float64"
-                            if hasattr(signal, 'samples') and signal.samples is not None:
-                                data_type = str(signal.samples.dtype)
-                            
-                            # 최솟값, 최댓값 계산
-                            min_value = None
-                            max_value = None
-                            if hasattr(signal, 'samples') and signal.samples is not None and len(signal.samples) > 0:
-                                try:
-                                    min_value = float(np.min(signal.samples))
-                                    max_value = float(np.max(signal.samples))
-                                except:
-                                    pass
-                            
-                            channel_info = ChannelInfo(
-                                name=ch_name,
-                                unit=unit,
-                                description=description,
-                                sample_count=sample_count,
-                                data_type=data_type,
-                                min_value=min_value,
-                                max_value=max_value
-                            )
-                            channels.append(channel_info)
-                            
-                        except Exception as e:
-                            print(f"Error processing channel in group {group_idx}, index {ch_idx}: {e}")
-                            continue
-                
-                return sorted(channels, key=lambda x: x.name)
-                
         except Exception as e:
             print(f"Error getting channels: {e}")
-            return self._simulate_channels()
-    
+            return ChannelCatalog.from_channel_infos(self._simulate_channels())
+
+    def _add_catalog_channels(self, builder: CatalogBuilder, mdf, processed_channels: set, source: int):
+        """MDF의 모든 그룹 채널을 카탈로그에 추가 (디코딩 결과 파일은 그룹별 시간 채널 제외)"""
+        for group_idx, group in enumerate(mdf.groups):
+            channel_group = getattr(group, 'channel_group', None)
+            channel_count = len(getattr(group, 'channels', None) or [])
+            if not channel_group or not channel_count:
+                continue
+
+            # 디코딩할 샘플 수가 너무 많지 않도록 그룹을 나누어 select
+            cycles = max(int(getattr(channel_group, 'cycles_nr', 0) or 0), 1)
+            batch = max(1, CATALOG_SELECT_SAMPLES // cycles)
+            first_channel = 1 if source == SOURCE_BUS else 0
+
+            for first in range(first_channel, channel_count, batch):
+                indices = list(range(first, min(first + batch, channel_count)))
+                with span('signal_decode', 'mdf'):
+                    signals = self._select_signals(mdf, group_idx, indices)
+
+                for ch_idx, signal in zip(indices, signals):
+                    if signal is None:
+                        continue
+
+                    # 채널명이 중복되는 경우 그룹 인덱스 추가
+                    original_name = str(signal.name)
+                    ch_name = original_name
+                    if ch_name in processed_channels:
+                        ch_name = f"{original_name}_G{group_idx}"
+
+                    # 여전히 중복이면 채널 인덱스도 추가
+                    counter = 1
+                    while ch_name in processed_channels:
+                        ch_name = f"{original_name}_G{group_idx}_C{counter}"
+                        counter += 1
+
+                    processed_channels.add(ch_name)
+                    builder.add(ch_name, group=group_idx, index=ch_idx, source=source, **_signal_summary(signal))
+
+    def catalog(self, file_path: str) -> ChannelCatalog:
+        """세션당 한 번 만드는 채널 카탈로그 (버스 디코딩 결과가 바뀌면 다시 생성)"""
+        return cached_catalog(file_path, lambda: self.build_catalog(file_path), related=[decoded_path(file_path)])
+
+    def _select_signals(self, mdf, group_idx: int, indices: List[int]) -> list:
+        """그룹의 여러 채널을 한 번에 디코딩 (실패하면 채널별로 조회, 조회할 수 없는 채널은 None)"""
+        try:
+            return mdf.select([(None, group_idx, ch_idx) for ch_idx in indices])
+        except Exception:
+            signals = []
+            for ch_idx in indices:
+                try:
+                    signals.append(mdf.get(group=group_idx, index=ch_idx))
+                except Exception as e:
+                    print(f"Error processing channel in group {group_idx}, index {ch_idx}: {e}")
+                    signals.append(None)
+            return signals
+
     def get_channel_data(self, file_path: str, channel_names: List[str]) -> List[ChannelData]:
         """선택된 채널들의 데이터 추출 - 중복 채널명 처리 개선"""
+        return list(self.iter_channel_data(file_path, channel_names))
+
+    def iter_channel_data(self, file_path: str, channel_names: List[str]) -> Iterator[ChannelData]:
+        """채널 데이터를 하나씩 추출하여 준비되는 대로 반환 (파일은 한 번만 열기)"""
+        for arrays in self.iter_channel_arrays(file_path, channel_names):
+            yield arrays.to_channel_data()
+
+    def iter_channel_arrays(self, file_path: str, channel_names: List[str]) -> Iterator[ChannelArrays]:
+        """채널별 타임스탬프/샘플 배열을 원본 dtype 그대로 하나씩 반환"""
         if self.use_simulation:
-            return self._simulate_channel_data(channel_names)
-        
+            yield from self._simulate_channel_arrays(channel_names)
+            return
+
+        if not HAS_ASAMMDF:
+            yield from self._simulate_channel_arrays(channel_names)
+            return
+
         try:
-            if not HAS_ASAMMDF or MDF is None:
-                return self._simulate_channel_data(channel_names)
+            with span('file_open', 'mdf'):
+                mdf = asammdf.MDF(file_path)
+        except Exception as e:
+            print(f"Error getting channel data: {e}")
+            yield from self._simulate_channel_arrays(channel_names)
+            return
 
-            with MDF(file_path) as mdf:
-                channel_data = []
-                
+        yield from self._iter_mdf_arrays(mdf, file_path, channel_names)
+
+    def _iter_mdf_arrays(self, mdf, file_path: str, channel_names: List[str]) -> Iterator[ChannelArrays]:
+        """열린 MDF에서 채널별 배열을 하나씩 반환 (반환이 끝나면 MDF를 닫음)"""
+        # 채널 목록을 이미 조회했으면 카탈로그의 (그룹, 인덱스)로 바로 찾음
+        # 디코딩된 버스 신호는 카탈로그로만 찾을 수 있으므로 필요하면 생성
+        catalog = self.catalog(file_path) if has_decoded(file_path) else peek_catalog(file_path)
+        bus_mdf = None
+
+        try:
+            with mdf:
                 for ch_name in channel_names:
                     try:
-                        signal = None
-                        
-                        # 채널명에 그룹 정보가 포함된 경우 파싱
-                        if '_G' in ch_name and ch_name.count('_G') >= 1:
-                            # 예: "t_G1" 또는 "t_G1_C2" 형태
-                            parts = ch_name.split('_G')
-                            original_name = parts[0]
-                            
-                            if len(parts) > 1:
-                                group_part = parts[1]
-                                if '_C' in group_part:
-                                    # "1_C2" -> group_idx=1, ch_idx=2
-                                    group_idx_str, ch_idx_str = group_part.split('_C')
-                                    try:
-                                        group_idx = int(group_idx_str)
-                                        ch_idx = int(ch_idx_str) - 1  # 0-based index
-                                        signal = mdf.get(group=group_idx, index=ch_idx)
-                                    except:
-                                        pass
-                                else:
-                                    # "1" -> group_idx=1
-                                    try:
-                                        group_idx = int(group_part)
-                                        signal = mdf.get(original_name, group=group_idx)
-                                    except:
-                                        pass
-                        
-                        # 기본 방법으로 시도
-                        if signal is None:
-                            try:
-                                # 원본 이름에서 그룹 정보 제거하고 시도
-                                clean_name = ch_name.split('_G')[0]
-                                signal = mdf.get(clean_name)
-                            except:
-                                # 전체 이름으로 시도
-                                signal = mdf.get(ch_name)
-                        
-                        if signal is None:
-                            raise Exception("Signal not found")
-                        
+                        location = catalog.locate(ch_name) if catalog is not None else None
+                        with span('signal_decode', 'mdf'):
+                            if location is not None and location[0] == SOURCE_BUS:
+                                if bus_mdf is None:
+                                    bus_mdf = asammdf.MDF(decoded_path(file_path))
+                                signal = bus_mdf.get(group=location[1], index=location[2])
+                            else:
+                                signal = self._find_signal(mdf, ch_name, catalog)
+
                         # 타임스탬프와 값 추출
-                        timestamps = []
-                        values = []
-                        
+                        timestamps = np.empty(0, dtype=np.float64)
+                        samples = np.empty(0, dtype=np.float64)
+
                         if hasattr(signal, 'timestamps') and signal.timestamps is not None:
-                            timestamps = signal.timestamps.tolist()
-                        
+                            timestamps = np.asarray(signal.timestamps)
+
                         if hasattr(signal, 'samples') and signal.samples is not None:
-                            # numpy array를 파이썬 list로 변환
-                            try:
-                                values = signal.samples.tolist()
-                            except:
-                                # 복잡한 데이터 타입의 경우
-                                values = [float(x) if np.isfinite(x) else 0.0 for x in signal.samples.flatten()]
-                        
-                        # 샘플레이트 계산
-                        sample_rate = None
-                        if len(timestamps) > 1:
-                            dt = timestamps[1] - timestamps[0]
-                            sample_rate = 1.0 / dt if dt > 0 else None
-                        
+                            samples = np.asarray(signal.samples)
+
                         unit = signal.unit if hasattr(signal, 'unit') else ""
-                        
-                        data = ChannelData(
-                            name=ch_name,
-                            unit=unit,
-                            timestamps=timestamps,
-                            values=values,
-                            sample_rate=sample_rate
-                        )
-                        channel_data.append(data)
-                        
+
+                        yield ChannelArrays(ch_name, unit, timestamps, samples)
+
                     except Exception as e:
                         print(f"Error extracting data for channel {ch_name}: {e}")
                         # 에러 발생 시 빈 데이터로 처리
-                        data = ChannelData(
-                            name=ch_name,
-                            unit="",
-                            timestamps=[],
-                            values=[],
-                            sample_rate=None
-                        )
-                        channel_data.append(data)
-                
-                return channel_data
-                
+                        yield ChannelArrays.empty(ch_name)
+        finally:
+            if bus_mdf is not None:
+                bus_mdf.close()
+
+    def _find_signal(self, mdf, ch_name: str, catalog: Optional[ChannelCatalog] = None):
+        """표시용 채널명("이름", "이름_G1", "이름_G1_C2")으로 신호 조회"""
+        location = catalog.locate(ch_name) if catalog is not None else None
+        if location is not None and location[0] == SOURCE_FILE:
+            return mdf.get(group=location[1], index=location[2])
+
+        signal = None
+
+        # 채널명에 그룹 정보가 포함된 경우 파싱
+        if '_G' in ch_name and ch_name.count('_G') >= 1:
+            # 예: "t_G1" 또는 "t_G1_C2" 형태
+            parts = ch_name.split('_G')
+            original_name = parts[0]
+
+            if len(parts) > 1:
+                group_part = parts[1]
+                if '_C' in group_part:
+                    # "1_C2" -> group_idx=1, ch_idx=2
+                    group_idx_str, ch_idx_str = group_part.split('_C')
+                    try:
+                        group_idx = int(group_idx_str)
+                        ch_idx = int(ch_idx_str) - 1  # 0-based index
+                        signal = mdf.get(group=group_idx, index=ch_idx)
+                    except:
+                        pass
+                else:
+                    # "1" -> group_idx=1
+                    try:
+                        group_idx = int(group_part)
+                        signal = mdf.get(original_name, group=group_idx)
+                    except:
+                        pass
+
+        # 기본 방법으로 시도
+        if signal is None:
+            try:
+                # 원본 이름에서 그룹 정보 제거하고 시도
+                clean_name = ch_name.split('_G')[0]
+                signal = mdf.get(clean_name)
+            except:
+                # 전체 이름으로 시도
+                signal = mdf.get(ch_name)
+
+        if signal is None:
+            raise Exception("Signal not found")
+
+        return signal
+
+    def _resolve_channel(self, mdf, ch_name: str, catalog: Optional[ChannelCatalog] = None) -> Optional[tuple]:
+        """표시용 채널명을 MDF.filter에 넘길 (이름, 그룹, 인덱스)로 변환 (_find_signal과 같은 규칙)"""
+        location = catalog.locate(ch_name) if catalog is not None else None
+        if location is not None and location[0] == SOURCE_FILE:
+            return (None, location[1], location[2])
+
+        if '_G' in ch_name:
+            original_name, _, group_part = ch_name.partition('_G')
+            try:
+                if '_C' in group_part:
+                    group_idx_str, ch_idx_str = group_part.split('_C')
+                    return (None, int(group_idx_str), int(ch_idx_str) - 1)
+                group_idx = int(group_part)
+                for group, index in mdf.whereis(original_name):
+                    if group == group_idx:
+                        return (original_name, group, index)
+            except ValueError:
+                pass
+
+        for name in (ch_name.split('_G')[0], ch_name):
+            occurrences = mdf.whereis(name)
+            if occurrences:
+                group, index = occurrences[0]
+                return (name, group, index)
+        return None
+
+    def export_mf4(self, file_path: str, channel_names: List[str], output_path: str) -> bool:
+        """선택된 채널만 담은 MF4 작성 (MDF.filter 사용, 불가능하면 False)"""
+        if self.use_simulation or not HAS_ASAMMDF:
+            return False
+
+        try:
+            with span('file_open', 'mdf'):
+                mdf = asammdf.MDF(file_path)
         except Exception as e:
-            print(f"Error getting channel data: {e}")
-            return self._simulate_channel_data(channel_names)
-    
+            print(f"Error opening MDF for export: {e}")
+            return False
+
+        catalog = self.catalog(file_path) if has_decoded(file_path) else peek_catalog(file_path)
+        if catalog is not None and any(
+            (catalog.locate(ch_name) or (SOURCE_FILE,))[0] == SOURCE_BUS for ch_name in channel_names
+        ):
+            # 디코딩된 버스 신호는 원본 파일에 없으므로 배열로 MF4 작성
+            mdf.close()
+            return False
+
+        with mdf:
+            selection = []
+            for ch_name in channel_names:
+                resolved = self._resolve_channel(mdf, ch_name, catalog)
+                if resolved is None:
+                    print(f"Error exporting channel {ch_name}: Signal not found")
+                    continue
+                selection.append(resolved)
+
+            if not selection:
+                return False
+
+            filtered = mdf.filter(selection)
+            try:
+                filtered.save(output_path, overwrite=True)
+            finally:
+                filtered.close()
+        return True
+
+    def read_appended(self, file_path: str, channel_names: List[str], cursor: TailCursor) -> List[ChannelData]:
+        """마지막 전송 이후 추가된 샘플만 반환 (라이브 테일 모드)
+
+        MDF는 바이트 단위로 이어 읽을 수 없으므로 파일을 다시 열고,
+        채널별 마지막 타임스탬프 이후의 샘플만 잘라서 돌려줍니다.
+        열린 MDF 객체는 이후에 추가된 블록을 보지 못하므로 재사용하지 않으며, 그 대신
+        FileProcessor.read_appended가 파일 크기가 바뀐 폴링에서만 이 함수를 호출합니다.
+        따라서 폴링 비용은 크기가 같으면 stat 한 번, 커졌으면 선택 채널 전체 디코딩(파일 길이에 비례)입니다.
+        로거가 아직 쓰는 중이라 파일을 열 수 없으면 이번 폴링은 건너뛰고 다음 폴링에서 다시 시도합니다.
+        """
+        if self.use_simulation or not HAS_ASAMMDF:
+            channel_arrays = self._simulate_channel_arrays(channel_names)
+        else:
+            try:
+                with span('file_open', 'mdf'):
+                    mdf = asammdf.MDF(file_path)
+            except Exception as e:
+                # 시뮬레이션 데이터를 보내면 last_timestamps가 앞서가 실제 샘플을 놓치므로 건너뜀
+                print(f"MDF not readable yet, skipping tail poll: {e}")
+                cursor.file_size = -1
+                return []
+            channel_arrays = self._iter_mdf_arrays(mdf, file_path, channel_names)
+
+        appended = []
+
+        for arrays in channel_arrays:
+            last_timestamp = cursor.last_timestamps.get(arrays.name)
+            start = 0
+            if last_timestamp is not None:
+                start = int(np.searchsorted(arrays.timestamps, last_timestamp, side='right'))
+
+            timestamps = arrays.timestamps[start:]
+            if len(timestamps) > 0:
+                cursor.last_timestamps[arrays.name] = float(timestamps[-1])
+
+            appended.append(ChannelArrays(
+                arrays.name, arrays.unit, timestamps, arrays.samples[start:]
+            ).to_channel_data())
+
+        return appended
+
     def _simulate_file_info(self, file_path: str) -> MDFInfo:
         """시뮬레이션된 파일 정보"""
         file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 1024000
-        
-        return MDFInfo(
-            version="4.10",
-            file_size=file_size,
-            channel_count=200,
-            measurement_start=datetime.now(),
-            measurement_duration=100.0,
-            measurement_comment="Simulated MDF file for testing",
-            vehicle_identification="SIM_VEHICLE_001",
-            recorder_identification="SIM_RECORDER_001"
-        )
+        return self.simulation.file_info(file_size)
     
     def _simulate_channels(self) -> List[ChannelInfo]:
         """시뮬레이션된 채널 목록"""
-        prefixes = ['ENGINE_', 'VEHICLE_', 'BRAKE_', 'TRANSMISSION_', 'ECU_', 'SENSOR_']
-        suffixes = ['TEMP', 'PRESSURE', 'SPEED', 'VOLTAGE', 'CURRENT', 'POSITION', 'ANGLE', 'TORQUE']
-        units = ['°C', 'bar', 'km/h', 'V', 'A', 'mm', '°', 'Nm']
-        
-        channels = []
-        
-        for i in range(200):
-            prefix = prefixes[i % len(prefixes)]
-            suffix = suffixes[i % len(suffixes)]
-            unit = units[i % len(units)]
-            number = str(i + 1).zfill(3)
-            
-            channel_name = f"{prefix}{suffix}_{number}"
-            
-            # 시뮬레이션된 값 범위
-            min_val = np.random.uniform(-100, 0)
-            max_val = np.random.uniform(min_val + 10, min_val + 200)
-            
-            channel = ChannelInfo(
-                name=channel_name,
-                unit=unit,
-                description=f"Simulated channel {channel_name}",
-                sample_count=1000,
-                data_type="float64",
-                min_value=min_val,
-                max_value=max_val
-            )
-            channels.append(channel)
-        
-        return sorted(channels, key=lambda x: x.name)
+        return self.simulation.channel_infos()
     
-    def _simulate_channel_data(self, channel_names: List[str]) -> List[ChannelData]:
-        """시뮬레이션된 채널 데이터"""
-        channel_data = []
-        
-        # 공통 타임스탬프 생성 (0.1초 간격으로 100초)
-        time_points = 1000
-        time_step = 0.1
-        timestamps = [i * time_step for i in range(time_points)]
-        
+    def _simulate_channel_arrays(self, channel_names: List[str]) -> Iterator[ChannelArrays]:
+        """시뮬레이션된 채널 데이터 (채널별로 필요할 때 생성)"""
         for ch_name in channel_names:
-            # 채널별 시뮬레이션된 데이터 생성
-            np.random.seed(hash(ch_name) % 2**32)  # 채널명 기반으로 일관된 시드
-            
-            frequency = np.random.uniform(0.5, 2.5)  # 0.5-2.5 Hz
-            amplitude = np.random.uniform(10, 110)   # 10-110 범위
-            offset = np.random.uniform(-25, 25)      # -25~25 오프셋
-            
-            values = []
-            for i, t in enumerate(timestamps):
-                # 기본 사인파 + 노이즈
-                base_value = amplitude * np.sin(frequency * t * 2 * np.pi) + offset
-                noise = np.random.normal(0, amplitude * 0.05)  # 5% 노이즈
-                values.append(base_value + noise)
-            
-            # 단위 결정
-            unit_mapping = {
-                'TEMP': '°C',
-                'PRESSURE': 'bar', 
-                'SPEED': 'km/h',
-                'VOLTAGE': 'V',
-                'CURRENT': 'A',
-                'POSITION': 'mm',
-                'ANGLE': '°',
-                'TORQUE': 'Nm'
-            }
-            
-            unit = ""
-            for key, val in unit_mapping.items():
-                if key in ch_name:
-                    unit = val
-                    break
-            
-            data = ChannelData(
-                name=ch_name,
-                unit=unit,
-                timestamps=timestamps,
-                values=values,
-                sample_rate=1.0 / time_step
-            )
-            channel_data.append(data)
+            channel = self.simulation.get(ch_name)
+            timestamps, samples = self.simulation.read(channel)
+            yield ChannelArrays(ch_name, channel.unit, timestamps, samples)
+
 
-        return channel_data
+def _split_unit(column: str):
+    """"Temperature (°C)" 형식의 컬럼명을 (이름, 단위)로 분리"""
+    if "(" in column and ")" in column:
+        parts = column.split("(")
+        return "(".join(parts[:-1]).strip(), parts[-1].strip(")")
+    return column, ""
 
 
 class CSVProcessor:
@@ -385,8 +632,25 @@ class CSVProcessor:
     def __init__(self):
         pass
 
+    def prepare_file(self, file_path: str) -> bool:
+        """업로드된 CSV를 컬럼별 바이너리 사이드카로 변환
+
+        이후 get_channels/통계/데이터 조회는 텍스트를 다시 파싱하지 않고 mmap에서 읽습니다.
+        변환에 실패하면 기존처럼 CSV를 직접 파싱합니다.
+        """
+        try:
+            build_sidecar(file_path)
+            return True
+        except Exception as e:
+            print(f"Error building CSV sidecar: {e}")
+            return False
+
     def process_file(self, file_path: str) -> MDFInfo:
         """CSV 파일 처리 및 기본 정보 추출"""
+        sidecar = open_sidecar(file_path)
+        if sidecar is not None:
+            return self._sidecar_file_info(file_path, sidecar)
+
         try:
             # CSV 파일 읽기 (첫 몇 줄만 읽어서 구조 파악)
             df_sample = pd.read_csv(file_path, nrows=5)
@@ -449,6 +713,10 @@ class CSVProcessor:
 
     def get_channels(self, file_path: str) -> List[ChannelInfo]:
         """CSV 파일에서 채널 목록 추출"""
+        sidecar = open_sidecar(file_path)
+        if sidecar is not None:
+            return self._sidecar_catalog(sidecar).to_channel_infos()
+
         try:
             # CSV 파일의 헤더와 샘플 데이터 읽기
             df = pd.read_csv(file_path, nrows=100)  # 처음 100행만 읽어서 분석
@@ -526,110 +794,182 @@ class CSVProcessor:
             print(f"Error getting channels from CSV: {e}")
             return []
 
+    def build_catalog(self, file_path: str) -> ChannelCatalog:
+        """채널 카탈로그 생성 (컬럼 순서 유지)"""
+        sidecar = open_sidecar(file_path)
+        if sidecar is not None:
+            return self._sidecar_catalog(sidecar)
+        return ChannelCatalog.from_channel_infos(self.get_channels(file_path))
+
     def get_channel_data(self, file_path: str, channel_names: List[str]) -> List[ChannelData]:
         """선택된 채널들의 데이터 추출"""
+        return list(self.iter_channel_data(file_path, channel_names))
+
+    def iter_channel_data(self, file_path: str, channel_names: List[str]) -> Iterator[ChannelData]:
+        """선택된 채널들의 데이터를 하나씩 반환 (CSV는 한 번에 파싱)"""
+        for arrays in self.iter_channel_arrays(file_path, channel_names):
+            yield arrays.to_channel_data()
+
+    def iter_channel_arrays(self, file_path: str, channel_names: List[str]) -> Iterator[ChannelArrays]:
+        """선택된 채널들의 타임스탬프/샘플 배열을 하나씩 반환"""
+        with span('file_open', 'csv'):
+            sidecar = open_sidecar(file_path)
+        if sidecar is not None:
+            yield from self._sidecar_arrays(sidecar, channel_names)
+            return
+
         try:
             # CSV 파일 전체 읽기
-            df = pd.read_csv(file_path)
+            with span('file_open', 'csv'):
+                df = pd.read_csv(file_path)
+            with span('signal_decode', 'csv'):
+                channel_arrays = self._extract_arrays(df, channel_names)
+
+        except Exception as e:
+            print(f"Error getting CSV channel data: {e}")
+            return
 
-            channel_data = []
+        yield from channel_arrays
 
-            # 시간 컬럼 찾기 (첫 번째 컬럼을 시간으로 가정)
-            time_column = None
-            timestamps = []
+    def read_appended(self, file_path: str, channel_names: List[str], cursor: TailCursor) -> List[ChannelData]:
+        """마지막으로 읽은 위치 이후에 추가된 행만 파싱 (라이브 테일 모드)"""
+        with open(file_path, 'rb') as f:
+            header = f.readline()
+            if not header.endswith(b'\n'):
+                # 헤더조차 아직 다 기록되지 않음
+                return []
 
-            if len(df.columns) > 0:
-                first_col = df.iloc[:, 0]
-                if pd.api.types.is_numeric_dtype(first_col):
-                    time_column = df.columns[0]
-                    timestamps = first_col.fillna(0).tolist()
+            cursor.offset = max(cursor.offset, len(header))
+            f.seek(cursor.offset)
+            chunk = f.read()
 
-                # 시간 컬럼이 없으면 인덱스 기반으로 생성
-                if not timestamps:
-                    timestamps = list(range(len(df)))
+        # 기록 중인 마지막 줄은 다음 폴링에서 읽음
+        end = chunk.rfind(b'\n')
+        if end < 0:
+            return []
+        chunk = chunk[:end + 1]
 
-            for ch_name in channel_names:
-                try:
-                    # 채널명 매칭 (단위가 포함된 경우 처리)
-                    matching_columns = []
+        df = pd.read_csv(io.BytesIO(header + chunk))
+        cursor.offset += len(chunk)
 
-                    for col in df.columns:
-                        # 정확히 일치하는 경우
-                        if col == ch_name:
+        channel_arrays = self._extract_arrays(df, channel_names, first_row=cursor.rows)
+        cursor.rows += len(df)
+        return [arrays.to_channel_data() for arrays in channel_arrays]
+
+    def _sidecar_file_info(self, file_path: str, sidecar: CSVSidecar) -> MDFInfo:
+        """사이드카 헤더 인덱스로 파일 정보 생성"""
+        column_count = len(sidecar.columns)
+        channel_count = max(column_count - 1, 0)
+        return MDFInfo(
+            version="CSV",
+            file_size=os.path.getsize(file_path),
+            channel_count=channel_count,
+            measurement_start=datetime.now() if sidecar.rows > 0 else None,
+            measurement_duration=sidecar.duration,
+            measurement_comment=f"CSV file with {sidecar.rows} rows, {column_count} columns ({channel_count} data channels + time axis)",
+            vehicle_identification="",
+            recorder_identification=""
+        )
+
+    def _sidecar_catalog(self, sidecar: CSVSidecar) -> ChannelCatalog:
+        """사이드카 헤더 인덱스로 채널 카탈로그 생성 (최솟값/최댓값은 전체 행 기준)"""
+        builder = CatalogBuilder()
+        for i, column in enumerate(sidecar.columns):
+            # 첫 번째 컬럼(시간축)은 채널 목록에서 제외
+            if i == 0:
+                continue
+
+            name, unit = _split_unit(column['column'])
+            builder.add(
+                name,
+                unit=unit,
+                description=f"Column {i+1}: {name}",
+                sample_count=sidecar.rows,
+                data_type=column['data_type'],
+                min_value=column['min'] if column['numeric'] else None,
+                max_value=column['max'] if column['numeric'] else None
+            )
+        return builder.build(sort=False)
+
+    def _sidecar_arrays(self, sidecar: CSVSidecar, channel_names: List[str]) -> Iterator[ChannelArrays]:
+        """사이드카 mmap에서 채널 배열 반환 (파싱/복사 없음)"""
+        timestamps = sidecar.timestamps()
+        has_time_column = sidecar.has_time_axis
+
+        for ch_name in channel_names:
+            column = sidecar.find_column(ch_name)
+            if column is None:
+                # 매칭되는 컬럼이 없으면 빈 데이터로 처리
+                yield ChannelArrays(ch_name, "", timestamps, np.empty(0, dtype=np.float64), has_time_axis=False)
+                continue
+
+            with span('signal_decode', 'csv'):
+                samples = sidecar.array(column)
+            yield ChannelArrays(ch_name, _split_unit(column['column'])[1], timestamps, samples, has_time_axis=has_time_column)
+
+    def _extract_arrays(self, df: 'pd.DataFrame', channel_names: List[str], first_row: int = 0) -> List[ChannelArrays]:
+        """DataFrame에서 선택된 채널들의 배열 추출"""
+        channel_arrays = []
+
+        # 시간 컬럼 찾기 (첫 번째 컬럼을 시간으로 가정)
+        has_time_column = False
+        timestamps = np.arange(first_row, first_row + len(df), dtype=np.float64)
+
+        if len(df.columns) > 0:
+            first_col = df.iloc[:, 0]
+            if pd.api.types.is_numeric_dtype(first_col) and len(first_col) > 0:
+                has_time_column = True
+                timestamps = first_col.fillna(0).to_numpy()
+
+        for ch_name in channel_names:
+            try:
+                # 채널명 매칭 (단위가 포함된 경우 처리)
+                matching_columns = []
+
+                for col in df.columns:
+                    # 정확히 일치하는 경우
+                    if col == ch_name:
+                        matching_columns.append(col)
+                        break
+                    # 단위가 포함된 컬럼명에서 추출한 이름과 일치하는 경우
+                    elif "(" in col and ")" in col:
+                        clean_name = col.split("(")[0].strip()
+                        if clean_name == ch_name:
                             matching_columns.append(col)
                             break
-                        # 단위가 포함된 컬럼명에서 추출한 이름과 일치하는 경우
-                        elif "(" in col and ")" in col:
-                            clean_name = col.split("(")[0].strip()
-                            if clean_name == ch_name:
-                                matching_columns.append(col)
-                                break
-
-                    if not matching_columns:
-                        # 매칭되는 컬럼이 없으면 빈 데이터로 처리
-                        data = ChannelData(
-                            name=ch_name,
-                            unit="",
-                            timestamps=timestamps if timestamps else [],
-                            values=[],
-                            sample_rate=None
-                        )
-                        channel_data.append(data)
-                        continue
 
-                    actual_column = matching_columns[0]
-                    column_data = df[actual_column].fillna(0)
+                if not matching_columns:
+                    # 매칭되는 컬럼이 없으면 빈 데이터로 처리
+                    channel_arrays.append(ChannelArrays(
+                        ch_name, "", timestamps, np.empty(0, dtype=np.float64), has_time_axis=False
+                    ))
+                    continue
 
-                    # 값 추출
-                    values = []
-                    if pd.api.types.is_numeric_dtype(column_data):
-                        values = column_data.tolist()
-                    else:
-                        # 문자열 데이터의 경우 숫자로 변환 시도
-                        for val in column_data:
-                            try:
-                                values.append(float(val))
-                            except:
-                                values.append(0.0)
+                actual_column = matching_columns[0]
+                column_data = df[actual_column].fillna(0)
 
-                    # 단위 추출
-                    unit = ""
-                    if "(" in actual_column and ")" in actual_column:
-                        unit_part = actual_column.split("(")[-1].strip(")")
-                        unit = unit_part
-
-                    # 샘플레이트 계산
-                    sample_rate = None
-                    if len(timestamps) > 1 and time_column:
-                        dt = timestamps[1] - timestamps[0]
-                        sample_rate = 1.0 / dt if dt > 0 else None
-
-                    data = ChannelData(
-                        name=ch_name,
-                        unit=unit,
-                        timestamps=timestamps,
-                        values=values,
-                        sample_rate=sample_rate
-                    )
-                    channel_data.append(data)
+                # 값 추출 (문자열 데이터는 숫자로 변환 시도)
+                if pd.api.types.is_numeric_dtype(column_data):
+                    samples = column_data.to_numpy()
+                else:
+                    samples = pd.to_numeric(column_data, errors='coerce').fillna(0.0).to_numpy(dtype=np.float64)
 
-                except Exception as e:
-                    print(f"Error extracting data for CSV channel {ch_name}: {e}")
-                    # 에러 발생 시 빈 데이터로 처리
-                    data = ChannelData(
-                        name=ch_name,
-                        unit="",
-                        timestamps=timestamps if timestamps else [],
-                        values=[],
-                        sample_rate=None
-                    )
-                    channel_data.append(data)
+                # 단위 추출
+                unit = ""
+                if "(" in actual_column and ")" in actual_column:
+                    unit_part = actual_column.split("(")[-1].strip(")")
+                    unit = unit_part
 
-            return channel_data
+                channel_arrays.append(ChannelArrays(ch_name, unit, timestamps, samples, has_time_axis=has_time_column))
 
-        except Exception as e:
-            print(f"Error getting CSV channel data: {e}")
-            return []
+            except Exception as e:
+                print(f"Error extracting data for CSV channel {ch_name}: {e}")
+                # 에러 발생 시 빈 데이터로 처리
+                channel_arrays.append(ChannelArrays(
+                    ch_name, "", timestamps, np.empty(0, dtype=np.float64), has_time_axis=False
+                ))
+
+        return channel_arrays
 
 
 class FileProcessor:
@@ -649,6 +989,11 @@ class FileProcessor:
         else:
             return 'unknown'
 
+    def prepare_file(self, file_path: str):
+        """업로드 직후 한 번 수행하는 전처리 (CSV는 컬럼별 바이너리 사이드카 생성)"""
+        if self.detect_file_type(file_path) == 'csv':
+            self.csv_processor.prepare_file(file_path)
+
     def process_file(self, file_path: str) -> MDFInfo:
         """파일 타입에 따른 처리"""
         file_type = self.detect_file_type(file_path)
@@ -662,12 +1007,16 @@ class FileProcessor:
 
     def get_channels(self, file_path: str) -> List[ChannelInfo]:
         """파일 타입에 따른 채널 목록 추출"""
+        return self.get_catalog(file_path).to_channel_infos()
+
+    def get_catalog(self, file_path: str) -> ChannelCatalog:
+        """파일 타입에 따른 채널 카탈로그 (파일이 바뀌지 않으면 세션당 한 번만 생성)"""
         file_type = self.detect_file_type(file_path)
 
         if file_type == 'mdf':
-            return self.mdf_processor.get_channels(file_path)
+            return self.mdf_processor.catalog(file_path)
         elif file_type == 'csv':
-            return self.csv_processor.get_channels(file_path)
+            return cached_catalog(file_path, lambda: self.csv_processor.build_catalog(file_path))
         else:
             raise ValueError(f"지원되지 않는 파일 타입입니다: {file_type}")
 
@@ -680,4 +1029,49 @@ class FileProcessor:
         elif file_type == 'csv':
             return self.csv_processor.get_channel_data(file_path, channel_names)
         else:
-            raise ValueError(f"지원되지 않는 파일 타입입니다: {file_type}")
\ No newline at end of file
+            raise ValueError(f"지원되지 않는 파일 타입입니다: {file_type}")
+
+    def iter_channel_data(self, file_path: str, channel_names: List[str]) -> Iterator[ChannelData]:
+        """파일 타입에 따른 채널 데이터를 준비되는 대로 하나씩 반환"""
+        file_type = self.detect_file_type(file_path)
+
+        if file_type == 'mdf':
+            return self.mdf_processor.iter_channel_data(file_path, channel_names)
+        elif file_type == 'csv':
+            return self.csv_processor.iter_channel_data(file_path, channel_names)
+        else:
+            raise ValueError(f"지원되지 않는 파일 타입입니다: {file_type}")
+
+    def get_channel_arrays(self, file_path: str, channel_names: List[str]) -> List[ChannelArrays]:
+        """파일 타입에 따른 채널 배열 추출 (원본 dtype 유지)"""
+        return list(self.iter_channel_arrays(file_path, channel_names))
+
+    def iter_channel_arrays(self, file_path: str, channel_names: List[str]) -> Iterator[ChannelArrays]:
+        """파일 타입에 따른 채널 배열을 준비되는 대로 하나씩 반환"""
+        file_type = self.detect_file_type(file_path)
+
+        if file_type == 'mdf':
+            return self.mdf_processor.iter_channel_arrays(file_path, channel_names)
+        elif file_type == 'csv':
+            return self.csv_processor.iter_channel_arrays(file_path, channel_names)
+        else:
+            raise ValueError(f"지원되지 않는 파일 타입입니다: {file_type}")
+
+    def read_appended(self, file_path: str, channel_names: List[str], cursor: TailCursor) -> List[ChannelData]:
+        """라이브 테일 모드: 파일이 커졌을 때만 추가된 샘플을 읽음"""
+        file_size = os.path.getsize(file_path)
+        if file_size == cursor.file_size:
+            return []
+        if file_size < cursor.file_size:
+            # 로거가 파일을 새로 시작한 경우
+            cursor.reset()
+        cursor.file_size = file_size
+
+        file_type = self.detect_file_type(file_path)
+
+        if file_type == 'mdf':
+            return self.mdf_processor.read_appended(file_path, channel_names, cursor)
+        elif file_type == 'csv':
+            return self.csv_processor.read_appended(file_path, channel_names, cursor)
+        else:
+            raise ValueError(f"지원되지 않는 파일 타입입니다: {file_type}")
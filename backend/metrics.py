@@ -0,0 +1,293 @@
+import os
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import reduce
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool as _run_in_threadpool
+
+try:
+    import pyinstrument  # type: ignore
+    HAS_PYINSTRUMENT = True
+except ImportError:
+    HAS_PYINSTRUMENT = False
+    pyinstrument = None  # type: ignore
+
+# 지연 시간 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 요청별 프로파일링 (MDF_VIEWER_PROFILING=1일 때만 활성화)
+PROFILING_ENABLED = os.environ.get('MDF_VIEWER_PROFILING', '') == '1'
+PROFILE_DIR = os.environ.get('MDF_VIEWER_PROFILE_DIR', os.path.join(tempfile.gettempdir(), 'mdf_viewer_profiles'))
+
+
+def _format_labels(labelnames: Tuple[str, ...], values: Tuple[str, ...], extra: str = '') -> str:
+    """Prometheus 레이블 문자열 생성"""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _escape(value: str) -> str:
+    """레이블 값 이스케이프"""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+class Histogram:
+    """레이블별 누적 버킷 히스토그램 (Prometheus histogram과 동일한 형식)"""
+
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str):
+        """측정값 기록"""
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                # [버킷별 카운트..., 합계, 개수]
+                series = [0.0] * (len(self.buckets) + 2)
+                self._series[labelvalues] = series
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        """Prometheus 텍스트 형식으로 출력"""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labelvalues, series in sorted(self._series.items()):
+                for bound, count in zip(self.buckets, series):
+                    labels = _format_labels(self.labelnames, labelvalues, f'le="{bound}"')
+                    lines.append(f"{self.name}_bucket{labels} {int(count)}")
+                labels = _format_labels(self.labelnames, labelvalues, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{labels} {int(series[-1])}")
+                labels = _format_labels(self.labelnames, labelvalues)
+                lines.append(f"{self.name}_sum{labels} {series[-2]:.6f}")
+                lines.append(f"{self.name}_count{labels} {int(series[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """히스토그램과 게이지 콜백 모음"""
+
+    def __init__(self):
+        self._histograms: List[Histogram] = []
+        self._gauges: List[Tuple[str, str, Callable[[], float]]] = []
+
+    def histogram(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()) -> Histogram:
+        """히스토그램 등록"""
+        histogram = Histogram(name, help_text, labelnames)
+        self._histograms.append(histogram)
+        return histogram
+
+    def gauge(self, name: str, help_text: str, func: Callable[[], float]):
+        """출력 시점에 값을 읽는 게이지 등록"""
+        self._gauges.append((name, help_text, func))
+
+    def render(self) -> str:
+        """/metrics 응답 본문"""
+        lines = []
+        for histogram in self._histograms:
+            lines.extend(histogram.render())
+        for name, help_text, func in self._gauges:
+            try:
+                value = float(func())
+            except Exception:
+                continue
+            lines.extend([f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {value}"])
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+REQUEST_SECONDS = registry.histogram(
+    'mdf_viewer_request_seconds', 'HTTP 요청 처리 시간', ('method', 'route', 'status')
+)
+RESPONSE_SEND_SECONDS = registry.histogram(
+    'mdf_viewer_response_send_seconds', '응답 전송에 걸린 시간', ('route',)
+)
+STAGE_SECONDS = registry.histogram(
+    'mdf_viewer_stage_seconds', '처리 단계별 소요 시간 (file_open, signal_decode, conversion, serialization 등)', ('stage', 'file_type')
+)
+
+
+@contextmanager
+def span(stage: str, file_type: str = ''):
+    """처리 단계 시간 측정
+
+    사용 예:
+        with span('file_open', 'mdf'):
+            mdf = MDF(file_path)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage, file_type)
+
+
+def _route_label(scope) -> str:
+    """세션 ID 등으로 카디널리티가 커지지 않도록 경로 템플릿을 레이블로 사용"""
+    route = scope.get('route')
+    if route is not None and hasattr(route, 'path'):
+        return route.path
+    endpoint = scope.get('endpoint')
+    if endpoint is not None:
+        return getattr(endpoint, '__name__', 'unknown')
+    return 'unmatched'
+
+
+# 현재 요청의 프로파일러 (요청 태스크와 그 요청이 워커 스레드로 넘긴 호출에서만 보임)
+_active_profiler: ContextVar[Optional['_RequestProfiler']] = ContextVar('mdf_viewer_profiler', default=None)
+
+
+class _RequestProfiler:
+    """요청 하나에 대한 cProfile/pyinstrument 프로파일러
+
+    디코딩/직렬화/압축은 run_in_threadpool로 워커 스레드에서 실행되므로, 요청이 워커 스레드로 넘긴
+    호출마다 전용 프로파일러로 측정하고 저장할 때 합칩니다. 이벤트 루프 스레드는 동시에 처리 중인
+    요청들이 함께 쓰므로 측정하지 않습니다 (요청끼리 결과가 섞이지 않음).
+    """
+
+    def __init__(self, kind: str):
+        self.kind = kind if kind == 'pyinstrument' and HAS_PYINSTRUMENT else 'cprofile'
+        self.running = False
+        self._results: List[Any] = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        self.running = True
+
+    def call(self, func: Callable, *args, **kwargs):
+        """워커 스레드에서 func를 이 요청 전용 프로파일러로 실행"""
+        if not self.running:
+            return func(*args, **kwargs)
+
+        if self.kind == 'pyinstrument':
+            profiler = pyinstrument.Profiler(async_mode='disabled')
+            profiler.start()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                result = profiler.stop()
+                with self._lock:
+                    self._results.append(result)
+
+        import cProfile
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args, **kwargs)
+        finally:
+            with self._lock:
+                self._results.append(profiler)
+
+    def stop(self, label: str) -> str:
+        """프로파일을 파일로 저장하고 경로 반환"""
+        self.running = False
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        safe_label = ''.join(ch if ch.isalnum() else '_' for ch in label).strip('_') or 'request'
+        base = os.path.join(PROFILE_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}_{safe_label}_{os.getpid()}_{uuid.uuid4().hex[:8]}")
+
+        with self._lock:
+            results = list(self._results)
+
+        if self.kind == 'pyinstrument':
+            from pyinstrument.renderers import HTMLRenderer
+            from pyinstrument.session import Session
+
+            path = base + '.html'
+            with open(path, 'w', encoding='utf-8') as f:
+                if results:
+                    f.write(HTMLRenderer().render(reduce(Session.combine, results)))
+                else:
+                    f.write('<p>워커 스레드에서 실행된 작업이 없습니다.</p>')
+        else:
+            import pstats
+
+            path = base + '.prof'
+            pstats.Stats(*results).dump_stats(path)
+        return path
+
+
+async def run_in_threadpool(func: Callable, *args, **kwargs):
+    """starlette의 run_in_threadpool과 같으며, 프로파일링 중인 요청이면 워커 스레드 호출을 프로파일"""
+    profiler = _active_profiler.get()
+    if profiler is not None:
+        return await _run_in_threadpool(profiler.call, func, *args, **kwargs)
+    return await _run_in_threadpool(func, *args, **kwargs)
+
+
+def _profile_request(scope) -> Optional[str]:
+    """프로파일링 요청 여부 (X-Profile 헤더 또는 ?profile= 쿼리)"""
+    if not PROFILING_ENABLED:
+        return None
+
+    for name, value in scope.get('headers', []):
+        if name == b'x-profile':
+            return value.decode('latin-1') or 'cprofile'
+
+    query = scope.get('query_string', b'').decode('latin-1')
+    for part in query.split('&'):
+        key, _, value = part.partition('=')
+        if key == 'profile' and value not in ('', '0', 'false'):
+            return value if value == 'pyinstrument' else 'cprofile'
+    return None
+
+
+class MetricsMiddleware:
+    """요청 처리/응답 전송 시간을 기록하고, 요청 시 프로파일을 남기는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = {'code': 500}
+        send_time = {'seconds': 0.0}
+
+        profile_kind = _profile_request(scope)
+        profiler = _RequestProfiler(profile_kind) if profile_kind else None
+
+        async def timed_send(message):
+            if message['type'] == 'http.response.start':
+                status['code'] = message['status']
+                if profiler is not None:
+                    # 프로파일 파일 경로를 응답 헤더로 알려줌
+                    path = profiler.stop(f"{scope['method']}_{scope['path']}")
+                    message['headers'] = list(message.get('headers', [])) + [(b'x-profile-file', path.encode())]
+            send_start = time.perf_counter()
+            await send(message)
+            send_time['seconds'] += time.perf_counter() - send_start
+
+        token = None
+        if profiler is not None:
+            profiler.start()
+            token = _active_profiler.set(profiler)
+
+        try:
+            await self.app(scope, receive, timed_send)
+        finally:
+            if token is not None:
+                _active_profiler.reset(token)
+            if profiler is not None and profiler.running:
+                # 응답을 보내기 전에 예외가 난 경우에도 프로파일 저장
+                profiler.stop(f"{scope['method']}_{scope['path']}")
+            route = _route_label(scope)
+            REQUEST_SECONDS.observe(time.perf_counter() - start, scope['method'], route, str(status['code']))
+            RESPONSE_SEND_SECONDS.observe(send_time['seconds'], route)
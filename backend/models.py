@@ -13,11 +13,21 @@ class ChannelInfo(BaseModel):
     max_value: Optional[float] = None
     conversion_rule: Optional[str] = None
 
+class TimeRaster(BaseModel):
+    """등간격 타임스탬프 표현 (t[i] = t0 + i * dt)"""
+    t0: float
+    dt: float
+    count: int
+
 class ChannelData(BaseModel):
-    """채널 데이터 모델"""
+    """채널 데이터 모델
+
+    등간격 신호는 timestamps를 비우고 raster(t0, dt, count)로 표현합니다.
+    """
     name: str
     unit: str
-    timestamps: List[float]
+    timestamps: List[float] = []
+    raster: Optional[TimeRaster] = None
     values: List[Union[float, int]]
     sample_rate: Optional[float] = None
     
@@ -26,6 +36,28 @@ class ChannelData(BaseModel):
             float: lambda v: round(v, 6) if v is not None else None
         }
 
+class TypedChannelData(BaseModel):
+    """원본 dtype을 유지하는 채널 데이터 전송 모델
+
+    배열은 little-endian 바이트를 base64로 인코딩하여 전송합니다.
+    timestamp_encoding:
+      - "raster": raster 필드만 사용 (등간격 신호)
+      - "delta": t0 + cumsum(timestamps) * time_tick (timestamps는 정수 차분 배열)
+      - "raw": timestamps는 float64 배열
+    """
+    name: str
+    unit: str
+    dtype: str
+    length: int
+    values: str
+    timestamp_encoding: str
+    timestamps_dtype: Optional[str] = None
+    timestamps: Optional[str] = None
+    t0: Optional[float] = None
+    time_tick: Optional[float] = None
+    raster: Optional[TimeRaster] = None
+    sample_rate: Optional[float] = None
+
 class MDFInfo(BaseModel):
     """MDF 파일 기본 정보 모델"""
     version: str
@@ -37,6 +69,41 @@ class MDFInfo(BaseModel):
     vehicle_identification: Optional[str] = ""
     recorder_identification: Optional[str] = ""
     
+class WatchRequest(BaseModel):
+    """서버 로컬 파일 감시(라이브 테일) 요청 모델"""
+    file_path: str
+
+class CorrelationRequest(BaseModel):
+    """채널 간 상관 분석 요청 모델
+
+    max_lag(초)가 0이면 교차상관을, scatter_x/scatter_y가 없으면 XY 2D 히스토그램을 생략합니다.
+    """
+    channel_names: List[str]
+    sample_rate: Optional[float] = None
+    t_start: Optional[float] = None
+    t_end: Optional[float] = None
+    max_lag: float = 0.0
+    reference: Optional[str] = None
+    scatter_x: Optional[str] = None
+    scatter_y: Optional[str] = None
+    bins: int = 100
+
+class SpectrumRequest(BaseModel):
+    """스펙트럼 분석 요청 모델
+
+    mode="welch"는 평균 PSD를 width개 주파수 점으로,
+    mode="stft"는 스펙트로그램을 height(주파수) x width(시간) 격자로 반환합니다.
+    """
+    channel_name: str
+    mode: str = "welch"
+    t_start: Optional[float] = None
+    t_end: Optional[float] = None
+    nperseg: int = 4096
+    overlap: float = 0.5
+    width: int = 1024
+    height: int = 256
+    decibel: bool = True
+
 class UploadResponse(BaseModel):
     """파일 업로드 응답 모델"""
     session_id: str
@@ -0,0 +1,316 @@
+import glob
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+# 세션 저장소 기본 설정 (환경 변수로 변경 가능)
+DEFAULT_STORAGE_DIR = os.path.join(tempfile.gettempdir(), 'mdf_viewer_sessions')
+DEFAULT_TTL = 24 * 3600             # 생성 후 최대 유지 시간 (초)
+DEFAULT_IDLE_TIMEOUT = 2 * 3600     # 마지막 접근 후 유지 시간 (초)
+DEFAULT_QUOTA_MB = 2048             # 업로드 파일 + 캐시 전체 디스크 한도
+DEFAULT_CLEANUP_INTERVAL = 60       # 만료 세션 정리 주기 (초)
+
+# 매 요청마다 DB에 쓰지 않도록 접근 시각은 이 간격 이상 지났을 때만 갱신 (초)
+TOUCH_INTERVAL = 5.0
+
+
+class SessionRecord:
+    """업로드/감시 세션 하나의 메타데이터"""
+
+    def __init__(self, session_id: str, file_path: str, filename: str, watched: bool = False,
+                 size_bytes: int = 0, created_at: Optional[float] = None, last_access: Optional[float] = None):
+        now = time.time()
+        self.session_id = session_id
+        self.file_path = file_path
+        self.filename = filename
+        self.watched = watched
+        self.size_bytes = size_bytes
+        self.created_at = created_at if created_at is not None else now
+        self.last_access = last_access if last_access is not None else now
+
+    def to_dict(self) -> Dict:
+        return {
+            'session_id': self.session_id,
+            'filename': self.filename,
+            'watched': self.watched,
+            'size_bytes': self.size_bytes,
+            'created_at': self.created_at,
+            'last_access': self.last_access,
+        }
+
+
+class MemorySessionBackend:
+    """프로세스 내 dict 백엔드 (단일 워커 개발용)"""
+
+    def __init__(self):
+        self._records: Dict[str, SessionRecord] = {}
+        self._lock = threading.Lock()
+
+    def put(self, record: SessionRecord):
+        with self._lock:
+            self._records[record.session_id] = record
+
+    def get(self, session_id: str) -> Optional[SessionRecord]:
+        with self._lock:
+            return self._records.get(session_id)
+
+    def touch(self, session_id: str, timestamp: float):
+        with self._lock:
+            record = self._records.get(session_id)
+            if record is not None:
+                record.last_access = timestamp
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._records.pop(session_id, None) is not None
+
+    def list(self) -> List[SessionRecord]:
+        with self._lock:
+            return list(self._records.values())
+
+
+class SQLiteSessionBackend:
+    """SQLite 파일 백엔드 (같은 호스트의 여러 uvicorn/gunicorn 워커가 세션 공유)"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS sessions ('
+                ' session_id TEXT PRIMARY KEY,'
+                ' file_path TEXT NOT NULL,'
+                ' filename TEXT NOT NULL,'
+                ' watched INTEGER NOT NULL DEFAULT 0,'
+                ' size_bytes INTEGER NOT NULL DEFAULT 0,'
+                ' created_at REAL NOT NULL,'
+                ' last_access REAL NOT NULL)'
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # 스레드풀/워커 간 공유를 위해 작업마다 연결을 새로 염
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    @staticmethod
+    def _row_to_record(row) -> SessionRecord:
+        session_id, file_path, filename, watched, size_bytes, created_at, last_access = row
+        return SessionRecord(session_id, file_path, filename, bool(watched), size_bytes, created_at, last_access)
+
+    def put(self, record: SessionRecord):
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (record.session_id, record.file_path, record.filename, int(record.watched),
+                 record.size_bytes, record.created_at, record.last_access)
+            )
+
+    def get(self, session_id: str) -> Optional[SessionRecord]:
+        with self._connect() as conn:
+            row = conn.execute('SELECT * FROM sessions WHERE session_id = ?', (session_id,)).fetchone()
+        return self._row_to_record(row) if row else None
+
+    def touch(self, session_id: str, timestamp: float):
+        with self._connect() as conn:
+            conn.execute('UPDATE sessions SET last_access = ? WHERE session_id = ?', (timestamp, session_id))
+
+    def delete(self, session_id: str) -> bool:
+        with self._connect() as conn:
+            return conn.execute('DELETE FROM sessions WHERE session_id = ?', (session_id,)).rowcount > 0
+
+    def list(self) -> List[SessionRecord]:
+        with self._connect() as conn:
+            rows = conn.execute('SELECT * FROM sessions ORDER BY last_access').fetchall()
+        return [self._row_to_record(row) for row in rows]
+
+
+def _disk_usage(path: str) -> int:
+    """파일 또는 디렉터리의 디스크 사용량 (바이트)"""
+    if os.path.isdir(path):
+        total = 0
+        for root, _, files in os.walk(path):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    pass
+        return total
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _remove_path(path: str):
+    """파일 또는 디렉터리 삭제 (이미 없으면 무시)"""
+    try:
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.exists(path):
+            os.unlink(path)
+    except OSError as e:
+        print(f"Error removing {path}: {e}")
+
+
+def _file_paths(file_path: str) -> List[str]:
+    """업로드 파일과 파일 경로로 시작하는 파생 캐시 경로"""
+    return [file_path] + glob.glob(glob.escape(file_path) + '.*')
+
+
+class SessionManager:
+    """TTL/유휴 만료와 디스크 한도(LRU 제거)를 적용하는 세션 관리자
+
+    업로드 파일에서 파생된 캐시(예: "<파일 경로>.xxx")도 세션의 일부로 보고
+    용량 계산과 삭제 대상에 포함합니다.
+    """
+
+    def __init__(self, backend, storage_dir: str = DEFAULT_STORAGE_DIR, ttl: float = DEFAULT_TTL,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT, quota_bytes: int = DEFAULT_QUOTA_MB * 1024 * 1024):
+        self.backend = backend
+        self.storage_dir = storage_dir
+        self.ttl = ttl
+        self.idle_timeout = idle_timeout
+        self.quota_bytes = quota_bytes
+        self._remove_hooks: List[Callable[[str], None]] = []
+        os.makedirs(storage_dir, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> 'SessionManager':
+        """환경 변수로 세션 관리자 생성
+
+        MDF_VIEWER_SESSION_BACKEND: sqlite(기본, 워커 간 공유) 또는 memory
+        MDF_VIEWER_STORAGE_DIR: 업로드 파일/캐시/세션 DB 저장 디렉터리
+        MDF_VIEWER_SESSION_TTL, MDF_VIEWER_SESSION_IDLE: 만료 시간 (초)
+        MDF_VIEWER_DISK_QUOTA_MB: 디스크 한도 (MB)
+        """
+        storage_dir = os.environ.get('MDF_VIEWER_STORAGE_DIR', DEFAULT_STORAGE_DIR)
+        backend_name = os.environ.get('MDF_VIEWER_SESSION_BACKEND', 'sqlite').lower()
+
+        if backend_name == 'memory':
+            backend = MemorySessionBackend()
+        else:
+            backend = SQLiteSessionBackend(os.path.join(storage_dir, 'sessions.db'))
+
+        return cls(
+            backend,
+            storage_dir=storage_dir,
+            ttl=float(os.environ.get('MDF_VIEWER_SESSION_TTL', DEFAULT_TTL)),
+            idle_timeout=float(os.environ.get('MDF_VIEWER_SESSION_IDLE', DEFAULT_IDLE_TIMEOUT)),
+            quota_bytes=int(float(os.environ.get('MDF_VIEWER_DISK_QUOTA_MB', DEFAULT_QUOTA_MB)) * 1024 * 1024),
+        )
+
+    def add_remove_hook(self, hook: Callable[[str], None]):
+        """세션 삭제 시 파일 경로를 받아 프로세스 내 캐시를 정리할 콜백 등록"""
+        self._remove_hooks.append(hook)
+
+    def create(self, session_id: str, file_path: str, filename: str, watched: bool = False) -> SessionRecord:
+        """세션 등록 (감시 세션의 원본 파일은 용량 계산/삭제 대상이 아님)"""
+        size_bytes = 0 if watched else _disk_usage(file_path)
+        record = SessionRecord(session_id, file_path, filename, watched, size_bytes)
+        self.backend.put(record)
+        return record
+
+    def get_path(self, session_id: str) -> Optional[str]:
+        """세션 파일 경로 조회 (만료된 세션은 정리 후 None)"""
+        record = self.backend.get(session_id)
+        if record is None:
+            return None
+
+        now = time.time()
+        if self._is_expired(record, now):
+            self.remove(session_id)
+            return None
+
+        if now - record.last_access >= TOUCH_INTERVAL:
+            self.backend.touch(session_id, now)
+        return record.file_path
+
+    def exists(self, session_id: str) -> bool:
+        return self.get_path(session_id) is not None
+
+    def is_watched(self, session_id: str) -> bool:
+        """외부 원본 파일을 감시하는 세션인지 확인 (파생 파일을 원본 옆에 만들 수 없음)"""
+        record = self.backend.get(session_id)
+        return record is not None and record.watched
+
+    def remove(self, session_id: str) -> bool:
+        """세션과 업로드 파일, 파생 캐시 삭제"""
+        record = self.backend.get(session_id)
+        if record is None or not self.backend.delete(session_id):
+            return False
+
+        if not record.watched:
+            for path in self._session_paths(record):
+                _remove_path(path)
+
+        self._run_remove_hooks(record.file_path)
+        return True
+
+    def discard(self, file_path: str):
+        """세션으로 등록하지 못한 업로드 파일과 파생 캐시 삭제 (처리 실패 시)"""
+        for path in _file_paths(file_path):
+            _remove_path(path)
+        self._run_remove_hooks(file_path)
+
+    def _run_remove_hooks(self, file_path: str):
+        for hook in self._remove_hooks:
+            try:
+                hook(file_path)
+            except Exception as e:
+                print(f"Error running session cleanup hook: {e}")
+
+    def list(self) -> List[SessionRecord]:
+        return self.backend.list()
+
+    def count(self) -> int:
+        return len(self.backend.list())
+
+    def disk_usage(self) -> int:
+        """업로드 파일과 파생 캐시의 전체 디스크 사용량 (바이트)"""
+        return sum(self._record_usage(record) for record in self.backend.list() if not record.watched)
+
+    def cleanup(self, incoming_bytes: int = 0) -> List[str]:
+        """만료 세션을 지우고, 디스크 한도를 넘으면 오래 사용하지 않은 세션부터 제거
+
+        incoming_bytes는 곧 저장할 업로드 크기로, 그만큼의 여유 공간을 함께 확보합니다.
+        """
+        removed = []
+        now = time.time()
+        records = self.backend.list()
+
+        active = []
+        for record in records:
+            if self._is_expired(record, now):
+                if self.remove(record.session_id):
+                    removed.append(record.session_id)
+            else:
+                active.append(record)
+
+        usage = {record.session_id: self._record_usage(record) for record in active if not record.watched}
+        total = sum(usage.values()) + incoming_bytes
+
+        # LRU: 마지막 접근이 오래된 세션부터 제거
+        for record in sorted(active, key=lambda r: r.last_access):
+            if total <= self.quota_bytes:
+                break
+            if record.watched:
+                continue
+            if self.remove(record.session_id):
+                removed.append(record.session_id)
+                total -= usage[record.session_id]
+
+        return removed
+
+    def _is_expired(self, record: SessionRecord, now: float) -> bool:
+        return now - record.created_at > self.ttl or now - record.last_access > self.idle_timeout
+
+    def _session_paths(self, record: SessionRecord) -> List[str]:
+        """업로드 파일과 파일 경로로 시작하는 파생 캐시 경로"""
+        return _file_paths(record.file_path)
+
+    def _record_usage(self, record: SessionRecord) -> int:
+        return sum(_disk_usage(path) for path in self._session_paths(record))
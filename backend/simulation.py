@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+시뮬레이션 모드용 합성 측정 데이터 소스
+
+채널마다 독립된 np.random.Generator를 사용하고 블록 단위로 벡터화하여 생성하므로
+스레드/워커 간에 전역 난수 상태를 공유하지 않으며, 같은 설정이면 어느 프로세스에서든
+같은 값을 돌려줍니다. 필요한 구간만 청크로 생성하므로 임의 길이의 측정을 흉내낼 수 있어
+부하 테스트용 데이터 생성기로도 사용할 수 있습니다.
+
+사용 예 (부하 테스트용 CSV 생성):
+    python simulation.py --channels 100 --rates 1000,100 --duration 3600 --output load.csv
+    python simulation.py --channels 20 --rates 100 --live --output live.csv   # 실시간으로 행 추가
+"""
+
+import argparse
+import os
+import time
+import zlib
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from models import MDFInfo, ChannelInfo
+
+# 채널명 구성 요소 (기존 시뮬레이션 채널명과 동일)
+_PREFIXES = ['ENGINE_', 'VEHICLE_', 'BRAKE_', 'TRANSMISSION_', 'ECU_', 'SENSOR_']
+_SUFFIXES = ['TEMP', 'PRESSURE', 'SPEED', 'VOLTAGE', 'CURRENT', 'POSITION', 'ANGLE', 'TORQUE']
+_UNITS = ['°C', 'bar', 'km/h', 'V', 'A', 'mm', '°', 'Nm']
+
+# 노이즈를 생성하는 고정 블록 크기 (청크 크기와 무관하게 같은 값을 만들기 위함)
+BLOCK_SAMPLES = 65536
+
+# 기본 설정 (환경 변수 MDF_VIEWER_SIM_*로 변경 가능)
+DEFAULT_CHANNELS = 200
+DEFAULT_RATES = (100.0, 10.0, 1.0)
+DEFAULT_DURATION = 100.0
+DEFAULT_SEED = 0
+
+
+class SyntheticChannel:
+    """합성 채널 하나의 파형 파라미터"""
+
+    def __init__(self, index: int, name: str, unit: str, group: int, rate: float,
+                 frequency: float, amplitude: float, offset: float, noise: float):
+        self.index = index
+        self.name = name
+        self.unit = unit
+        self.group = group
+        self.rate = rate
+        self.frequency = frequency
+        self.amplitude = amplitude
+        self.offset = offset
+        self.noise = noise
+
+
+class SyntheticMeasurement:
+    """여러 샘플레이트 그룹을 가진 합성 측정 (요청한 구간만 지연 생성)"""
+
+    def __init__(self, channel_count: int = DEFAULT_CHANNELS, rates=DEFAULT_RATES,
+                 duration: float = DEFAULT_DURATION, seed: int = DEFAULT_SEED):
+        self.rates = [float(rate) for rate in rates]
+        self.duration = float(duration)
+        self.seed = seed
+        self.channels: List[SyntheticChannel] = [self._make_channel(i) for i in range(channel_count)]
+        self._by_name: Dict[str, SyntheticChannel] = {ch.name: ch for ch in self.channels}
+
+    @classmethod
+    def from_env(cls) -> 'SyntheticMeasurement':
+        """MDF_VIEWER_SIM_CHANNELS / _RATES / _DURATION / _SEED 환경 변수로 생성"""
+        rates = os.environ.get('MDF_VIEWER_SIM_RATES')
+        return cls(
+            channel_count=int(os.environ.get('MDF_VIEWER_SIM_CHANNELS', DEFAULT_CHANNELS)),
+            rates=[float(r) for r in rates.split(',') if r.strip()] if rates else DEFAULT_RATES,
+            duration=float(os.environ.get('MDF_VIEWER_SIM_DURATION', DEFAULT_DURATION)),
+            seed=int(os.environ.get('MDF_VIEWER_SIM_SEED', DEFAULT_SEED)),
+        )
+
+    def _make_channel(self, index: int) -> SyntheticChannel:
+        """채널 번호로 결정되는 파형 파라미터 (프로세스와 무관하게 동일)"""
+        rng = np.random.default_rng([self.seed, index])
+        group = index % len(self.rates)
+        amplitude = rng.uniform(10, 110)
+
+        return SyntheticChannel(
+            index=index,
+            name=f"{_PREFIXES[index % len(_PREFIXES)]}{_SUFFIXES[index % len(_SUFFIXES)]}_{str(index + 1).zfill(3)}",
+            unit=_UNITS[index % len(_UNITS)],
+            group=group,
+            rate=self.rates[group],
+            # 나이퀴스트 주파수의 1/10을 넘지 않도록 제한
+            frequency=rng.uniform(0.5, 2.5) * min(1.0, self.rates[group] / 50.0),
+            amplitude=amplitude,
+            offset=rng.uniform(-25, 25),
+            noise=amplitude * 0.05,
+        )
+
+    def get(self, name: str) -> SyntheticChannel:
+        """채널명으로 조회 (목록에 없는 이름도 이름 기반으로 일관된 파형 생성)"""
+        channel = self._by_name.get(name)
+        if channel is None:
+            channel = self._make_channel(zlib.crc32(name.encode('utf-8')))
+            channel.name = name
+            channel.unit = next((unit for suffix, unit in zip(_SUFFIXES, _UNITS) if suffix in name), "")
+        return channel
+
+    def sample_count(self, channel: SyntheticChannel) -> int:
+        return int(self.duration * channel.rate)
+
+    def read(self, channel: SyntheticChannel, start: int = 0, stop: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """[start, stop) 구간의 타임스탬프와 샘플 생성
+
+        stop은 측정 길이를 넘어도 되며, 라이브 테일처럼 계속 늘어나는 측정을 흉내낼 때 사용합니다.
+        """
+        stop = self.sample_count(channel) if stop is None else stop
+        if stop <= start:
+            return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+
+        indices = np.arange(start, stop, dtype=np.int64)
+        timestamps = indices / channel.rate
+        samples = channel.amplitude * np.sin(2 * np.pi * channel.frequency * timestamps) + channel.offset
+
+        # 노이즈는 고정 크기 블록마다 별도 Generator로 생성 (구간 분할과 무관하게 재현)
+        first_block = start // BLOCK_SAMPLES
+        last_block = (stop - 1) // BLOCK_SAMPLES
+        noise = np.concatenate([
+            np.random.default_rng([self.seed, channel.index, block]).normal(0.0, channel.noise, BLOCK_SAMPLES)
+            for block in range(first_block, last_block + 1)
+        ])
+        offset = start - first_block * BLOCK_SAMPLES
+        samples += noise[offset:offset + len(indices)]
+
+        return timestamps, samples
+
+    def iter_chunks(self, channel: SyntheticChannel, chunk_samples: int = 1_000_000,
+                    start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """메모리에 전체를 올리지 않고 청크 단위로 생성"""
+        stop = self.sample_count(channel) if stop is None else stop
+        for chunk_start in range(start, stop, chunk_samples):
+            yield self.read(channel, chunk_start, min(chunk_start + chunk_samples, stop))
+
+    def file_info(self, file_size: int) -> MDFInfo:
+        return MDFInfo(
+            version="4.10",
+            file_size=file_size,
+            channel_count=len(self.channels),
+            measurement_start=datetime.now(),
+            measurement_duration=self.duration,
+            measurement_comment=f"Simulated MDF file for testing ({len(self.rates)} groups: {', '.join(f'{r:g} Hz' for r in self.rates)})",
+            vehicle_identification="SIM_VEHICLE_001",
+            recorder_identification="SIM_RECORDER_001"
+        )
+
+    def channel_infos(self) -> List[ChannelInfo]:
+        """채널 목록 (값 범위는 파형 파라미터로 계산하므로 데이터를 생성하지 않음)"""
+        channels = [
+            ChannelInfo(
+                name=ch.name,
+                unit=ch.unit,
+                description=f"Simulated channel {ch.name} (group {ch.group}, {ch.rate:g} Hz)",
+                sample_count=self.sample_count(ch),
+                data_type="float64",
+                min_value=ch.offset - ch.amplitude - 3 * ch.noise,
+                max_value=ch.offset + ch.amplitude + 3 * ch.noise
+            )
+            for ch in self.channels
+        ]
+        return sorted(channels, key=lambda x: x.name)
+
+
+def write_csv(measurement: SyntheticMeasurement, path: str, group: int = 0, chunk_samples: int = 100_000,
+              live: bool = False):
+    """한 샘플레이트 그룹의 채널을 CSV로 청크 단위 기록
+
+    live가 True면 측정 시간에 맞춰 행을 계속 추가하여 /api/watch 라이브 테일 부하 테스트에 사용합니다.
+    """
+    channels = [ch for ch in measurement.channels if ch.group == group]
+    if not channels:
+        raise ValueError(f"그룹 {group}에 채널이 없습니다.")
+    rate = channels[0].rate
+
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(','.join(['time'] + [f"{ch.name} ({ch.unit})" for ch in channels]) + '\n')
+        f.flush()
+
+        if not live:
+            total = measurement.sample_count(channels[0])
+            for start in range(0, total, chunk_samples):
+                stop = min(start + chunk_samples, total)
+                _write_rows(f, measurement, channels, start, stop)
+            return
+
+        # 라이브 모드: 0.1초마다 그 사이에 생성되었어야 할 행을 추가 (Ctrl+C로 종료)
+        begin = time.monotonic()
+        written = 0
+        try:
+            while True:
+                time.sleep(0.1)
+                due = int((time.monotonic() - begin) * rate)
+                if due > written:
+                    _write_rows(f, measurement, channels, written, due)
+                    f.flush()
+                    written = due
+        except KeyboardInterrupt:
+            pass
+
+
+def _write_rows(f, measurement: SyntheticMeasurement, channels: List[SyntheticChannel], start: int, stop: int):
+    timestamps, _ = measurement.read(channels[0], start, stop)
+    columns = [timestamps] + [measurement.read(ch, start, stop)[1] for ch in channels]
+    np.savetxt(f, np.column_stack(columns), delimiter=',', fmt='%.6f')
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="MDF/CSV File Viewer 합성 데이터 생성기")
+    parser.add_argument('--channels', type=int, default=DEFAULT_CHANNELS, help="채널 수")
+    parser.add_argument('--rates', default=','.join(f"{r:g}" for r in DEFAULT_RATES), help="그룹별 샘플레이트 (Hz, 쉼표 구분)")
+    parser.add_argument('--duration', type=float, default=DEFAULT_DURATION, help="측정 시간 길이 (초)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="난수 시드")
+    parser.add_argument('--group', type=int, default=0, help="CSV로 기록할 샘플레이트 그룹 번호")
+    parser.add_argument('--live', action='store_true', help="실시간으로 행을 계속 추가 (라이브 테일 테스트)")
+    parser.add_argument('--output', required=True, help="CSV 저장 경로")
+    args = parser.parse_args()
+
+    measurement = SyntheticMeasurement(
+        channel_count=args.channels,
+        rates=[float(r) for r in args.rates.split(',') if r.strip()],
+        duration=args.duration,
+        seed=args.seed,
+    )
+
+    start = time.perf_counter()
+    write_csv(measurement, args.output, group=args.group, live=args.live)
+    print(f"✅ {args.output} ({os.path.getsize(args.output) / (1024 * 1024):.1f} MB, {time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,89 @@
 #!/usr/bin/env python3
 """
 MDF File Viewer Backend Server 시작 스크립트
+
+    python start_server.py                          # 개발 모드 (단일 프로세스, 자동 리로드)
+    python start_server.py --production --workers 4 # 프로덕션 모드 (gunicorn + uvicorn 워커)
 """
 
+import os
 import sys
+import json
+import time
+import argparse
 import subprocess
-import pkg_resources
+from importlib import metadata
 from pathlib import Path
 
-def check_dependencies():
-    """필수 의존성 체크"""
-    required_packages = [
-        'fastapi>=0.104.0',
-        'uvicorn>=0.24.0', 
-        'python-multipart>=0.0.6',
-        'pydantic>=2.5.0',
-        'numpy>=1.24.0'
-    ]
-    
+REQUIRED_PACKAGES = [
+    'fastapi>=0.104.0',
+    'uvicorn>=0.24.0',
+    'python-multipart>=0.0.6',
+    'pydantic>=2.5.0',
+    'numpy>=1.24.0'
+]
+
+# 의존성 체크 결과 캐시 (같은 인터프리터/패키지 구성이면 다시 확인하지 않음)
+DEPENDENCY_CACHE = Path(__file__).resolve().parent / '.dependency_check.json'
+
+def _environment_key():
+    """인터프리터와 site-packages 상태로 캐시 키 생성 (패키지 설치/삭제 시 바뀜)"""
+    site_dirs = [path for path in sys.path if path.endswith(('site-packages', 'dist-packages'))]
+    mtimes = {}
+    for path in site_dirs:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            pass
+    return {'executable': sys.executable, 'version': sys.version, 'required': REQUIRED_PACKAGES, 'site': mtimes}
+
+def _load_cached_check():
+    try:
+        cached = json.loads(DEPENDENCY_CACHE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    return cached if cached.get('key') == _environment_key() else None
+
+def _save_cached_check(result):
+    try:
+        DEPENDENCY_CACHE.write_text(json.dumps({'key': _environment_key(), **result}), encoding='utf-8')
+    except OSError:
+        pass
+
+def _installed_version(pkg_name):
+    try:
+        return metadata.version(pkg_name)
+    except metadata.PackageNotFoundError:
+        return None
+
+def check_dependencies(use_cache=True):
+    """필수 의존성 체크 (결과는 캐시하여 다음 시작 시 재사용)"""
+    if use_cache:
+        cached = _load_cached_check()
+        if cached is not None and not cached['missing']:
+            print(f"✅ 의존성 확인됨 (캐시, asammdf {'설치됨' if cached['asammdf'] else '누락 - 시뮬레이션 모드'})")
+            return []
+
     missing_packages = []
     
-    for package in required_packages:
-        try:
-            pkg_name = package.split('>=')[0].split('==')[0]
-            pkg_resources.get_distribution(pkg_name)
-            print(f"✅ {pkg_name} 설치됨")
-        except pkg_resources.DistributionNotFound:
+    for package in REQUIRED_PACKAGES:
+        pkg_name = package.split('>=')[0].split('==')[0]
+        version = _installed_version(pkg_name)
+        if version:
+            print(f"✅ {pkg_name} 설치됨 ({version})")
+        else:
             missing_packages.append(package)
             print(f"❌ {pkg_name} 누락")
     
     # asammdf는 선택사항이므로 별도 체크
-    try:
-        pkg_resources.get_distribution('asammdf')
+    has_asammdf = _installed_version('asammdf') is not None
+    if has_asammdf:
         print("✅ asammdf 설치됨 (실제 MDF 파일 처리 가능)")
-    except pkg_resources.DistributionNotFound:
+    else:
         print("⚠️  asammdf 누락 (시뮬레이션 모드로 동작)")
         print("   실제 MDF 파일 처리를 원하면: pip install asammdf")
-    
+
+    _save_cached_check({'missing': missing_packages, 'asammdf': has_asammdf})
     return missing_packages
 
 def install_dependencies(missing_packages):
@@ -56,19 +103,19 @@ def install_dependencies(missing_packages):
         print(f"❌ 패키지 설치 실패: {e}")
         return False
 
-def start_server():
+def start_server(host="0.0.0.0", port=8000):
     """서버 시작"""
     print("\n🚀 MDF File Viewer Backend 서버를 시작합니다...")
-    print("📍 서버 주소: http://localhost:8000")
-    print("📚 API 문서: http://localhost:8000/docs")
+    print(f"📍 서버 주소: http://localhost:{port}")
+    print(f"📚 API 문서: http://localhost:{port}/docs")
     print("🛑 서버 종료: Ctrl+C\n")
     
     try:
         import uvicorn
         uvicorn.run(
             "main:app",
-            host="0.0.0.0",
-            port=8000,
+            host=host,
+            port=port,
             reload=True,
             log_level="info"
         )
@@ -77,8 +124,61 @@ def start_server():
     except Exception as e:
         print(f"❌ 서버 시작 실패: {e}")
 
+def start_production_server(host="0.0.0.0", port=8000, workers=None):
+    """프로덕션 서버 시작 (여러 워커가 세션 저장소를 공유)
+
+    gunicorn이 있으면 uvicorn 워커로 실행하고, 없거나 Windows면 uvicorn의 멀티 프로세스 모드로 실행합니다.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    # 모든 워커가 같은 세션 DB와 업로드 디렉터리를 보도록 설정
+    if os.environ.get('MDF_VIEWER_SESSION_BACKEND', 'sqlite').lower() == 'memory' and workers > 1:
+        print("⚠️  memory 세션 백엔드는 워커 간 공유되지 않아 sqlite로 변경합니다.")
+    os.environ['MDF_VIEWER_SESSION_BACKEND'] = 'sqlite'
+    os.environ['MDF_VIEWER_WORKERS'] = str(workers)
+    os.environ['MDF_VIEWER_BIND'] = f"{host}:{port}"
+
+    print("\n🚀 MDF File Viewer Backend 서버를 프로덕션 모드로 시작합니다...")
+    print(f"📍 서버 주소: http://localhost:{port}")
+    print(f"👷 워커 수: {workers}")
+    print("🛑 서버 종료: Ctrl+C\n")
+
+    try:
+        import gunicorn  # noqa: F401
+        has_gunicorn = sys.platform != 'win32'
+    except ImportError:
+        has_gunicorn = False
+
+    try:
+        if has_gunicorn:
+            # gunicorn 프로세스로 교체 (시그널 처리를 gunicorn 마스터가 담당)
+            os.execv(sys.executable, [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'main:app'])
+
+        print("⚠️  gunicorn을 사용할 수 없어 uvicorn 멀티 워커 모드로 실행합니다.")
+        import uvicorn
+        uvicorn.run(
+            "main:app",
+            host=host,
+            port=port,
+            workers=workers,
+            log_level="info"
+        )
+    except KeyboardInterrupt:
+        print("\n✅ 서버가 종료되었습니다.")
+    except Exception as e:
+        print(f"❌ 서버 시작 실패: {e}")
+
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="MDF File Viewer Backend Server")
+    parser.add_argument('--production', action='store_true', help="gunicorn + uvicorn 워커로 실행 (자동 리로드 없음)")
+    parser.add_argument('--workers', type=int, default=None, help="프로덕션 모드 워커 수 (기본: CPU 코어 수)")
+    parser.add_argument('--host', default='0.0.0.0', help="바인드 주소")
+    parser.add_argument('--port', type=int, default=8000, help="포트")
+    parser.add_argument('--recheck', action='store_true', help="캐시를 무시하고 의존성을 다시 확인")
+    args = parser.parse_args()
+    started = time.perf_counter()
+
     print("=" * 50)
     print("🔧 MDF File Viewer Backend Server")
     print("=" * 50)
@@ -88,7 +188,6 @@ def main():
     if current_dir.name != 'backend':
         if (current_dir / 'backend').exists():
             print("📂 backend 디렉터리로 이동합니다...")
-            import os
             os.chdir('backend')
         else:
             print("❌ backend 디렉터리를 찾을 수 없습니다.")
@@ -97,7 +196,7 @@ def main():
     
     # 의존성 체크
     print("\n🔍 의존성을 확인합니다...")
-    missing_packages = check_dependencies()
+    missing_packages = check_dependencies(use_cache=not args.recheck)
     
     if missing_packages:
         response = input(f"\n❓ 누락된 패키지를 설치하시겠습니까? (y/n): ")
@@ -108,8 +207,13 @@ def main():
             print("❌ 필수 의존성이 없으면 서버를 시작할 수 없습니다.")
             return
     
+    print(f"⏱️  시작 준비 시간: {time.perf_counter() - started:.2f}s")
+
     # 서버 시작
-    start_server()
+    if args.production:
+        start_production_server(args.host, args.port, args.workers)
+    else:
+        start_server(args.host, args.port)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
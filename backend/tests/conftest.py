@@ -0,0 +1,10 @@
+import os
+import sys
+import tempfile
+
+# 백엔드 모듈은 backend/ 디렉터리 기준으로 import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 테스트 세션 파일은 임시 디렉터리에 저장하고 워밍업은 생략
+os.environ.setdefault('MDF_VIEWER_STORAGE_DIR', tempfile.mkdtemp(prefix='mdf_viewer_test_'))
+os.environ.setdefault('MDF_VIEWER_WARMUP', '0')
@@ -0,0 +1,53 @@
+import pstats
+
+from fastapi.testclient import TestClient
+
+import main
+import metrics
+
+
+def _profiled_functions(path):
+    return {name for _, _, name in pstats.Stats(path).stats}
+
+
+def test_profile_contains_threadpool_decode(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics, 'PROFILING_ENABLED', True)
+    monkeypatch.setattr(metrics, 'PROFILE_DIR', str(tmp_path / 'profiles'))
+
+    csv_path = tmp_path / 'profile.csv'
+    csv_path.write_text('time,Speed (km/h)\n' + ''.join(f'{i * 0.01},{i}\n' for i in range(100)))
+
+    with TestClient(main.app) as client:
+        with open(csv_path, 'rb') as f:
+            session_id = client.post('/api/upload', files={'file': ('profile.csv', f)}).json()['session_id']
+        try:
+            response = client.get(f'/api/channels/{session_id}?profile=1')
+            assert response.status_code == 200
+            functions = _profiled_functions(response.headers['x-profile-file'])
+            # 워커 스레드에서 실행된 카탈로그 생성과 직렬화가 프로파일에 포함되어야 함
+            assert 'build_catalog' in functions
+            assert 'channels_json' in functions
+        finally:
+            client.delete(f'/api/session/{session_id}')
+
+
+def test_concurrent_requests_get_separate_profilers(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics, 'PROFILE_DIR', str(tmp_path))
+    first = metrics._RequestProfiler('cprofile')
+    second = metrics._RequestProfiler('cprofile')
+    first.start()
+    second.start()
+
+    def decode_first():
+        return sum(range(10))
+
+    def decode_second():
+        return sum(range(20))
+
+    first.call(decode_first)
+    second.call(decode_second)
+
+    assert 'decode_first' in _profiled_functions(first.stop('first'))
+    second_functions = _profiled_functions(second.stop('second'))
+    assert 'decode_second' in second_functions
+    assert 'decode_first' not in second_functions
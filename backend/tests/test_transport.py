@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from mdf_processor import ChannelArrays
+from transport import encode_typed_channel
+
+RECORD_DTYPE = [('id', '<u4'), ('payload', '<f8')]
+
+
+def _struct_channel(count: int = 10) -> ChannelArrays:
+    timestamps = np.arange(count, dtype=np.float64) * 0.01
+    samples = np.zeros(count, dtype=RECORD_DTYPE)
+    return ChannelArrays('CAN_DataFrame', '', timestamps, samples)
+
+
+def _numeric_channel(count: int = 10) -> ChannelArrays:
+    timestamps = np.arange(count, dtype=np.float64) * 0.01
+    return ChannelArrays('Speed', 'km/h', timestamps, timestamps * 2)
+
+
+def test_struct_channel_json_is_empty():
+    data = _struct_channel().to_channel_data()
+    assert data.values == []
+    assert data.timestamps == []
+
+
+def test_struct_channel_typed_is_empty():
+    data = encode_typed_channel(_struct_channel())
+    assert data.length == 0
+
+
+def test_data_endpoint_serves_numeric_channel_next_to_struct_channel(tmp_path):
+    asammdf = pytest.importorskip('asammdf')
+    from fastapi.testclient import TestClient
+    import main
+
+    timestamps = np.arange(10, dtype=np.float64) * 0.01
+    mdf = asammdf.MDF(version='4.10')
+    mdf.append([
+        asammdf.Signal(timestamps * 2, timestamps, name='Speed', unit='km/h'),
+        asammdf.Signal(np.zeros(10, dtype=RECORD_DTYPE), timestamps, name='Frame'),
+    ])
+    path = mdf.save(tmp_path / 'struct.mf4', overwrite=True)
+    mdf.close()
+
+    with TestClient(main.app) as client:
+        with open(path, 'rb') as f:
+            session_id = client.post('/api/upload', files={'file': ('struct.mf4', f)}).json()['session_id']
+        try:
+            for transport in ('json', 'typed'):
+                response = client.post(f'/api/data/{session_id}?transport={transport}', json=['Speed', 'Frame'])
+                assert response.status_code == 200
+                speed, frame = response.json()['data']
+                assert speed['name'] == 'Speed'
+                assert len(speed['values']) > 0
+                assert frame['name'] == 'Frame'
+                assert len(frame['values']) == 0
+        finally:
+            client.delete(f'/api/session/{session_id}')
+
+
+@pytest.fixture
+def csv_session(tmp_path):
+    from fastapi.testclient import TestClient
+    import main
+
+    csv_path = tmp_path / 'params.csv'
+    csv_path.write_text('time,Speed (km/h)\n' + ''.join(f'{i * 0.01},{i}\n' for i in range(10)))
+
+    with TestClient(main.app) as client:
+        with open(csv_path, 'rb') as f:
+            session_id = client.post('/api/upload', files={'file': ('params.csv', f)}).json()['session_id']
+        try:
+            yield client, session_id
+        finally:
+            client.delete(f'/api/session/{session_id}')
+
+
+def test_data_endpoint_rejects_unknown_transport(csv_session):
+    client, session_id = csv_session
+    response = client.post(f'/api/data/{session_id}?transport=bogus', json=['Speed'])
+    assert response.status_code == 400
+
+
+def test_data_endpoint_rejects_non_positive_time_tick(csv_session):
+    client, session_id = csv_session
+    response = client.post(f'/api/data/{session_id}?transport=typed&time_tick=0', json=['Speed'])
+    assert response.status_code == 400
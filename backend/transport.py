@@ -0,0 +1,105 @@
+import base64
+from typing import Optional
+
+import numpy as np
+
+from metrics import span
+from mdf_processor import ChannelArrays, detect_raster
+from models import TimeRaster, TypedChannelData
+
+# 차분 인코딩에 사용할 정수 dtype (작은 것부터)
+_DELTA_DTYPES = [np.uint8, np.uint16, np.uint32]
+
+# 차분 인코딩 기본 시간 분해능 (초)
+DEFAULT_TIME_TICK = 1e-6
+
+
+def _encode_array(array: np.ndarray) -> str:
+    """배열을 little-endian 바이트로 만들어 base64 인코딩"""
+    little_endian = array.astype(array.dtype.newbyteorder('<'), copy=False)
+    return base64.b64encode(np.ascontiguousarray(little_endian).tobytes()).decode('ascii')
+
+
+def _native_samples(arrays: ChannelArrays) -> ChannelArrays:
+    """샘플 배열을 원본 dtype에 가깝게 전송 가능한 형태로 정리
+
+    숫자로 변환할 수 없는 채널(구조체/바이트/다차원)은 JSON 경로와 같이 빈 채널로 보냅니다.
+    """
+    samples = arrays.numeric_samples()
+    if samples is None:
+        return ChannelArrays.empty(arrays.name, arrays.unit)
+    if samples.dtype.kind == 'b':
+        samples = samples.astype(np.uint8)
+    return ChannelArrays(arrays.name, arrays.unit, arrays.timestamps, samples, arrays.has_time_axis)
+
+
+def _encode_delta(timestamps: np.ndarray, time_tick: float) -> Optional[tuple]:
+    """단조 증가 타임스탬프를 정수 차분 배열로 인코딩 (불가능하면 None)"""
+    ticks = np.rint((timestamps - timestamps[0]) / time_tick)
+    deltas = np.diff(ticks, prepend=0.0)
+    if len(deltas) == 0 or deltas.min() < 0:
+        return None
+
+    max_delta = deltas.max()
+    for dtype in _DELTA_DTYPES:
+        if max_delta <= np.iinfo(dtype).max:
+            return deltas.astype(dtype), np.dtype(dtype).name
+    return None
+
+
+def encode_typed_channel(arrays: ChannelArrays, delta_timestamps: bool = True,
+                         time_tick: float = DEFAULT_TIME_TICK) -> TypedChannelData:
+    """ChannelArrays를 dtype 유지 전송 모델로 인코딩
+
+    delta_timestamps가 True면 등간격 신호는 (t0, dt, count)만, 그 외 단조 증가
+    신호는 time_tick 단위 정수 차분으로 보냅니다 (오차는 최대 time_tick / 2).
+    """
+    with span('conversion'):
+        return _encode_typed_channel(arrays, delta_timestamps, time_tick)
+
+
+def _encode_typed_channel(arrays: ChannelArrays, delta_timestamps: bool, time_tick: float) -> TypedChannelData:
+    arrays = _native_samples(arrays)
+    samples = arrays.samples
+    timestamps = np.asarray(arrays.timestamps, dtype=np.float64)
+    length = min(len(samples), len(timestamps))
+    samples = samples[:length]
+    timestamps = timestamps[:length]
+
+    encoded = {
+        'name': arrays.name,
+        'unit': arrays.unit,
+        'dtype': samples.dtype.name,
+        'length': length,
+        'values': _encode_array(samples),
+        'sample_rate': arrays.sample_rate,
+    }
+
+    if delta_timestamps and length > 0:
+        raster = detect_raster(timestamps)
+        if raster is not None:
+            t0, dt = raster
+            return TypedChannelData(
+                timestamp_encoding='raster',
+                raster=TimeRaster(t0=t0, dt=dt, count=length),
+                **encoded
+            )
+
+        delta = _encode_delta(timestamps, time_tick)
+        if delta is not None:
+            deltas, delta_dtype = delta
+            return TypedChannelData(
+                timestamp_encoding='delta',
+                timestamps_dtype=delta_dtype,
+                timestamps=_encode_array(deltas),
+                t0=float(timestamps[0]),
+                time_tick=time_tick,
+                **encoded
+            )
+
+    return TypedChannelData(
+        timestamp_encoding='raw',
+        timestamps_dtype='float64',
+        timestamps=_encode_array(timestamps),
+        **encoded
+    )
@@ -9,6 +9,7 @@ class MDFViewerBackend {
         this.channelsPerPage = 44; // 2열 × 22행
         this.filteredChannels = [];
         this.sessionId = null;
+        this.liveSession = false; // 서버 로컬 파일을 실시간 감시 중인 세션 여부
         this.apiBaseUrl = 'http://localhost:8000/api';
         
         this.initializeEventListeners();
@@ -89,6 +90,7 @@ class MDFViewerBackend {
 
             const uploadData = await uploadResponse.json();
             this.sessionId = uploadData.session_id;
+            this.liveSession = false;
             this.currentFile = file;
 
             // UI 업데이트: 파일 선택 영역 숨기고 파일 정보 표시
@@ -107,6 +109,42 @@ class MDFViewerBackend {
         }
     }
 
+    async watchFile(filePath) {
+        try {
+            this.showMessage('서버 파일 감시를 시작하는 중입니다...', 'loading');
+
+            const response = await fetch(`${this.apiBaseUrl}/watch`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({ file_path: filePath })
+            });
+
+            if (!response.ok) {
+                const errorData = await response.json();
+                throw new Error(errorData.detail || '파일 감시 등록에 실패했습니다.');
+            }
+
+            const watchData = await response.json();
+            this.sessionId = watchData.session_id;
+            this.liveSession = true;
+
+            this.showFileInfo({ name: watchData.filename, size: watchData.file_info.file_size }, watchData.file_info);
+            document.getElementById('filePath').textContent = filePath;
+
+            await this.loadChannels();
+
+            this.showMessage(`파일 "${watchData.filename}"을 실시간으로 감시합니다.`, 'success');
+            document.getElementById('chartTypeSection').classList.remove('hidden');
+            document.getElementById('mainControls').classList.remove('hidden');
+
+        } catch (error) {
+            this.showMessage(`오류: ${error.message}`, 'error');
+            console.error('File watch error:', error);
+        }
+    }
+
     async loadChannels() {
         try {
             const response = await fetch(`${this.apiBaseUrl}/channels/${this.sessionId}`);
@@ -309,7 +347,14 @@ class MDFViewerBackend {
             }
 
             const data = await response.json();
-            return data.data; // 채널 데이터 배열 반환
+            // 등간격 채널(raster: t0, dt, count)은 타임스탬프를 펼쳐서 반환
+            return data.data.map(channel => {
+                if (channel.raster) {
+                    const { t0, dt, count } = channel.raster;
+                    channel.timestamps = Array.from({ length: count }, (_, i) => t0 + i * dt);
+                }
+                return channel;
+            }); // 채널 데이터 배열 반환
             
         } catch (error) {
             console.error('Error getting channel data:', error);
@@ -356,7 +401,8 @@ class MDFViewerBackend {
         const params = new URLSearchParams({
             sessionId: this.sessionId,
             channels: JSON.stringify(selectedChannels),
-            chartType: chartType
+            chartType: chartType,
+            live: this.liveSession ? '1' : '0'
         });
 
         // 팝업 창 열기
@@ -385,6 +431,7 @@ function selectNewFile() {
     
     // 상태 초기화
     viewer.sessionId = null;
+    viewer.liveSession = false;
     viewer.currentFile = null;
     viewer.channels = [];
     viewer.selectedChannels.clear();
@@ -402,6 +449,22 @@ function selectNewFile() {
     document.getElementById('fileInput').value = '';
 }
 
+// 서버 로컬 파일 실시간 감시 함수 (로거가 기록 중인 파일)
+function watchServerFile() {
+    const viewer = window.mdfViewer;
+    const filePath = document.getElementById('watchPathInput').value.trim();
+
+    if (!filePath) {
+        viewer.showMessage('감시할 서버 파일 경로를 입력하세요.', 'error');
+        return;
+    }
+
+    if (viewer.sessionId) {
+        viewer.cleanupSession();
+    }
+    viewer.watchFile(filePath);
+}
+
 // 차트 업데이트 함수 - 팝업 창으로 표시
 function updateChart() {
     const viewer = window.mdfViewer;
@@ -443,11 +506,25 @@ function resetChannelSelection() {
 
 // CSV 내보내기 함수
 async function exportToCSV() {
+    await exportChannels('csv');
+}
+
+// 내보내기 형식별 표시 이름과 기본 확장자
+const EXPORT_FORMATS = {
+    csv: { label: 'CSV', extension: 'csv' },
+    parquet: { label: 'Parquet', extension: 'parquet' },
+    hdf5: { label: 'HDF5', extension: 'h5' },
+    mf4: { label: 'MF4', extension: 'mf4' }
+};
+
+// 선택된 채널을 지정한 형식(csv, parquet, hdf5, mf4)으로 내보내기
+async function exportChannels(format) {
     const viewer = window.mdfViewer;
     const selectedChannels = Array.from(viewer.selectedChannels);
+    const { label, extension } = EXPORT_FORMATS[format];
     
     if (selectedChannels.length === 0) {
-        viewer.showMessage('CSV로 내보낼 채널을 최소 하나 선택하세요.', 'error');
+        viewer.showMessage(`${label}로 내보낼 채널을 최소 하나 선택하세요.`, 'error');
         return;
     }
 
@@ -462,9 +539,9 @@ async function exportToCSV() {
     }
 
     try {
-        viewer.showMessage('CSV 파일을 생성하고 있습니다...', 'loading');
+        viewer.showMessage(`${label} 파일을 생성하고 있습니다...`, 'loading');
         
-        const response = await fetch(`${viewer.apiBaseUrl}/export/csv/${viewer.sessionId}`, {
+        const response = await fetch(`${viewer.apiBaseUrl}/export/${format}/${viewer.sessionId}`, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -474,7 +551,7 @@ async function exportToCSV() {
 
         if (!response.ok) {
             const errorData = await response.json();
-            throw new Error(errorData.detail || 'CSV 내보내기에 실패했습니다.');
+            throw new Error(errorData.detail || `${label} 내보내기에 실패했습니다.`);
         }
 
         // 파일 다운로드 처리
@@ -486,7 +563,7 @@ async function exportToCSV() {
         
         // Content-Disposition 헤더에서 파일명 추출
         const contentDisposition = response.headers.get('Content-Disposition');
-        let filename = 'mdf_export.csv';
+        let filename = `mdf_export.${extension}`;
         if (contentDisposition) {
             const filenameMatch = contentDisposition.match(/filename=([^;]+)/);
             if (filenameMatch) {
@@ -500,11 +577,61 @@ async function exportToCSV() {
         window.URL.revokeObjectURL(url);
         document.body.removeChild(a);
         
-        viewer.showMessage(`${selectedChannels.length}개 채널의 데이터가 CSV로 내보내기 완료되었습니다.`, 'success');
+        viewer.showMessage(`${selectedChannels.length}개 채널의 데이터가 ${label}로 내보내기 완료되었습니다.`, 'success');
         
     } catch (error) {
-        viewer.showMessage(`CSV 내보내기 오류: ${error.message}`, 'error');
-        console.error('CSV export error:', error);
+        viewer.showMessage(`${label} 내보내기 오류: ${error.message}`, 'error');
+        console.error(`${label} export error:`, error);
+    }
+}
+
+// MF4의 CAN/LIN 원시 프레임을 선택한 데이터베이스로 디코딩하여 채널 목록에 추가
+// (.ldf는 LIN, .dbc/.arxml은 CAN 데이터베이스)
+async function decodeBusLogging(input) {
+    const viewer = window.mdfViewer;
+    const databases = Array.from(input.files);
+    input.value = '';
+
+    if (databases.length === 0) {
+        return;
+    }
+
+    const busTypes = new Set(databases.map(database => database.name.toLowerCase().endsWith('.ldf') ? 'LIN' : 'CAN'));
+    if (busTypes.size > 1) {
+        viewer.showMessage('CAN(.dbc, .arxml)과 LIN(.ldf) 데이터베이스는 따로 디코딩하세요.', 'error');
+        return;
+    }
+    const [busType] = busTypes;
+
+    if (!viewer.sessionId) {
+        viewer.showMessage('먼저 MDF 파일을 업로드하세요.', 'error');
+        return;
+    }
+
+    try {
+        viewer.showMessage('버스 로깅 프레임을 디코딩하고 있습니다...', 'loading');
+
+        const formData = new FormData();
+        databases.forEach(database => formData.append('databases', database));
+        formData.append('bus_type', busType);
+
+        const response = await fetch(`${viewer.apiBaseUrl}/bus/decode/${viewer.sessionId}`, {
+            method: 'POST',
+            body: formData
+        });
+
+        if (!response.ok) {
+            const errorData = await response.json();
+            throw new Error(errorData.detail || '버스 로깅 디코딩에 실패했습니다.');
+        }
+
+        const result = await response.json();
+        await viewer.loadChannels();
+        viewer.showMessage(result.message, 'success');
+
+    } catch (error) {
+        viewer.showMessage(`버스 로깅 디코딩 오류: ${error.message}`, 'error');
+        console.error('Bus decoding error:', error);
     }
 }
 